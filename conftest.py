@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration for the repository-level tests.
+"""
+
+import sys
+from pathlib import Path
+
+# Make the k8s-reporter package and its shared test fixtures importable
+# without installing it
+sys.path.insert(0, str(Path(__file__).parent / 'k8s-reporter' / 'src'))
+sys.path.insert(0, str(Path(__file__).parent / 'k8s-reporter' / 'tests'))
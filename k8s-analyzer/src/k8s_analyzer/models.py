@@ -2,10 +2,12 @@
 Kubernetes resource data models and relationships.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Union
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 
 from pydantic import BaseModel, Field
 
@@ -160,6 +162,10 @@ class ClusterState(BaseModel):
         """Add a resource to the cluster state."""
         self.resources.append(resource)
     
+    def add_resources(self, resources: Iterable[KubernetesResource]) -> None:
+        """Add resources from an iterable, consuming it lazily."""
+        self.resources.extend(resources)
+    
     def get_resources_by_kind(self, kind: str) -> List[KubernetesResource]:
         """Get all resources of a specific kind."""
         return [res for res in self.resources if res.kind == kind]
@@ -173,34 +179,27 @@ class ClusterState(BaseModel):
     
     def get_namespaces(self) -> Set[str]:
         """Get all unique namespaces in the cluster."""
-        namespaces = set()
-        for resource in self.resources:
-            if resource.metadata.namespace:
-                namespaces.add(resource.metadata.namespace)
-        return namespaces
+        return {ns for ns in map(attrgetter("metadata.namespace"), self.resources) if ns}
     
     def generate_summary(self) -> Dict[str, Any]:
         """Generate cluster analysis summary."""
-        resource_counts = {}
-        namespace_counts = {}
-        status_counts = {status.value: 0 for status in ResourceStatus}
+        resources = self.resources
         
-        for resource in self.resources:
-            # Count by kind
-            resource_counts[resource.kind] = resource_counts.get(resource.kind, 0) + 1
-            
-            # Count by namespace
-            ns = resource.metadata.namespace or "cluster-scoped"
-            namespace_counts[ns] = namespace_counts.get(ns, 0) + 1
-            
-            # Count by status
-            status_counts[resource.health_status.value] += 1
+        # Count one attribute column at a time rather than per-resource dict updates
+        resource_counts = Counter(map(attrgetter("kind"), resources))
+        namespace_counts = Counter(
+            ns or "cluster-scoped"
+            for ns in map(attrgetter("metadata.namespace"), resources)
+        )
+        status_counts = {status.value: 0 for status in ResourceStatus}
+        for status, count in Counter(map(attrgetter("health_status"), resources)).items():
+            status_counts[status.value] = count
         
         self.summary = {
-            "total_resources": len(self.resources),
+            "total_resources": len(resources),
             "total_relationships": len(self.relationships),
-            "resource_types": resource_counts,
-            "namespaces": namespace_counts,
+            "resource_types": dict(resource_counts),
+            "namespaces": dict(namespace_counts),
             "health_status": status_counts,
             "analysis_timestamp": self.analysis_timestamp.isoformat(),
         }
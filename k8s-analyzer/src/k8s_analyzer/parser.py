@@ -4,14 +4,18 @@ Kubernetes resource parser for JSON/YAML exports.
 
 import json
 import logging
+import os
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-import glob
-import os
+from types import ModuleType
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 
-import yaml
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from .models import (
     ClusterState,
@@ -26,25 +30,78 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Number of threads used to read files ahead of the parser
+READ_AHEAD_WORKERS = 8
+
+# Default glob patterns for Kubernetes export files
+DEFAULT_FILE_PATTERNS = (
+    "*.yaml",
+    "*.yml",
+    "*.json",
+    "*-export.yaml",
+    "*-export.yml",
+    "*-export.json",
+    "kubectl-*.yaml",
+    "kubectl-*.yml",
+    "kubectl-*.json",
+)
+
+# Bytes inspected to guess the format of files without a known suffix
+JSON_PEEK_BYTES = 256
+
+_yaml: Optional[ModuleType] = None
+
+
+def _get_yaml() -> ModuleType:
+    """Import PyYAML on first use so JSON-only parsing never loads it."""
+    global _yaml
+    if _yaml is None:
+        import yaml
+
+        _yaml = yaml
+    return _yaml
+
 
 class ResourceParser:
     """Parser for Kubernetes resource exports."""
     
-    SUPPORTED_KINDS = {
-        "Pod",
-        "Service", 
-        "ConfigMap",
-        "Node",
-        "Namespace",
-        "PersistentVolume",
-        "PersistentVolumeClaim",
-        "RoleBinding",
-        "Ingress",
-        "ServiceAccount",
+    SUPPORTED_KINDS = frozenset(
+        sys.intern(kind)
+        for kind in (
+            "Pod",
+            "Service",
+            "ConfigMap",
+            "Node",
+            "Namespace",
+            "PersistentVolume",
+            "PersistentVolumeClaim",
+            "RoleBinding",
+            "Ingress",
+            "ServiceAccount",
+        )
+    )
+    
+    # Typed models for kinds that need them; other kinds use the base model
+    RESOURCE_CLASSES: Dict[str, type] = {
+        "Pod": Pod,
+        "Service": Service,
+        "ConfigMap": ConfigMap,
+        "Node": Node,
+        "PersistentVolumeClaim": PersistentVolumeClaim,
     }
     
-    def __init__(self) -> None:
-        """Initialize the resource parser."""
+    def __init__(self, validate: bool = True) -> None:
+        """
+        Initialize the resource parser.
+        
+        Args:
+            validate: Run full pydantic validation on every resource. Pass
+                False only for trusted kubectl output: models are then built
+                with ``model_construct``, which accepts malformed fields.
+        """
+        self.validate = validate
         self.parsed_count = 0
         self.error_count = 0
         self.skipped_count = 0
@@ -59,15 +116,23 @@ class ResourceParser:
         
         logger.info(f"Parsing file: {file_path}")
         
-        # Determine file format
-        content = file_path.read_text(encoding="utf-8")
+        # Read raw bytes; both json and yaml detect the encoding themselves
+        return self._parse_content(file_path.read_bytes(), file_path.suffix)
+    
+    def _parse_content(self, content: bytes, suffix: str) -> ClusterState:
+        """Parse file content, choosing the format from the file suffix."""
+        suffix = suffix.lower()
         
-        if file_path.suffix.lower() in {".json"}:
+        if suffix == ".json":
             return self._parse_json_content(content)
-        elif file_path.suffix.lower() in {".yaml", ".yml"}:
+        elif suffix in {".yaml", ".yml"}:
             return self._parse_yaml_content(content)
         else:
-            # Try to detect format from content
+            # Peek at the first significant byte before committing to a full
+            # JSON decode; anything that cannot start a JSON document is YAML
+            head = content[:JSON_PEEK_BYTES].lstrip(b"\xef\xbb\xbf \t\r\n")
+            if head[:1] not in (b"{", b"["):
+                return self._parse_yaml_content(content)
             try:
                 return self._parse_json_content(content)
             except json.JSONDecodeError:
@@ -79,10 +144,10 @@ class ResourceParser:
         total_files = len(file_paths)
         
         # We'll use a single parser instance to accumulate all stats
-        for i, file_path in enumerate(file_paths, 1):
+        for i, (file_path, content) in enumerate(_read_ahead(file_paths), 1):
             try:
-                logger.info(f"Processing file {i}/{total_files}: {Path(file_path).name}")
-                file_cluster_state = self.parse_file(file_path)
+                logger.info(f"Processing file {i}/{total_files}: {file_path.name}")
+                file_cluster_state = self._parse_content(content.result(), file_path.suffix)
                 
                 # Merge resources
                 cluster_state.resources.extend(file_cluster_state.resources)
@@ -102,7 +167,7 @@ class ResourceParser:
         cluster_state.generate_summary()
         return cluster_state
     
-    def _parse_json_content(self, content: str) -> ClusterState:
+    def _parse_json_content(self, content: Union[str, bytes]) -> ClusterState:
         """Parse JSON content."""
         try:
             data = json.loads(content)
@@ -111,59 +176,70 @@ class ResourceParser:
             logger.error(f"Invalid JSON content: {e}")
             raise
     
-    def _parse_yaml_content(self, content: str) -> ClusterState:
+    def _parse_yaml_content(self, content: Union[str, bytes]) -> ClusterState:
         """Parse YAML content."""
+        yaml = _get_yaml()
+        cluster_state = ClusterState()
+        counters = (
+            self.parsed_count, self.error_count, self.skipped_count, self.skipped_kinds.copy()
+        )
+        
         try:
-            # Handle multi-document YAML
-            documents = list(yaml.safe_load_all(content))
-            
-            if len(documents) == 1 and isinstance(documents[0], dict):
-                # Single document - might be kubectl export
-                return self._parse_kubectl_export(documents[0])
-            else:
-                # Multiple documents - parse each as individual resource
-                return self._parse_multiple_resources(documents)
-                
+            # Stream multi-document YAML one document at a time, preferring
+            # the libyaml-backed loader when PyYAML was built with it
+            documents = yaml.load_all(
+                content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            )
+            cluster_state.add_resources(self._iter_documents(documents))
         except yaml.YAMLError as e:
             logger.error(f"Invalid YAML content: {e}")
+            # The whole file is discarded, so documents read before the
+            # error are uncounted too
+            (
+                self.parsed_count, self.error_count, self.skipped_count, self.skipped_kinds
+            ) = counters
             raise
+        
+        cluster_state.generate_summary()
+        return cluster_state
     
     def _parse_kubectl_export(self, data: Dict[str, Any]) -> ClusterState:
         """Parse kubectl get all -o json/yaml export format."""
         cluster_state = ClusterState()
+        cluster_state.add_resources(self._parse_document(data))
+        cluster_state.generate_summary()
+        return cluster_state
+    
+    def _iter_documents(
+        self, documents: Iterable[Optional[Dict[str, Any]]]
+    ) -> Iterator[KubernetesResource]:
+        """Yield parsed resources from a stream of documents."""
+        for doc in documents:
+            if doc is None:
+                continue
+            yield from self._parse_document(doc)
+    
+    def _parse_document(self, data: Dict[str, Any]) -> List[KubernetesResource]:
+        """Parse a single document, expanding kubectl List exports."""
+        if not isinstance(data, dict):
+            logger.error(f"Expected a mapping document, got {type(data).__name__}")
+            self.error_count += 1
+            return []
         
         # Check if this is a List type (kubectl export format)
         if data.get("kind") == "List" and "items" in data:
             items = data["items"]
             logger.info(f"Found {len(items)} items in kubectl export")
-            
-            for item in items:
-                resource = self._parse_single_resource(item)
-                if resource:
-                    cluster_state.add_resource(resource)
         else:
             # Single resource
-            resource = self._parse_single_resource(data)
-            if resource:
-                cluster_state.add_resource(resource)
+            items = [data]
         
-        cluster_state.generate_summary()
-        return cluster_state
-    
-    def _parse_multiple_resources(self, documents: List[Dict[str, Any]]) -> ClusterState:
-        """Parse multiple individual resources."""
-        cluster_state = ClusterState()
-        
-        for doc in documents:
-            if doc is None:
-                continue
-                
-            resource = self._parse_single_resource(doc)
-            if resource:
-                cluster_state.add_resource(resource)
-        
-        cluster_state.generate_summary()
-        return cluster_state
+        # A comprehension sizes the result in C rather than growing it per append
+        return [
+            resource
+            for resource in map(self._parse_single_resource, items)
+            if resource
+        ]
     
     def _parse_single_resource(self, data: Dict[str, Any]) -> Optional[KubernetesResource]:
         """Parse a single Kubernetes resource."""
@@ -175,6 +251,7 @@ class ResourceParser:
                 self.skipped_count += 1
                 return None
             
+            kind = sys.intern(kind)
             if kind not in self.SUPPORTED_KINDS:
                 logger.debug(f"Unsupported resource kind: {kind}, skipping")
                 self.skipped_count += 1
@@ -189,11 +266,12 @@ class ResourceParser:
             # Create appropriate resource type
             resource_class = self._get_resource_class(kind)
             
-            resource = resource_class(
+            resource = self._build_model(
+                resource_class,
                 api_version=data.get("apiVersion", "v1"),
                 kind=kind,
                 metadata=metadata,
-                spec=data.get("spec", {}),
+                spec=data.get("spec") or {},
                 status=data.get("status"),
             )
             
@@ -212,50 +290,46 @@ class ResourceParser:
     
     def _parse_metadata(self, metadata_data: Dict[str, Any]) -> ResourceMetadata:
         """Parse resource metadata."""
-        # Parse timestamps
-        creation_timestamp = None
-        deletion_timestamp = None
-        
-        if "creationTimestamp" in metadata_data:
-            creation_timestamp = self._parse_timestamp(metadata_data["creationTimestamp"])
-        
-        if "deletionTimestamp" in metadata_data:
-            deletion_timestamp = self._parse_timestamp(metadata_data["deletionTimestamp"])
+        get = metadata_data.get
         
-        return ResourceMetadata(
-            name=metadata_data.get("name", ""),
-            namespace=metadata_data.get("namespace"),
-            uid=metadata_data.get("uid"),
-            resource_version=metadata_data.get("resourceVersion"),
-            generation=metadata_data.get("generation"),
-            creation_timestamp=creation_timestamp,
-            deletion_timestamp=deletion_timestamp,
-            labels=metadata_data.get("labels", {}),
-            annotations=metadata_data.get("annotations", {}),
-            owner_references=metadata_data.get("ownerReferences", []),
-            finalizers=metadata_data.get("finalizers", []),
+        return self._build_model(
+            ResourceMetadata,
+            name=get("name", ""),
+            namespace=get("namespace"),
+            uid=get("uid"),
+            resource_version=get("resourceVersion"),
+            generation=get("generation"),
+            creation_timestamp=self._parse_timestamp(get("creationTimestamp")),
+            deletion_timestamp=self._parse_timestamp(get("deletionTimestamp")),
+            labels=get("labels") or {},
+            annotations=get("annotations") or {},
+            owner_references=get("ownerReferences") or [],
+            finalizers=get("finalizers") or [],
         )
     
-    def _parse_timestamp(self, timestamp_str: str) -> Optional[datetime]:
+    def _parse_timestamp(self, timestamp_str: Any) -> Optional[datetime]:
         """Parse Kubernetes timestamp string."""
+        if timestamp_str is None:
+            return None
+        if isinstance(timestamp_str, datetime):
+            # YAML loaders already decode unquoted timestamps
+            return timestamp_str
         try:
-            # Kubernetes uses RFC3339 format
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
+            # Kubernetes uses RFC3339 format, which fromisoformat accepts natively
+            return datetime.fromisoformat(timestamp_str)
+        except (ValueError, TypeError):
             logger.warning(f"Failed to parse timestamp: {timestamp_str}")
             return None
     
+    def _build_model(self, model: Type[ModelT], **fields: Any) -> ModelT:
+        """Build a model, skipping validation unless it was requested."""
+        if self.validate:
+            return model(**fields)
+        return model.model_construct(**fields)
+    
     def _get_resource_class(self, kind: str) -> type:
         """Get the appropriate resource class for a kind."""
-        class_mapping = {
-            "Pod": Pod,
-            "Service": Service,
-            "ConfigMap": ConfigMap,
-            "Node": Node,
-            "PersistentVolumeClaim": PersistentVolumeClaim,
-        }
-        
-        return class_mapping.get(kind, KubernetesResource)
+        return self.RESOURCE_CLASSES.get(kind, KubernetesResource)
     
     def get_parse_stats(self) -> Dict[str, Any]:
         """Get parsing statistics."""
@@ -268,6 +342,28 @@ class ResourceParser:
         }
 
 
+def _read_ahead(
+    file_paths: Iterable[Union[str, Path]]
+) -> Iterator[Tuple[Path, "Future[bytes]"]]:
+    """
+    Yield each path with a future for its contents, reading ahead on a thread pool.
+    
+    Only a bounded window of reads is in flight, so file latency overlaps with
+    parsing without holding every file in memory at once.
+    """
+    paths = (Path(file_path) for file_path in file_paths)
+    
+    with ThreadPoolExecutor(max_workers=READ_AHEAD_WORKERS) as executor:
+        pending: Deque[Tuple[Path, "Future[bytes]"]] = deque(
+            (path, executor.submit(path.read_bytes))
+            for path in islice(paths, READ_AHEAD_WORKERS * 2)
+        )
+        while pending:
+            for path in islice(paths, 1):
+                pending.append((path, executor.submit(path.read_bytes)))
+            yield pending.popleft()
+
+
 def find_kubernetes_files(
     path: Union[str, Path],
     patterns: Optional[List[str]] = None,
@@ -297,35 +393,48 @@ def find_kubernetes_files(
     
     # Default patterns for Kubernetes files
     if not patterns:
-        patterns = [
-            "*.yaml",
-            "*.yml", 
-            "*.json",
-            "*-export.yaml",
-            "*-export.yml",
-            "*-export.json",
-            "kubectl-*.yaml",
-            "kubectl-*.yml",
-            "kubectl-*.json",
-        ]
+        patterns = DEFAULT_FILE_PATTERNS
+    
+    unique_files = _glob_kubernetes_files(
+        path, tuple(patterns), recursive, _directory_signature(path, recursive)
+    )
     
+    logger.info(f"Found {len(unique_files)} Kubernetes files in {path}")
+    return list(unique_files)
+
+
+def _directory_signature(path: Path, recursive: bool) -> Tuple[int, ...]:
+    """
+    Get modification times of the directories a search would visit.
+    
+    A directory's mtime changes whenever an entry is added, removed or renamed
+    in it, so an unchanged signature means an unchanged glob result.
+    """
+    if not recursive:
+        return (path.stat().st_mtime_ns,)
+    return tuple(os.stat(root).st_mtime_ns for root, _dirs, _files in os.walk(path))
+
+
+@lru_cache(maxsize=64)
+def _glob_kubernetes_files(
+    path: Path,
+    patterns: Tuple[str, ...],
+    recursive: bool,
+    signature: Tuple[int, ...],
+) -> Tuple[Path, ...]:
+    """Glob files matching patterns, memoized on the directory signature."""
     found_files = []
     
     for pattern in patterns:
         if recursive:
             # Use ** for recursive search
-            search_pattern = path / "**" / pattern
             found_files.extend(path.glob(f"**/{pattern}"))
         else:
             # Search only in the current directory
             found_files.extend(path.glob(pattern))
     
     # Remove duplicates and sort
-    unique_files = list(set(found_files))
-    unique_files.sort()
-    
-    logger.info(f"Found {len(unique_files)} Kubernetes files in {path}")
-    return unique_files
+    return tuple(sorted(set(found_files)))
 
 
 def discover_and_parse(
@@ -5,6 +5,7 @@ This module provides functionality to export parsed Kubernetes resources,
 relationships, and health information to an SQLite database for analysis.
 """
 
+import csv
 import json
 import logging
 import sqlite3
@@ -12,6 +13,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 from .models import ClusterState, KubernetesResource, ResourceRelationship, RelationshipType, ResourceStatus
 
 # Register datetime adapters for SQLite to avoid deprecation warnings
@@ -20,17 +26,161 @@ sqlite3.register_converter("timestamp", lambda b: datetime.fromisoformat(b.decod
 
 logger = logging.getLogger(__name__)
 
+# Connection tuning applied on every connect: WAL journaling with NORMAL sync
+# keeps the database consistent across crashes while avoiding an fsync per commit
+SAFE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+"""
+
+# Bulk-load tuning for throwaway databases: no fsyncs and an in-memory journal,
+# so a crash mid-export can corrupt the file
+UNSAFE_PRAGMAS = """
+    PRAGMA journal_mode=MEMORY;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+"""
+
+# Statement text is kept in module constants so every export passes the same
+# string to sqlite3, whose per-connection statement cache is keyed on it
+_RESOURCE_COLUMNS = """
+    uid, name, namespace, kind, api_version, creation_timestamp,
+    deletion_timestamp, resource_version, generation, health_status,
+    labels, annotations, spec, status, issues, updated_at
+"""
+
+_REPLACE_RESOURCE_SQL = f"""
+    INSERT OR REPLACE INTO resources ({_RESOURCE_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_APPEND_RESOURCE_SQL = f"""
+    INSERT OR IGNORE INTO resources ({_RESOURCE_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_HEALTH_HISTORY_SQL = """
+    INSERT INTO resource_health_history (
+        resource_uid, health_status, issues, timestamp
+    ) VALUES (?, ?, ?, ?)
+"""
+
+_INSERT_RELATIONSHIP_SQL = """
+    INSERT INTO relationships (
+        source_uid, target_resource, relationship_type, source_name,
+        source_namespace, source_kind, target_name, target_namespace,
+        target_kind, description, strength
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_CLUSTER_INFO_SQL = """
+    INSERT INTO cluster_info (key, value, analysis_timestamp)
+    VALUES (?, ?, ?)
+"""
+
+_INSERT_ANALYSIS_SUMMARY_SQL = """
+    INSERT INTO analysis_summary (
+        analysis_timestamp, total_resources, total_relationships,
+        namespace_count, resource_types, health_summary, namespaces, issues_count
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Rows are (section, key, count); distributions are ordered by descending count
+# except health statuses, which are ordered by name
+_HEALTH_SUMMARY_SQL = """
+    SELECT section, key, count FROM (
+        SELECT 'health_status' AS section, health_status AS key, COUNT(*) AS count
+        FROM resources
+        GROUP BY health_status
+        UNION ALL
+        SELECT 'namespace', namespace, COUNT(*)
+        FROM resources
+        WHERE namespace IS NOT NULL
+        GROUP BY namespace
+        UNION ALL
+        SELECT 'kind', kind, COUNT(*)
+        FROM resources
+        GROUP BY kind
+        UNION ALL
+        SELECT 'issues', NULL, COUNT(*)
+        FROM resources
+        WHERE issues IS NOT NULL AND issues != '[]'
+        UNION ALL
+        SELECT 'relationships', NULL, COUNT(*)
+        FROM relationships
+    )
+    ORDER BY section, CASE WHEN section = 'health_status' THEN key END, count DESC
+"""
+
+_CLEAR_TABLES_SQL = tuple(
+    f"DELETE FROM {table}"
+    for table in (
+        "resource_health_history", "relationships", "resources", "cluster_info", "analysis_summary"
+    )
+)
+
+# Secondary indexes as (name, table, column or expression)
+_INDEXES = (
+    ("idx_resources_uid", "resources", "uid"),
+    ("idx_resources_kind", "resources", "kind"),
+    ("idx_resources_namespace", "resources", "namespace"),
+    ("idx_resources_health", "resources", "health_status"),
+    ("idx_resources_issue_count", "resources", "json_array_length(issues)"),
+    ("idx_relationships_source", "relationships", "source_uid"),
+    ("idx_relationships_type", "relationships", "relationship_type"),
+    ("idx_health_history_uid", "resource_health_history", "resource_uid"),
+    ("idx_health_history_timestamp", "resource_health_history", "timestamp"),
+)
+
+# Rows written by a replacing load all carry its updated_at, so their history
+# can be copied inside SQLite instead of bound row by row
+_COPY_HEALTH_HISTORY_SQL = """
+    INSERT INTO resource_health_history (
+        resource_uid, health_status, issues, timestamp
+    )
+    SELECT uid, health_status, issues, updated_at
+    FROM resources
+    WHERE uid IS NOT NULL AND updated_at = ?
+"""
+
+# Statement cache size per connection (sqlite3 defaults to 128)
+CACHED_STATEMENTS = 256
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to a JSON column, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(value)
+
+
+def _where(clauses: List[str]) -> str:
+    """Join filter clauses into a WHERE clause, or nothing when unfiltered."""
+    return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
 
 class SQLiteExporter:
     """Exports Kubernetes cluster data to SQLite database."""
     
-    def __init__(self, db_path: Union[str, Path]):
+    def __init__(self, db_path: Union[str, Path], safe: bool = True):
         """Initialize SQLite exporter.
         
         Args:
             db_path: Path to SQLite database file
+            safe: Keep crash-safe durability settings. Pass False for
+                throwaway databases to disable fsyncs entirely.
         """
         self.db_path = Path(db_path)
+        self.safe = safe
         self.connection: Optional[sqlite3.Connection] = None
         
     def __enter__(self):
@@ -45,8 +195,12 @@ class SQLiteExporter:
     def connect(self) -> None:
         """Establish database connection."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.connection = sqlite3.connect(str(self.db_path))
+        # Autocommit mode: writes that need atomicity open explicit transactions
+        self.connection = sqlite3.connect(
+            str(self.db_path), cached_statements=CACHED_STATEMENTS, isolation_level=None
+        )
         self.connection.row_factory = sqlite3.Row  # Enable column access by name
+        self.connection.executescript(SAFE_PRAGMAS if self.safe else UNSAFE_PRAGMAS)
         logger.info(f"Connected to SQLite database: {self.db_path}")
         
     def close(self) -> None:
@@ -57,6 +211,12 @@ class SQLiteExporter:
             
     def create_schema(self) -> None:
         """Create database schema for Kubernetes data."""
+        self.create_tables()
+        self.create_indexes()
+        logger.info("Database schema created successfully")
+        
+    def create_tables(self) -> None:
+        """Create the database tables without their secondary indexes."""
         if not self.connection:
             raise RuntimeError("Database connection not established")
             
@@ -147,18 +307,25 @@ class SQLiteExporter:
             )
         """)
         
-        # Create indexes for better query performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_resources_uid ON resources (uid)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_resources_kind ON resources (kind)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_resources_namespace ON resources (namespace)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_resources_health ON resources (health_status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_relationships_source ON relationships (source_uid)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_relationships_type ON relationships (relationship_type)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_health_history_uid ON resource_health_history (resource_uid)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_health_history_timestamp ON resource_health_history (timestamp)")
-        
         self.connection.commit()
-        logger.info("Database schema created successfully")
+        
+    def create_indexes(self) -> None:
+        """Create secondary indexes for better query performance."""
+        if not self.connection:
+            raise RuntimeError("Database connection not established")
+            
+        cursor = self.connection.cursor()
+        for name, table, column in _INDEXES:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})")
+        
+    def drop_indexes(self) -> None:
+        """Drop secondary indexes ahead of a bulk load."""
+        if not self.connection:
+            raise RuntimeError("Database connection not established")
+            
+        cursor = self.connection.cursor()
+        for name, _table, _column in _INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
         
     def export_cluster_state(self, cluster_state: ClusterState, replace_existing: bool = True) -> None:
         """Export complete cluster state to database.
@@ -172,85 +339,103 @@ class SQLiteExporter:
             
         logger.info(f"Exporting cluster state with {len(cluster_state.resources)} resources")
         
-        if replace_existing:
-            self._clear_existing_data()
-            
-        self._export_resources(cluster_state.resources, replace_existing)
-        self._export_relationships(cluster_state.relationships)
-        self._export_cluster_info(cluster_state.cluster_info, cluster_state.analysis_timestamp)
-        self._export_analysis_summary(cluster_state)
-        
-        self.connection.commit()
+        # Run the clear and all inserts as one write transaction so the export
+        # costs a single commit and is rolled back as a whole on failure.
+        # Inside a caller's transaction a savepoint is used instead, so the
+        # caller keeps control of its commit.
+        owns_transaction = not self.connection.in_transaction
+        if owns_transaction:
+            self.connection.execute("BEGIN IMMEDIATE")
+        else:
+            self.connection.execute("SAVEPOINT export_cluster_state")
+        
+        try:
+            if replace_existing:
+                # Every row is rewritten, so building the indexes once after the
+                # load is cheaper than maintaining them on each insert
+                self.drop_indexes()
+                self._clear_existing_data()
+                
+            self._export_resources(cluster_state.resources, replace_existing)
+            self._export_relationships(cluster_state.relationships)
+            self._export_cluster_info(cluster_state.cluster_info, cluster_state.analysis_timestamp)
+            self._export_analysis_summary(cluster_state)
+            
+            if replace_existing:
+                self.create_indexes()
+        except Exception:
+            if owns_transaction:
+                self.connection.rollback()
+            else:
+                self.connection.execute("ROLLBACK TO SAVEPOINT export_cluster_state")
+                self.connection.execute("RELEASE SAVEPOINT export_cluster_state")
+            raise
+        
+        if owns_transaction:
+            self.connection.commit()
+        else:
+            self.connection.execute("RELEASE SAVEPOINT export_cluster_state")
         logger.info("Cluster state export completed successfully")
         
     def _clear_existing_data(self) -> None:
         """Clear existing data from all tables."""
         cursor = self.connection.cursor()
-        tables = ["resource_health_history", "relationships", "resources", "cluster_info", "analysis_summary"]
-        
-        for table in tables:
-            cursor.execute(f"DELETE FROM {table}")
+        for statement in _CLEAR_TABLES_SQL:
+            cursor.execute(statement)
             
         logger.info("Existing data cleared from database")
         
     def _export_resources(self, resources: List[KubernetesResource], replace_existing: bool = True) -> None:
         """Export resources to database."""
         cursor = self.connection.cursor()
+        exported_at = datetime.now()
+        
+        resource_rows = []
+        history_rows = []
         
         for resource in resources:
-            # Convert complex fields to JSON
-            labels_json = json.dumps(resource.metadata.labels) if resource.metadata.labels else None
-            annotations_json = json.dumps(resource.metadata.annotations) if resource.metadata.annotations else None
-            spec_json = json.dumps(resource.spec) if resource.spec else None
-            status_json = json.dumps(resource.status) if resource.status else None
-            issues_json = json.dumps(resource.issues) if resource.issues else None
+            metadata = resource.metadata
             
-            # Use INSERT OR REPLACE for replace mode, INSERT OR IGNORE for append mode
-            insert_sql = """
-                INSERT OR REPLACE INTO resources (
-                    uid, name, namespace, kind, api_version, creation_timestamp,
-                    deletion_timestamp, resource_version, generation, health_status,
-                    labels, annotations, spec, status, issues, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """ if replace_existing else """
-                INSERT OR IGNORE INTO resources (
-                    uid, name, namespace, kind, api_version, creation_timestamp,
-                    deletion_timestamp, resource_version, generation, health_status,
-                    labels, annotations, spec, status, issues, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
+            # Convert complex fields to JSON
+            issues_json = _dumps(resource.issues) if resource.issues else None
             
-            cursor.execute(insert_sql, (
-                resource.metadata.uid,
-                resource.metadata.name,
-                resource.metadata.namespace,
+            resource_rows.append((
+                metadata.uid,
+                metadata.name,
+                metadata.namespace,
                 resource.kind,
                 resource.api_version,
-                resource.metadata.creation_timestamp,
-                resource.metadata.deletion_timestamp,
-                resource.metadata.resource_version,
-                resource.metadata.generation,
+                metadata.creation_timestamp,
+                metadata.deletion_timestamp,
+                metadata.resource_version,
+                metadata.generation,
                 resource.health_status.value,
-                labels_json,
-                annotations_json,
-                spec_json,
-                status_json,
+                _dumps(metadata.labels) if metadata.labels else None,
+                _dumps(metadata.annotations) if metadata.annotations else None,
+                _dumps(resource.spec) if resource.spec else None,
+                _dumps(resource.status) if resource.status else None,
                 issues_json,
-                datetime.now()
+                exported_at
             ))
             
-            # Record health history
-            if resource.metadata.uid:
-                cursor.execute("""
-                    INSERT INTO resource_health_history (
-                        resource_uid, health_status, issues, timestamp
-                    ) VALUES (?, ?, ?, ?)
-                """, (
-                    resource.metadata.uid,
+            # Record health history; replacing loads copy it from resources below
+            if metadata.uid and not replace_existing:
+                history_rows.append((
+                    metadata.uid,
                     resource.health_status.value,
                     issues_json,
-                    datetime.now()
+                    exported_at
                 ))
+        
+        # Use INSERT OR REPLACE for replace mode, INSERT OR IGNORE for append mode
+        insert_sql = _REPLACE_RESOURCE_SQL if replace_existing else _APPEND_RESOURCE_SQL
+        cursor.executemany(insert_sql, resource_rows)
+        if replace_existing:
+            cursor.execute(_COPY_HEALTH_HISTORY_SQL, (exported_at,))
+        else:
+            # Appended rows may be ignored as duplicates, yet their current
+            # health still belongs in the history
+            cursor.executemany(_INSERT_HEALTH_HISTORY_SQL, history_rows)
                 
         logger.info(f"Exported {len(resources)} resources to database")
         
@@ -258,20 +443,12 @@ class SQLiteExporter:
         """Export relationships to database."""
         cursor = self.connection.cursor()
         
-        for rel in relationships:
-            # Extract information from source and target ResourceReference objects
-            source_uid = rel.source.uid if rel.source.uid else None
-            target_str = str(rel.target)  # Use string representation
-            
-            cursor.execute("""
-                INSERT INTO relationships (
-                    source_uid, target_resource, relationship_type, source_name,
-                    source_namespace, source_kind, target_name, target_namespace,
-                    target_kind, description, strength
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                source_uid,
-                target_str,
+        # Extract information from source and target ResourceReference objects,
+        # using the target's string representation as its identifier
+        cursor.executemany(_INSERT_RELATIONSHIP_SQL, (
+            (
+                rel.source.uid or None,
+                str(rel.target),
                 rel.relationship_type.value,
                 rel.source.name,
                 rel.source.namespace,
@@ -281,7 +458,9 @@ class SQLiteExporter:
                 rel.target.kind,
                 "",  # description - not available in ResourceRelationship
                 1.0  # strength - not available in ResourceRelationship, default to 1.0
-            ))
+            )
+            for rel in relationships
+        ))
             
         logger.info(f"Exported {len(relationships)} relationships to database")
         
@@ -289,12 +468,10 @@ class SQLiteExporter:
         """Export cluster information to database."""
         cursor = self.connection.cursor()
         
-        for key, value in cluster_info.items():
-            value_str = json.dumps(value) if isinstance(value, (dict, list)) else str(value)
-            cursor.execute("""
-                INSERT INTO cluster_info (key, value, analysis_timestamp)
-                VALUES (?, ?, ?)
-            """, (key, value_str, timestamp))
+        cursor.executemany(_INSERT_CLUSTER_INFO_SQL, (
+            (key, _dumps(value) if isinstance(value, (dict, list)) else str(value), timestamp)
+            for key, value in cluster_info.items()
+        ))
             
         logger.info(f"Exported {len(cluster_info)} cluster info items to database")
         
@@ -305,19 +482,14 @@ class SQLiteExporter:
         summary = cluster_state.summary
         issues_count = sum(len(r.issues) for r in cluster_state.resources if r.issues)
         
-        cursor.execute("""
-            INSERT INTO analysis_summary (
-                analysis_timestamp, total_resources, total_relationships,
-                namespace_count, resource_types, health_summary, namespaces, issues_count
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_INSERT_ANALYSIS_SUMMARY_SQL, (
             cluster_state.analysis_timestamp,
             summary.get("total_resources", 0),
             summary.get("total_relationships", 0),
             len(summary.get("namespaces", {})),
-            json.dumps(summary.get("resource_types", {})),
-            json.dumps(summary.get("health_status", {})),
-            json.dumps(list(summary.get("namespaces", {}).keys())),
+            _dumps(summary.get("resource_types", {})),
+            _dumps(summary.get("health_status", {})),
+            _dumps(list(summary.get("namespaces", {}).keys())),
             issues_count
         ))
         
@@ -346,31 +518,19 @@ class SQLiteExporter:
             
         cursor = self.connection.cursor()
         
-        query = "SELECT * FROM resources WHERE 1=1"
-        params = []
-        
-        if kind:
-            query += " AND kind = ?"
-            params.append(kind)
-            
-        if namespace:
-            query += " AND namespace = ?"
-            params.append(namespace)
-            
-        if health_status:
-            query += " AND health_status = ?"
-            params.append(health_status)
+        filters = {"kind": kind, "namespace": namespace, "health_status": health_status}
+        clauses = [f"{column} = ?" for column, value in filters.items() if value]
+        params = [value for value in filters.values() if value]
             
         if has_issues is not None:
+            # Written to match the idx_resources_issue_count expression index
             if has_issues:
-                query += " AND issues IS NOT NULL AND issues != '[]'"
+                clauses.append("json_array_length(issues) > 0")
             else:
-                query += " AND (issues IS NULL OR issues = '[]')"
+                clauses.append("(issues IS NULL OR json_array_length(issues) = 0)")
                 
-        query += " ORDER BY namespace, kind, name"
-        
-        cursor.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        query = f"SELECT * FROM resources{_where(clauses)} ORDER BY namespace, kind, name"
+        return list(map(dict, cursor.execute(query, params)))
         
     def query_relationships(
         self,
@@ -393,25 +553,19 @@ class SQLiteExporter:
             
         cursor = self.connection.cursor()
         
-        query = "SELECT * FROM relationships WHERE 1=1"
-        params = []
-        
-        if source_kind:
-            query += " AND source_kind = ?"
-            params.append(source_kind)
-            
-        if target_kind:
-            query += " AND target_kind = ?"
-            params.append(target_kind)
-            
-        if relationship_type:
-            query += " AND relationship_type = ?"
-            params.append(relationship_type)
+        filters = {
+            "source_kind": source_kind,
+            "target_kind": target_kind,
+            "relationship_type": relationship_type,
+        }
+        clauses = [f"{column} = ?" for column, value in filters.items() if value]
+        params = [value for value in filters.values() if value]
             
-        query += " ORDER BY source_kind, source_name, relationship_type"
-        
-        cursor.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        query = (
+            f"SELECT * FROM relationships{_where(clauses)} "
+            "ORDER BY source_kind, source_name, relationship_type"
+        )
+        return list(map(dict, cursor.execute(query, params)))
         
     def get_health_summary(self) -> Dict[str, Any]:
         """Get health summary statistics.
@@ -424,57 +578,32 @@ class SQLiteExporter:
             
         cursor = self.connection.cursor()
         
-        # Get health status counts
-        cursor.execute("""
-            SELECT health_status, COUNT(*) as count
-            FROM resources
-            GROUP BY health_status
-            ORDER BY health_status
-        """)
-        health_counts = {row['health_status']: row['count'] for row in cursor.fetchall()}
-        
-        # Get resources with issues
-        cursor.execute("""
-            SELECT COUNT(*) as count
-            FROM resources
-            WHERE issues IS NOT NULL AND issues != '[]'
-        """)
-        issues_count = cursor.fetchone()['count']
-        
-        # Get namespace distribution
-        cursor.execute("""
-            SELECT namespace, COUNT(*) as count
-            FROM resources
-            WHERE namespace IS NOT NULL
-            GROUP BY namespace
-            ORDER BY count DESC
-        """)
-        namespace_counts = {row['namespace']: row['count'] for row in cursor.fetchall()}
+        health_counts: Dict[str, int] = {}
+        namespace_counts: Dict[str, int] = {}
+        kind_counts: Dict[str, int] = {}
+        totals: Dict[str, int] = {}
+        sections = {
+            "health_status": health_counts,
+            "namespace": namespace_counts,
+            "kind": kind_counts,
+        }
         
-        # Get resource type distribution
-        cursor.execute("""
-            SELECT kind, COUNT(*) as count
-            FROM resources
-            GROUP BY kind
-            ORDER BY count DESC
-        """)
-        kind_counts = {row['kind']: row['count'] for row in cursor.fetchall()}
+        # Every aggregate comes back from a single statement as (section, key, count)
+        for section, key, count in cursor.execute(_HEALTH_SUMMARY_SQL):
+            if section in sections:
+                sections[section][key] = count
+            else:
+                totals[section] = count
         
         return {
             "health_status": health_counts,
-            "issues_count": issues_count,
+            "issues_count": totals["issues"],
             "namespace_distribution": namespace_counts,
             "resource_type_distribution": kind_counts,
             "total_resources": sum(health_counts.values()),
-            "total_relationships": self._get_relationship_count()
+            "total_relationships": totals["relationships"]
         }
         
-    def _get_relationship_count(self) -> int:
-        """Get total relationship count."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT COUNT(*) as count FROM relationships")
-        return cursor.fetchone()['count']
-        
     def export_to_csv(self, output_dir: Union[str, Path]) -> None:
         """Export database contents to CSV files.
         
@@ -487,36 +616,22 @@ class SQLiteExporter:
         if not self.connection:
             raise RuntimeError("Database connection not established")
             
-        # Export resources
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM resources ORDER BY namespace, kind, name")
-        
-        import csv
+        exports = {
+            "resources.csv": "SELECT * FROM resources ORDER BY namespace, kind, name",
+            "relationships.csv": "SELECT * FROM relationships ORDER BY source_kind, source_name",
+        }
         
-        with open(output_dir / "resources.csv", "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
+        for filename, query in exports.items():
+            cursor = self.connection.execute(query)
             
-            # Write header
-            columns = [description[0] for description in cursor.description]
-            writer.writerow(columns)
-            
-            # Write data
-            for row in cursor.fetchall():
-                writer.writerow(row)
+            with open(output_dir / filename, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
                 
-        # Export relationships
-        cursor.execute("SELECT * FROM relationships ORDER BY source_kind, source_name")
-        
-        with open(output_dir / "relationships.csv", "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            columns = [description[0] for description in cursor.description]
-            writer.writerow(columns)
-            
-            # Write data
-            for row in cursor.fetchall():
-                writer.writerow(row)
+                # Write header
+                writer.writerow([description[0] for description in cursor.description])
+                
+                # Stream rows straight from the cursor rather than fetching them all
+                writer.writerows(cursor)
                 
         logger.info(f"Exported database contents to CSV files in {output_dir}")
 
@@ -0,0 +1,38 @@
+"""
+Shared pytest configuration for the k8s-analyzer tests.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+SHM_PATH = Path("/dev/shm")
+
+# Per-run tmpfs base directory created by pytest_configure
+_shm_basetemp = pytest.StashKey[Path]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep tmp_path files in memory when a tmpfs is available.
+
+    Each run gets its own directory: pytest wipes basetemp at session start,
+    so a shared fixed path would delete the tmp dirs of concurrent runs.
+    """
+    if config.option.basetemp is not None:
+        # Respect an explicit --basetemp
+        return
+
+    if SHM_PATH.is_dir() and os.access(SHM_PATH, os.W_OK):
+        basetemp = Path(tempfile.mkdtemp(prefix=f"pytest-{os.getuid()}-", dir=SHM_PATH))
+        config.stash[_shm_basetemp] = basetemp
+        config.option.basetemp = basetemp
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Free the per-run tmpfs directory; it lives in memory."""
+    basetemp = config.stash.get(_shm_basetemp, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
@@ -2,17 +2,23 @@
 Tests for the Kubernetes resource parser.
 """
 
+import copy
 import json
 import os
 from pathlib import Path
+from typing import Any, Dict
 
 import pytest
-import yaml
 
-from k8s_analyzer.models import ClusterState, KubernetesResource
+from k8s_analyzer.models import ClusterState, KubernetesResource, ResourceStatus
 from k8s_analyzer.parser import ResourceParser, find_kubernetes_files, discover_and_parse
 
 
+def _write_json(path: Path, data: Any) -> None:
+    """Write data to path as UTF-8 encoded JSON."""
+    path.write_bytes(json.dumps(data).encode("utf-8"))
+
+
 class TestResourceParser:
     """Test the ResourceParser class."""
     
@@ -40,7 +46,7 @@ class TestResourceParser:
         
         # Create temporary JSON file
         json_file = tmp_path / "pod.json"
-        json_file.write_text(json.dumps(pod_data))
+        _write_json(json_file, pod_data)
         
         # Parse the file
         parser = ResourceParser()
@@ -77,7 +83,7 @@ class TestResourceParser:
         
         # Create temporary JSON file
         json_file = tmp_path / "export.json"
-        json_file.write_text(json.dumps(export_data))
+        _write_json(json_file, export_data)
         
         # Parse the file
         parser = ResourceParser()
@@ -116,7 +122,111 @@ class TestResourceParser:
         config_map = cluster_state.resources[0]
         assert config_map.kind == "ConfigMap"
         assert config_map.metadata.name == "test-config"
-    
+
+    def test_parse_yaml_unquoted_timestamp(self, tmp_path: Path) -> None:
+        """Test that timestamps already decoded by the YAML loader are kept."""
+        yaml_content = """
+        apiVersion: v1
+        kind: Pod
+        metadata:
+          name: test-pod
+          creationTimestamp: 2024-01-01T00:00:00Z
+        """
+
+        yaml_file = tmp_path / "pod.yaml"
+        yaml_file.write_text(yaml_content)
+
+        parser = ResourceParser()
+        cluster_state = parser.parse_file(yaml_file)
+
+        assert len(cluster_state.resources) == 1
+        assert cluster_state.resources[0].metadata.creation_timestamp.year == 2024
+        assert parser.error_count == 0
+
+    def test_parse_yaml_non_mapping_documents(self, tmp_path: Path) -> None:
+        """Test that scalar and list documents are counted as errors and skipped."""
+        yaml_file = tmp_path / "mixed.yaml"
+        yaml_file.write_text(
+            "apiVersion: v1\nkind: Pod\nmetadata:\n  name: test-pod\n"
+            "---\njust a string\n"
+            "---\n- one\n- two\n"
+        )
+
+        parser = ResourceParser()
+        cluster_state = parser.parse_file(yaml_file)
+
+        assert [r.metadata.name for r in cluster_state.resources] == ["test-pod"]
+        assert parser.parsed_count == 1
+        assert parser.error_count == 2
+
+    def test_parse_invalid_yaml_discards_file(self, tmp_path: Path) -> None:
+        """Test that resources before a YAML error are not counted as parsed."""
+        (tmp_path / "broken.yaml").write_text(
+            "apiVersion: v1\nkind: Pod\nmetadata:\n  name: test-pod\n---\nkey: [unclosed\n"
+        )
+
+        parser = ResourceParser()
+        cluster_state = parser.parse_multiple_files([tmp_path / "broken.yaml"])
+
+        assert len(cluster_state.resources) == 0
+        assert parser.parsed_count == 0
+        assert parser.error_count == 1
+
+    def test_parse_invalid_yaml_discards_skipped_documents(self, tmp_path: Path) -> None:
+        """Test that documents skipped before a YAML error leave no stats behind."""
+        (tmp_path / "broken.yaml").write_text(
+            "apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: test-deploy\n"
+            "---\n- not a mapping\n"
+            "---\nkey: [unclosed\n"
+        )
+
+        parser = ResourceParser()
+        parser.parse_multiple_files([tmp_path / "broken.yaml"])
+
+        stats = parser.get_parse_stats()
+        assert stats["skipped"] == 0
+        assert stats["skipped_kinds"] == {}
+        assert stats["errors"] == 1  # The file itself
+        assert stats["total"] == 1
+
+    def test_parse_with_validation(self, tmp_path: Path) -> None:
+        """Test that validate=True rejects resources with invalid fields."""
+        pod_data = {"apiVersion": "v1", "kind": "Pod", "metadata": {"name": 123}}
+        json_file = tmp_path / "pod.json"
+        _write_json(json_file, pod_data)
+
+        parser = ResourceParser(validate=True)
+        cluster_state = parser.parse_file(json_file)
+
+        assert len(cluster_state.resources) == 0
+        assert parser.error_count == 1
+
+    def test_parse_validates_by_default(self, tmp_path: Path) -> None:
+        """Test that validation is on unless explicitly disabled."""
+        pod_data = {"apiVersion": "v1", "kind": "Pod", "metadata": {"name": None}}
+        json_file = tmp_path / "pod.json"
+        _write_json(json_file, pod_data)
+
+        parser = ResourceParser()
+        assert len(parser.parse_file(json_file).resources) == 0
+        assert parser.error_count == 1
+
+        parser = ResourceParser(validate=False)
+        assert len(parser.parse_file(json_file).resources) == 1
+        assert parser.error_count == 0
+
+    def test_parse_content_detects_format(self, tmp_path: Path) -> None:
+        """Test format detection for files without a known suffix."""
+        yaml_file = tmp_path / "export.txt"
+        yaml_file.write_text("apiVersion: v1\nkind: Pod\nmetadata:\n  name: yaml-pod\n")
+        json_file = tmp_path / "export"
+        _write_json(json_file, {"apiVersion": "v1", "kind": "Pod", "metadata": {"name": "json-pod"}})
+
+        parser = ResourceParser()
+
+        assert parser.parse_file(yaml_file).resources[0].metadata.name == "yaml-pod"
+        assert parser.parse_file(json_file).resources[0].metadata.name == "json-pod"
+
     def test_skip_unsupported_resources(self, tmp_path: Path) -> None:
         """Test that unsupported resource types are skipped."""
         export_data = {
@@ -140,7 +250,7 @@ class TestResourceParser:
         
         # Create temporary JSON file
         json_file = tmp_path / "export.json"
-        json_file.write_text(json.dumps(export_data))
+        _write_json(json_file, export_data)
         
         # Parse the file
         parser = ResourceParser()
@@ -161,7 +271,7 @@ class TestResourceParser:
             "spec": {"containers": [{"name": "c1", "image": "nginx"}]}
         }
         file1 = tmp_path / "pod.json"
-        file1.write_text(json.dumps(pod_data))
+        _write_json(file1, pod_data)
         
         # Create second file with service
         service_data = {
@@ -171,7 +281,7 @@ class TestResourceParser:
             "spec": {"selector": {"app": "test"}}
         }
         file2 = tmp_path / "service.json"
-        file2.write_text(json.dumps(service_data))
+        _write_json(file2, service_data)
         
         # Parse multiple files
         parser = ResourceParser()
@@ -183,6 +293,34 @@ class TestResourceParser:
         
         kinds = {r.kind for r in cluster_state.resources}
         assert kinds == {"Pod", "Service"}
+
+    def test_parse_multiple_files_missing_file(self, tmp_path: Path) -> None:
+        """Test that an unreadable file is counted as an error and skipped."""
+        pod_data = {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {"name": "pod1", "namespace": "default"},
+        }
+        file1 = tmp_path / "pod.json"
+        _write_json(file1, pod_data)
+
+        parser = ResourceParser()
+        cluster_state = parser.parse_multiple_files([tmp_path / "missing.json", file1])
+
+        assert len(cluster_state.resources) == 1
+        assert parser.parsed_count == 1
+        assert parser.error_count == 1
+
+    def test_summary_reflects_in_place_changes(self, tmp_path: Path) -> None:
+        """Test that the cluster summary is recounted after resources change in place."""
+        _write_json(tmp_path / "pod.json", dict(_SAMPLE_POD_DATA))
+        cluster_state = ResourceParser().parse_file(tmp_path / "pod.json")
+        
+        cluster_state.resources[0].health_status = ResourceStatus.ERROR
+        assert cluster_state.generate_summary()["health_status"]["error"] == 1
+        
+        cluster_state.resources = [cluster_state.resources[0].model_copy(update={"kind": "Service"})]
+        assert cluster_state.generate_summary()["resource_types"] == {"Service": 1}
     
     def test_get_parse_stats(self) -> None:
         """Test getting parse statistics."""
@@ -201,54 +339,59 @@ class TestResourceParser:
         }
 
 
-@pytest.fixture
-def sample_pod_data() -> dict:
-    """Sample pod data for testing."""
-    return {
-        "apiVersion": "v1",
-        "kind": "Pod",
-        "metadata": {
-            "name": "test-pod",
-            "namespace": "default",
-            "uid": "12345",
-            "labels": {"app": "test", "version": "v1"},
-            "annotations": {"deployment.kubernetes.io/revision": "1"}
-        },
-        "spec": {
-            "containers": [
-                {
-                    "name": "app",
-                    "image": "nginx:1.20",
-                    "env": [
-                        {
-                            "name": "CONFIG_VALUE",
-                            "valueFrom": {
-                                "configMapKeyRef": {
-                                    "name": "app-config",
-                                    "key": "config.yaml"
-                                }
+_SAMPLE_POD_DATA = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {
+        "name": "test-pod",
+        "namespace": "default",
+        "uid": "12345",
+        "labels": {"app": "test", "version": "v1"},
+        "annotations": {"deployment.kubernetes.io/revision": "1"}
+    },
+    "spec": {
+        "containers": [
+            {
+                "name": "app",
+                "image": "nginx:1.20",
+                "env": [
+                    {
+                        "name": "CONFIG_VALUE",
+                        "valueFrom": {
+                            "configMapKeyRef": {
+                                "name": "app-config",
+                                "key": "config.yaml"
                             }
                         }
-                    ]
-                }
-            ],
-            "serviceAccountName": "app-service-account",
-            "nodeName": "worker-node-1"
-        },
-        "status": {
-            "phase": "Running",
-            "containerStatuses": [
-                {
-                    "name": "app",
-                    "ready": True,
-                    "restartCount": 0
-                }
-            ]
-        }
+                    }
+                ]
+            }
+        ],
+        "serviceAccountName": "app-service-account",
+        "nodeName": "worker-node-1"
+    },
+    "status": {
+        "phase": "Running",
+        "containerStatuses": [
+            {
+                "name": "app",
+                "ready": True,
+                "restartCount": 0
+            }
+        ]
     }
+}
+
+
+@pytest.fixture
+def sample_pod_data() -> Dict[str, Any]:
+    """Sample pod data for testing; each test gets its own deep copy."""
+    return copy.deepcopy(_SAMPLE_POD_DATA)
 
 
-def test_parse_kubectl_export_function(sample_pod_data: dict, tmp_path: Path) -> None:
+def test_parse_kubectl_export_function(
+    sample_pod_data: Dict[str, Any], tmp_path: Path
+) -> None:
     """Test the convenience parse_kubectl_export function."""
     from k8s_analyzer.parser import parse_kubectl_export
     
@@ -260,7 +403,7 @@ def test_parse_kubectl_export_function(sample_pod_data: dict, tmp_path: Path) ->
     }
     
     json_file = tmp_path / "export.json"
-    json_file.write_text(json.dumps(export_data))
+    _write_json(json_file, export_data)
     
     # Parse using convenience function
     cluster_state = parse_kubectl_export(json_file)
@@ -336,6 +479,18 @@ class TestFileDiscovery:
         assert len(files_non_recursive) == 1
         assert files_non_recursive[0].name == "namespace.yaml"
     
+    def test_find_kubernetes_files_sees_new_files(self, tmp_path: Path) -> None:
+        """Test that repeated discovery picks up files added between calls."""
+        subdir = tmp_path / "manifests"
+        subdir.mkdir()
+        (subdir / "pod.yaml").write_text("apiVersion: v1\nkind: Pod")
+
+        assert len(find_kubernetes_files(tmp_path)) == 1
+
+        (subdir / "service.yaml").write_text("apiVersion: v1\nkind: Service")
+
+        assert len(find_kubernetes_files(tmp_path)) == 2
+
     def test_find_kubernetes_files_single_file(self, tmp_path: Path) -> None:
         """Test finding a single file instead of directory."""
         # Create a single file
@@ -350,6 +505,8 @@ class TestFileDiscovery:
     
     def test_discover_and_parse(self, tmp_path: Path) -> None:
         """Test discovering and parsing all files in a directory."""
+        import yaml
+        
         # Create test files with valid Kubernetes resources
         pod_data = {
             "apiVersion": "v1",
@@ -366,7 +523,7 @@ class TestFileDiscovery:
         }
         
         # Create files
-        (tmp_path / "pod.json").write_text(json.dumps(pod_data))
+        _write_json(tmp_path / "pod.json", pod_data)
         (tmp_path / "service.yaml").write_text(yaml.dump(service_data))
         
         # Discover and parse
@@ -387,7 +544,7 @@ class TestFileDiscovery:
                 "metadata": {"name": f"pod-{i}", "namespace": "default"},
                 "spec": {"containers": [{"name": "c1", "image": "nginx"}]}
             }
-            (tmp_path / f"pod-{i}.json").write_text(json.dumps(pod_data))
+            _write_json(tmp_path / f"pod-{i}.json", pod_data)
         
         # Discover and parse with limit
         cluster_state = discover_and_parse(tmp_path, max_files=3)
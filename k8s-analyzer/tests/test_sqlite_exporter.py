@@ -4,9 +4,9 @@ Tests for SQLite exporter functionality.
 
 import json
 import sqlite3
-import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 
@@ -17,7 +17,7 @@ from k8s_analyzer.sqlite_exporter import SQLiteExporter, export_cluster_to_sqlit
 class TestSQLiteExporter:
     """Test SQLite export functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_cluster_state(self) -> ClusterState:
         """Create sample cluster state for testing."""
         resources = [
@@ -87,49 +87,68 @@ class TestSQLiteExporter:
         
         return cluster_state
 
-    def test_sqlite_exporter_context_manager(self) -> None:
+    @pytest.fixture
+    def db_path(self) -> str:
+        """Database path for tests that do not need the file on disk."""
+        return ":memory:"
+
+    @pytest.fixture(scope="session")
+    def seed_connection(self, sample_cluster_state: ClusterState) -> Iterator[sqlite3.Connection]:
+        """In-memory database holding one export of the sample cluster state."""
+        with SQLiteExporter(":memory:") as exporter:
+            exporter.create_schema()
+            exporter.export_cluster_state(sample_cluster_state)
+            yield exporter.connection
+
+    @pytest.fixture
+    def seeded_exporter(self, seed_connection: sqlite3.Connection) -> Iterator[SQLiteExporter]:
+        """Exporter on a fresh in-memory copy of the seed database."""
+        with SQLiteExporter(":memory:") as exporter:
+            seed_connection.backup(exporter.connection)
+            yield exporter
+
+    def test_sqlite_exporter_context_manager(self, tmp_path: Path) -> None:
         """Test SQLite exporter as context manager."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = tmp.name
+        db_path = tmp_path / "test.db"
         
-        try:
-            with SQLiteExporter(db_path) as exporter:
-                assert exporter.connection is not None
-                exporter.create_schema()
-            
-            # Should be closed after context
-            assert exporter.connection is None
-            
-            # Verify database file exists and has tables
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall()]
-            conn.close()
-            
-            expected_tables = {
-                "resources", "relationships", "cluster_info", 
-                "analysis_summary", "resource_health_history"
-            }
-            assert expected_tables.issubset(set(tables))
-            
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        with SQLiteExporter(db_path) as exporter:
+            assert exporter.connection is not None
+            exporter.create_schema()
+        
+        # Should be closed after context
+        assert exporter.connection is None
+        
+        # Verify database file exists and has tables
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        
+        expected_tables = {
+            "resources", "relationships", "cluster_info", 
+            "analysis_summary", "resource_health_history"
+        }
+        assert expected_tables.issubset(set(tables))
+
+    def test_connection_pragmas(self, tmp_path: Path) -> None:
+        """Test durability pragmas for safe and unsafe exporters."""
+        with SQLiteExporter(tmp_path / "safe.db") as exporter:
+            assert exporter.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert exporter.connection.execute("PRAGMA synchronous").fetchone()[0] == 1
 
-    def test_export_cluster_state(self, sample_cluster_state: ClusterState) -> None:
+        with SQLiteExporter(tmp_path / "unsafe.db", safe=False) as exporter:
+            assert exporter.connection.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+            assert exporter.connection.execute("PRAGMA synchronous").fetchone()[0] == 0
+
+    def test_export_cluster_state(self, sample_cluster_state: ClusterState, db_path: str) -> None:
         """Test exporting complete cluster state."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = tmp.name
-        
-        try:
-            with SQLiteExporter(db_path) as exporter:
-                exporter.create_schema()
-                exporter.export_cluster_state(sample_cluster_state)
+        with SQLiteExporter(db_path) as exporter:
+            exporter.create_schema()
+            exporter.export_cluster_state(sample_cluster_state)
             
             # Verify data was exported
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = exporter.connection.cursor()
             
             # Check resources
             cursor.execute("SELECT * FROM resources")
@@ -168,225 +187,214 @@ class TestSQLiteExporter:
             assert len(summary) == 1
             assert summary[0]['total_resources'] == 2
             assert summary[0]['total_relationships'] == 1
-            
-            conn.close()
-            
-        finally:
-            Path(db_path).unlink(missing_ok=True)
 
-    def test_query_resources(self, sample_cluster_state: ClusterState) -> None:
+    def test_indexes_rebuilt_after_replace(
+        self, sample_cluster_state: ClusterState, db_path: str
+    ) -> None:
+        """Test that secondary indexes exist after a replacing export."""
+        with SQLiteExporter(db_path) as exporter:
+            exporter.create_tables()
+            exporter.export_cluster_state(sample_cluster_state, replace_existing=True)
+
+            cursor = exporter.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'"
+            )
+            indexes = {row[0] for row in cursor.fetchall()}
+
+        assert {"idx_resources_kind", "idx_relationships_source"}.issubset(indexes)
+
+    def test_export_rolls_back_on_error(
+        self, sample_cluster_state: ClusterState, db_path: str
+    ) -> None:
+        """Test that a failed export leaves previously exported data intact."""
+        with SQLiteExporter(db_path) as exporter:
+            exporter.create_schema()
+            exporter.export_cluster_state(sample_cluster_state)
+
+            broken_state = sample_cluster_state.model_copy(deep=True)
+            broken_state.relationships[0].source.uid = None  # violates NOT NULL
+
+            with pytest.raises(sqlite3.IntegrityError):
+                exporter.export_cluster_state(broken_state)
+
+            assert len(exporter.query_resources()) == 2
+            assert len(exporter.query_relationships()) == 1
+
+    def test_export_within_caller_transaction(
+        self, sample_cluster_state: ClusterState, db_path: str
+    ) -> None:
+        """Test that an export inside a caller's transaction leaves it open."""
+        with SQLiteExporter(db_path) as exporter:
+            exporter.create_schema()
+            exporter.connection.execute("BEGIN")
+
+            exporter.export_cluster_state(sample_cluster_state)
+            assert exporter.connection.in_transaction
+
+            broken_state = sample_cluster_state.model_copy(deep=True)
+            broken_state.relationships[0].source.uid = None  # violates NOT NULL
+            with pytest.raises(sqlite3.IntegrityError):
+                exporter.export_cluster_state(broken_state)
+            assert exporter.connection.in_transaction
+            assert len(exporter.query_resources()) == 2
+
+            exporter.connection.rollback()
+            assert len(exporter.query_resources()) == 0
+
+    def test_query_resources(self, seeded_exporter: SQLiteExporter) -> None:
         """Test querying resources with filters."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = tmp.name
-        
-        try:
-            with SQLiteExporter(db_path) as exporter:
-                exporter.create_schema()
-                exporter.export_cluster_state(sample_cluster_state)
-                
-                # Test query by kind
-                pods = exporter.query_resources(kind="Pod")
-                assert len(pods) == 1
-                assert pods[0]['name'] == 'test-pod'
-                
-                # Test query by namespace
-                default_resources = exporter.query_resources(namespace="default")
-                assert len(default_resources) == 2
-                
-                # Test query by health status
-                healthy_resources = exporter.query_resources(health_status="healthy")
-                assert len(healthy_resources) == 1
-                assert healthy_resources[0]['kind'] == 'Pod'
-                
-                warning_resources = exporter.query_resources(health_status="warning")
-                assert len(warning_resources) == 1
-                assert warning_resources[0]['kind'] == 'Service'
-                
-                # Test query resources with issues
-                resources_with_issues = exporter.query_resources(has_issues=True)
-                assert len(resources_with_issues) == 1
-                assert resources_with_issues[0]['kind'] == 'Service'
-                
-                resources_without_issues = exporter.query_resources(has_issues=False)
-                assert len(resources_without_issues) == 1
-                assert resources_without_issues[0]['kind'] == 'Pod'
-            
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        exporter = seeded_exporter
+        
+        # Test query by kind
+        pods = exporter.query_resources(kind="Pod")
+        assert len(pods) == 1
+        assert pods[0]['name'] == 'test-pod'
+        
+        # Test query by namespace
+        default_resources = exporter.query_resources(namespace="default")
+        assert len(default_resources) == 2
+        
+        # Test query by health status
+        healthy_resources = exporter.query_resources(health_status="healthy")
+        assert len(healthy_resources) == 1
+        assert healthy_resources[0]['kind'] == 'Pod'
+        
+        warning_resources = exporter.query_resources(health_status="warning")
+        assert len(warning_resources) == 1
+        assert warning_resources[0]['kind'] == 'Service'
+        
+        # Test query resources with issues
+        resources_with_issues = exporter.query_resources(has_issues=True)
+        assert len(resources_with_issues) == 1
+        assert resources_with_issues[0]['kind'] == 'Service'
+        
+        resources_without_issues = exporter.query_resources(has_issues=False)
+        assert len(resources_without_issues) == 1
+        assert resources_without_issues[0]['kind'] == 'Pod'
 
-    def test_query_relationships(self, sample_cluster_state: ClusterState) -> None:
+    def test_has_issues_uses_index(self, seeded_exporter: SQLiteExporter) -> None:
+        """Test that the has_issues filter is served by the issue count index."""
+        plan = seeded_exporter.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM resources WHERE json_array_length(issues) > 0"
+        ).fetchall()
+        
+        assert any("idx_resources_issue_count" in row["detail"] for row in plan)
+
+    def test_query_relationships(self, seeded_exporter: SQLiteExporter) -> None:
         """Test querying relationships with filters."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = tmp.name
-        
-        try:
-            with SQLiteExporter(db_path) as exporter:
-                exporter.create_schema()
-                exporter.export_cluster_state(sample_cluster_state)
-                
-                # Test query by source kind
-                service_rels = exporter.query_relationships(source_kind="Service")
-                assert len(service_rels) == 1
-                assert service_rels[0]['relationship_type'] == 'selects'
-                
-                # Test query by relationship type
-                selects_rels = exporter.query_relationships(relationship_type="selects")
-                assert len(selects_rels) == 1
-                
-                # Test query with no matches
-                pod_rels = exporter.query_relationships(source_kind="Pod")
-                assert len(pod_rels) == 0
-            
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        exporter = seeded_exporter
+        
+        # Test query by source kind
+        service_rels = exporter.query_relationships(source_kind="Service")
+        assert len(service_rels) == 1
+        assert service_rels[0]['relationship_type'] == 'selects'
+        
+        # Test query by relationship type
+        selects_rels = exporter.query_relationships(relationship_type="selects")
+        assert len(selects_rels) == 1
+        
+        # Test query with no matches
+        pod_rels = exporter.query_relationships(source_kind="Pod")
+        assert len(pod_rels) == 0
 
-    def test_get_health_summary(self, sample_cluster_state: ClusterState) -> None:
+    def test_get_health_summary(self, seeded_exporter: SQLiteExporter) -> None:
         """Test getting health summary statistics."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = tmp.name
-        
-        try:
-            with SQLiteExporter(db_path) as exporter:
-                exporter.create_schema()
-                exporter.export_cluster_state(sample_cluster_state)
-                
-                summary = exporter.get_health_summary()
-                
-                assert summary['total_resources'] == 2
-                assert summary['total_relationships'] == 1
-                assert summary['issues_count'] == 1
-                
-                assert summary['health_status']['healthy'] == 1
-                assert summary['health_status']['warning'] == 1
-                
-                assert summary['resource_type_distribution']['Pod'] == 1
-                assert summary['resource_type_distribution']['Service'] == 1
-                
-                assert summary['namespace_distribution']['default'] == 2
-            
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        exporter = seeded_exporter
+        
+        summary = exporter.get_health_summary()
+        
+        assert summary['total_resources'] == 2
+        assert summary['total_relationships'] == 1
+        assert summary['issues_count'] == 1
+        
+        assert summary['health_status']['healthy'] == 1
+        assert summary['health_status']['warning'] == 1
+        
+        assert summary['resource_type_distribution']['Pod'] == 1
+        assert summary['resource_type_distribution']['Service'] == 1
+        
+        assert summary['namespace_distribution']['default'] == 2
 
-    def test_export_to_csv(self, sample_cluster_state: ClusterState) -> None:
+    def test_export_to_csv(
+        self, seeded_exporter: SQLiteExporter, tmp_path: Path
+    ) -> None:
         """Test exporting database to CSV files."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = tmp.name
-        
-        with tempfile.TemporaryDirectory() as csv_dir:
-            try:
-                with SQLiteExporter(db_path) as exporter:
-                    exporter.create_schema()
-                    exporter.export_cluster_state(sample_cluster_state)
-                    exporter.export_to_csv(csv_dir)
-                
-                # Verify CSV files were created
-                csv_path = Path(csv_dir)
-                assert (csv_path / "resources.csv").exists()
-                assert (csv_path / "relationships.csv").exists()
-                
-                # Check resources CSV content
-                resources_csv = (csv_path / "resources.csv").read_text()
-                assert "test-pod" in resources_csv
-                assert "test-service" in resources_csv
-                assert "healthy" in resources_csv
-                assert "warning" in resources_csv
-                
-                # Check relationships CSV content
-                relationships_csv = (csv_path / "relationships.csv").read_text()
-                assert "selects" in relationships_csv
-                assert "Pod/test-pod/default" in relationships_csv
-                
-            finally:
-                Path(db_path).unlink(missing_ok=True)
-
-    def test_replace_vs_append_mode(self, sample_cluster_state: ClusterState) -> None:
-        """Test replace vs append mode for data export."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = tmp.name
+        csv_path = tmp_path / "csv"
+        
+        exporter = seeded_exporter
+        exporter.export_to_csv(csv_path)
+        
+        # Verify CSV files were created
+        assert (csv_path / "resources.csv").exists()
+        assert (csv_path / "relationships.csv").exists()
         
-        try:
+        # Check resources CSV content
+        resources_csv = (csv_path / "resources.csv").read_text()
+        assert "test-pod" in resources_csv
+        assert "test-service" in resources_csv
+        assert "healthy" in resources_csv
+        assert "warning" in resources_csv
+        
+        # Check relationships CSV content
+        relationships_csv = (csv_path / "relationships.csv").read_text()
+        assert "selects" in relationships_csv
+        assert "Pod/test-pod/default" in relationships_csv
+
+    def test_replace_vs_append_mode(self, sample_cluster_state: ClusterState, db_path: str) -> None:
+        """Test replace vs append mode for data export."""
+        with SQLiteExporter(db_path) as exporter:
+            cursor = exporter.connection.cursor()
+            
             # First export
-            with SQLiteExporter(db_path) as exporter:
-                exporter.create_schema()
-                exporter.export_cluster_state(sample_cluster_state, replace_existing=True)
+            exporter.create_schema()
+            exporter.export_cluster_state(sample_cluster_state, replace_existing=True)
             
             # Check initial count
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM resources")
             initial_count = cursor.fetchone()[0]
             assert initial_count == 2
-            conn.close()
             
             # Export again with replace=True (should still be 2)
-            with SQLiteExporter(db_path) as exporter:
-                exporter.export_cluster_state(sample_cluster_state, replace_existing=True)
+            exporter.export_cluster_state(sample_cluster_state, replace_existing=True)
             
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM resources")
             replace_count = cursor.fetchone()[0]
             assert replace_count == 2
-            conn.close()
             
             # Export again with replace=False (should still be 2 due to UNIQUE constraint)
-            with SQLiteExporter(db_path) as exporter:
-                exporter.export_cluster_state(sample_cluster_state, replace_existing=False)
+            exporter.export_cluster_state(sample_cluster_state, replace_existing=False)
             
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM resources")
             append_count = cursor.fetchone()[0]
             assert append_count == 2  # Same UIDs are ignored in append mode
-            conn.close()
-            
-        finally:
-            Path(db_path).unlink(missing_ok=True)
 
-    def test_convenience_function(self, sample_cluster_state: ClusterState) -> None:
+    def test_convenience_function(self, sample_cluster_state: ClusterState, tmp_path: Path) -> None:
         """Test the convenience export function."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = tmp.name
+        db_path = tmp_path / "test.db"
         
-        try:
-            export_cluster_to_sqlite(sample_cluster_state, db_path)
-            
-            # Verify data was exported
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM resources")
-            count = cursor.fetchone()[0]
-            assert count == 2
-            conn.close()
-            
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        export_cluster_to_sqlite(sample_cluster_state, db_path)
+        
+        # Verify data was exported
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM resources")
+        count = cursor.fetchone()[0]
+        assert count == 2
+        conn.close()
 
-    def test_health_history_tracking(self, sample_cluster_state: ClusterState) -> None:
+    def test_health_history_tracking(self, seeded_exporter: SQLiteExporter) -> None:
         """Test that health history is tracked."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db_path = tmp.name
+        exporter = seeded_exporter
         
-        try:
-            with SQLiteExporter(db_path) as exporter:
-                exporter.create_schema()
-                exporter.export_cluster_state(sample_cluster_state)
-            
-            # Check health history was recorded
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM resource_health_history")
-            history_count = cursor.fetchone()[0]
-            assert history_count == 2  # One for each resource
-            
-            cursor.execute("SELECT resource_uid, health_status FROM resource_health_history")
-            history_records = cursor.fetchall()
-            
-            uids_and_health = {record[0]: record[1] for record in history_records}
-            assert uids_and_health['pod-123'] == 'healthy'
-            assert uids_and_health['svc-456'] == 'warning'
-            
-            conn.close()
-            
-        finally:
-            Path(db_path).unlink(missing_ok=True)
+        # Check health history was recorded
+        cursor = exporter.connection.cursor()
+        cursor.execute("SELECT COUNT(*) FROM resource_health_history")
+        history_count = cursor.fetchone()[0]
+        assert history_count == 2  # One for each resource
+        
+        cursor.execute("SELECT resource_uid, health_status FROM resource_health_history")
+        history_records = cursor.fetchall()
+        
+        uids_and_health = {record[0]: record[1] for record in history_records}
+        assert uids_and_health['pod-123'] == 'healthy'
+        assert uids_and_health['svc-456'] == 'warning'
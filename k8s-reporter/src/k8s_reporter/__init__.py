@@ -8,12 +8,35 @@ Kubernetes cluster data exported by k8s-analyzer to SQLite databases.
 __version__ = "0.1.0"
 __author__ = "K8s Reporter Team"
 
-from k8s_reporter.database import DatabaseClient
-from k8s_reporter.models import ClusterOverview, ResourceSummary, NamespaceAnalysis
-
 __all__ = [
     "DatabaseClient",
     "ClusterOverview", 
     "ResourceSummary",
     "NamespaceAnalysis",
 ]
+
+# Re-exports are resolved on first access (PEP 562) so that importing the
+# package, e.g. for ``k8s-reporter --help``, does not pull in pandas/pydantic.
+_LAZY_IMPORTS = {
+    "DatabaseClient": "k8s_reporter.database",
+    "ClusterOverview": "k8s_reporter.models",
+    "ResourceSummary": "k8s_reporter.models",
+    "NamespaceAnalysis": "k8s_reporter.models",
+}
+
+
+def __getattr__(name):
+    """Import public re-exports lazily."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
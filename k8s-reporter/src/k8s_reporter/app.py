@@ -75,8 +75,11 @@ def load_database() -> Optional[DatabaseClient]:
     if uploaded_file:
         # Save uploaded file temporarily
         temp_path = Path(f"/tmp/{uploaded_file.name}")
-        with open(temp_path, "wb") as f:
-            f.write(uploaded_file.read())
+        data = uploaded_file.getvalue()
+        # Only rewrite on change so cached results for this file stay valid
+        if not temp_path.exists() or temp_path.read_bytes() != data:
+            with open(temp_path, "wb") as f:
+                f.write(data)
         
         try:
             return DatabaseClient(str(temp_path))
@@ -0,0 +1,77 @@
+"""
+Result cache for the whole-cluster aggregates served by DatabaseClient.
+
+Streamlit reruns the app script on every interaction, so each rerun builds a
+fresh DatabaseClient and would otherwise recompute every aggregate from
+scratch. Results are kept per process, keyed on the database file's identity
+(resolved path, size and modification time, including those of its WAL
+file) plus the call arguments, and are reused until the database changes.
+The report models are immutable, so a single cached instance can safely be
+shared between reruns and sessions.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Upper bound on cached results; the least recently used entry is dropped first
+MAX_ENTRIES = 128
+
+_results: "OrderedDict[Hashable, Any]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def database_fingerprint(db_path: Path) -> Tuple[str, int, int, Optional[Tuple[int, int]]]:
+    """Identify a database file by path, size and modification time.
+    
+    In WAL mode commits land in the -wal file and leave the main file
+    untouched until a checkpoint, so the WAL file's size and modification
+    time are part of the fingerprint too.
+    """
+    stat = db_path.stat()
+    try:
+        wal_stat = db_path.with_name(db_path.name + "-wal").stat()
+        wal = (wal_stat.st_size, wal_stat.st_mtime_ns)
+    except FileNotFoundError:
+        wal = None
+    return str(db_path.resolve()), stat.st_size, stat.st_mtime_ns, wal
+
+
+def cached_result(method: F) -> F:
+    """Cache a DatabaseClient method's result per database file and arguments.
+
+    Only wrap methods returning immutable report models; mutable results such
+    as DataFrames would be shared by every caller.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            database_fingerprint(self.db_path),
+            method.__name__,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        with _lock:
+            if key in _results:
+                _results.move_to_end(key)
+                return _results[key]
+
+        result = method(self, *args, **kwargs)
+
+        with _lock:
+            _results[key] = result
+            while len(_results) > MAX_ENTRIES:
+                _results.popitem(last=False)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+def clear_cache() -> None:
+    """Drop every cached result."""
+    with _lock:
+        _results.clear()
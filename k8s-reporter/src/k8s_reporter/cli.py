@@ -20,6 +20,7 @@ Examples:
   k8s-reporter                        # Launch web UI
   k8s-reporter --port 8501            # Launch on custom port
   k8s-reporter --database cluster.db  # Launch with pre-loaded database
+  k8s-reporter --subprocess --quiet   # Exec the streamlit binary, no banners
         """
     )
     
@@ -55,6 +56,18 @@ Examples:
         help="Enable debug mode"
     )
     
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Replace this process with the streamlit executable instead of running in-process"
+    )
+    
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress startup banners"
+    )
+    
     args = parser.parse_args()
     
     # Validate database path if provided
@@ -70,34 +83,43 @@ Examples:
     # Get the path to the app.py file
     app_path = Path(__file__).parent / "app.py"
     
-    print("🚀 Starting K8s Reporter...")
-    print(f"📊 Web UI will be available at: http://{args.host}:{args.port}")
-    if args.database:
-        print(f"🗄️  Pre-loading database: {args.database}")
-    print()
+    if not args.quiet:
+        print("🚀 Starting K8s Reporter...")
+        print(f"📊 Web UI will be available at: http://{args.host}:{args.port}")
+        if args.database:
+            print(f"🗄️  Pre-loading database: {args.database}")
+        print()
+    
+    # Prepare sys.argv for streamlit
+    streamlit_args = [
+        "streamlit", "run", str(app_path),
+        "--server.port", str(args.port),
+        "--server.address", args.host,
+        "--server.headless", str(args.headless).lower(),
+        "--theme.base", "light",
+        "--theme.primaryColor", "#1f77b4",
+        "--theme.backgroundColor", "#ffffff",
+        "--theme.secondaryBackgroundColor", "#f0f2f6",
+    ]
+    
+    if not args.headless:
+        streamlit_args.extend(["--server.runOnSave", "true"])
+    
+    if args.debug:
+        streamlit_args.extend(["--logger.level", "debug"])
+    
+    if args.subprocess:
+        # Replace the current process rather than forking a second interpreter
+        try:
+            os.execvp("streamlit", streamlit_args)
+        except OSError as e:
+            print(f"Error launching streamlit executable: {e}")
+            sys.exit(1)
     
     try:
         # Import and launch Streamlit directly
         from streamlit.web import cli as stcli
         
-        # Prepare sys.argv for streamlit
-        streamlit_args = [
-            "streamlit", "run", str(app_path),
-            "--server.port", str(args.port),
-            "--server.address", args.host,
-            "--server.headless", str(args.headless).lower(),
-            "--theme.base", "light",
-            "--theme.primaryColor", "#1f77b4",
-            "--theme.backgroundColor", "#ffffff",
-            "--theme.secondaryBackgroundColor", "#f0f2f6",
-        ]
-        
-        if not args.headless:
-            streamlit_args.extend(["--server.runOnSave", "true"])
-        
-        if args.debug:
-            streamlit_args.extend(["--logger.level", "debug"])
-        
         # Set sys.argv for streamlit to parse
         sys.argv = streamlit_args
         
@@ -109,7 +131,8 @@ Examples:
         print("Try: uv tool install --reinstall k8s-reporter")
         sys.exit(1)
     except KeyboardInterrupt:
-        print("\n👋 Shutting down K8s Reporter...")
+        if not args.quiet:
+            print("\n👋 Shutting down K8s Reporter...")
         sys.exit(0)
     except Exception as e:
         print(f"Error launching K8s Reporter: {e}")
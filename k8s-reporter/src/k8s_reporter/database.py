@@ -7,9 +7,13 @@ generated by k8s-analyzer, with methods optimized for web UI consumption.
 
 import json
 import sqlite3
+import sys
+import threading
+from array import array
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 import pandas as pd
 
@@ -17,6 +21,7 @@ import pandas as pd
 sqlite3.register_adapter(datetime, lambda dt: dt.isoformat())
 sqlite3.register_converter("timestamp", lambda b: datetime.fromisoformat(b.decode()))
 
+from k8s_reporter.cache import cached_result
 from k8s_reporter.models import (
     ClusterOverview,
     ResourceSummary,
@@ -33,9 +38,23 @@ from k8s_reporter.models import (
     NamespaceStorageAnalysis,
     ResourceTimeline,
     TemporalAnalysis,
+    make_labels,
 )
 
 
+# Weekday names indexed by SQLite's strftime('%w') (0 = Sunday)
+_WEEKDAYS = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a low-cardinality string column value (kind, status, ...).
+    
+    sqlite3 returns a fresh string per row, so records built from many rows
+    would otherwise each hold their own copy of the same few values.
+    """
+    return sys.intern(value) if value else value
+
+
 class DatabaseClient:
     """Client for reading k8s-analyzer SQLite databases."""
     
@@ -46,69 +65,74 @@ class DatabaseClient:
             db_path: Path to the SQLite database file
         """
         self.db_path = Path(db_path)
-        if not self.db_path.exists():
+        if not self.db_path.is_file():
             raise FileNotFoundError(f"Database file not found: {db_path}")
+        # mode=rw stops SQLite from creating an empty database if the file
+        # goes missing later
+        self._uri = f"{self.db_path.resolve().as_uri()}?mode=rw"
+        # One connection per thread, reused by every query the client runs
+        self._local = threading.local()
     
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Get this thread's database connection with row factory."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self._uri, uri=True)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
         return conn
     
+    def close(self) -> None:
+        """Close this thread's database connection, if one is open."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
+    @cached_result
+    def _resource_counts(self) -> Tuple[Tuple[Optional[str], Optional[str], Optional[str], int, int], ...]:
+        """Resource counts grouped by kind, namespace and health status.
+        
+        One scan of the resources table shared by the summary and overview
+        aggregates. Rows are (kind, namespace, health_status, count,
+        issues_count) in grouping order.
+        """
+        with self.get_connection() as conn:
+            rows = conn.execute("""
+                SELECT kind, namespace, health_status, COUNT(*),
+                       SUM(issues IS NOT NULL AND issues != '[]')
+                FROM resources
+                GROUP BY kind, namespace, health_status
+            """).fetchall()
+        return tuple(tuple(row) for row in rows)
+    
+    def _counts_by(self, column: int) -> Dict[Optional[str], int]:
+        """Resource counts per value of one grouping column, in SQLite's NULLs-first order."""
+        counts = Counter()
+        for row in self._resource_counts():
+            counts[row[column]] += row[3]
+        return {key: counts[key] for key in sorted(counts, key=lambda key: (key is not None, key or ''))}
+    
+    @cached_result
     def get_resource_summary(self) -> ResourceSummary:
         """Get overall resource summary."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Total resources and relationships
-            cursor.execute("SELECT COUNT(*) FROM resources")
-            total_resources = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM relationships")
-            total_relationships = cursor.fetchone()[0]
-            
-            # Health distribution
-            cursor.execute("""
-                SELECT health_status, COUNT(*) as count
-                FROM resources
-                GROUP BY health_status
-            """)
-            health_distribution = {row['health_status']: row['count'] for row in cursor.fetchall()}
-            
-            # Resource types
-            cursor.execute("""
-                SELECT kind, COUNT(*) as count
-                FROM resources
-                GROUP BY kind
-                ORDER BY count DESC
-            """)
-            resource_types = {row['kind']: row['count'] for row in cursor.fetchall()}
-            
-            # Namespaces count
-            cursor.execute("""
-                SELECT COUNT(DISTINCT namespace) as count
-                FROM resources
-                WHERE namespace IS NOT NULL
-            """)
-            namespaces_count = cursor.fetchone()[0]
-            
-            # Issues count
-            cursor.execute("""
-                SELECT COUNT(*) as count
-                FROM resources
-                WHERE issues IS NOT NULL AND issues != '[]'
-            """)
-            issues_count = cursor.fetchone()[0]
-            
-            return ResourceSummary(
-                total_resources=total_resources,
-                total_relationships=total_relationships,
-                health_distribution=health_distribution,
-                resource_types=resource_types,
-                namespaces_count=namespaces_count,
-                issues_count=issues_count
-            )
+            total_relationships = conn.execute("SELECT COUNT(*) FROM relationships").fetchone()[0]
+        
+        rows = self._resource_counts()
+        resource_types = self._counts_by(0)
+        
+        return ResourceSummary(
+            total_resources=sum(row[3] for row in rows),
+            total_relationships=total_relationships,
+            health_distribution=self._counts_by(2),
+            # Largest first; sorted() is stable, so ties stay in kind order
+            resource_types=dict(sorted(resource_types.items(), key=lambda item: -item[1])),
+            namespaces_count=len({row[1] for row in rows if row[1] is not None}),
+            issues_count=sum(row[4] for row in rows)
+        )
     
+    @cached_result
     def get_cluster_overview(self) -> ClusterOverview:
         """Get high-level cluster overview."""
         with self.get_connection() as conn:
@@ -123,65 +147,34 @@ class DatabaseClient:
             """)
             result = cursor.fetchone()
             analysis_timestamp = datetime.fromisoformat(result[0]) if result else datetime.now(timezone.utc)
-            
-            # Total resources and namespaces
-            cursor.execute("SELECT COUNT(*) FROM resources")
-            total_resources = cursor.fetchone()[0]
-            
-            cursor.execute("""
-                SELECT COUNT(DISTINCT namespace)
-                FROM resources
-                WHERE namespace IS NOT NULL
-            """)
-            total_namespaces = cursor.fetchone()[0]
-            
-            # Health ratio
-            cursor.execute("""
-                SELECT 
-                    SUM(CASE WHEN health_status = 'healthy' THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as ratio
-                FROM resources
-            """)
-            health_ratio = cursor.fetchone()[0] or 0.0
-            
-            # Top namespaces
-            cursor.execute("""
-                SELECT namespace, COUNT(*) as count
-                FROM resources
-                WHERE namespace IS NOT NULL
-                GROUP BY namespace
-                ORDER BY count DESC
-                LIMIT 10
-            """)
-            top_namespaces = [{"name": row['namespace'], "count": row['count']} for row in cursor.fetchall()]
-            
-            # Resource distribution
-            cursor.execute("""
-                SELECT kind, COUNT(*) as count
-                FROM resources
-                GROUP BY kind
-                ORDER BY count DESC
-            """)
-            resource_distribution = {row['kind']: row['count'] for row in cursor.fetchall()}
-            
-            # Issues summary
-            cursor.execute("""
-                SELECT health_status, COUNT(*) as count
-                FROM resources
-                WHERE health_status != 'healthy'
-                GROUP BY health_status
-            """)
-            issues_summary = {row['health_status']: row['count'] for row in cursor.fetchall()}
-            
-            return ClusterOverview(
-                analysis_timestamp=analysis_timestamp,
-                total_resources=total_resources,
-                total_namespaces=total_namespaces,
-                health_ratio=health_ratio,
-                top_namespaces=top_namespaces,
-                resource_distribution=resource_distribution,
-                issues_summary=issues_summary
-            )
+        
+        rows = self._resource_counts()
+        namespace_counts = self._counts_by(1)
+        namespace_counts.pop(None, None)
+        health_counts = self._counts_by(2)
+        
+        # Largest first; sorted() is stable, so ties stay in name order
+        top_namespaces = sorted(namespace_counts.items(), key=lambda item: -item[1])[:10]
+        resource_distribution = sorted(self._counts_by(0).items(), key=lambda item: -item[1])
+        
+        return ClusterOverview(
+            analysis_timestamp=analysis_timestamp,
+            total_resources=sum(row[3] for row in rows),
+            healthy_resources=health_counts.get('healthy', 0),
+            total_namespaces=len(namespace_counts),
+            top_namespaces=[{"name": name, "count": count} for name, count in top_namespaces],
+            resource_distribution=dict(resource_distribution),
+            issues_summary={
+                status: count for status, count in health_counts.items()
+                if status is not None and status != 'healthy'
+            }
+        )
     
+    def get_dashboard_bundle(self) -> Tuple[ClusterOverview, ResourceSummary]:
+        """Get the cluster overview and resource summary from one resources scan."""
+        return self.get_cluster_overview(), self.get_resource_summary()
+    
+    @cached_result
     def get_namespace_analysis(self, namespace: str) -> Optional[NamespaceAnalysis]:
         """Get detailed analysis for a specific namespace."""
         with self.get_connection() as conn:
@@ -260,6 +253,7 @@ class DatabaseClient:
                 top_resources=top_resources
             )
     
+    @cached_result
     def get_security_analysis(self) -> SecurityAnalysis:
         """Get security-focused analysis."""
         with self.get_connection() as conn:
@@ -324,7 +318,10 @@ class DatabaseClient:
             )
     
     def get_resources_dataframe(self, filters: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
-        """Get resources as pandas DataFrame for analysis."""
+        """Get resources as pandas DataFrame for analysis.
+        
+        ``health_status`` may be a single status or a sequence of statuses.
+        """
         query = "SELECT * FROM resources WHERE 1=1"
         params = []
         
@@ -335,9 +332,13 @@ class DatabaseClient:
             if filters.get('kind'):
                 query += " AND kind = ?"
                 params.append(filters['kind'])
-            if filters.get('health_status'):
+            health_status = filters.get('health_status')
+            if health_status and isinstance(health_status, (list, tuple, set)):
+                query += f" AND health_status IN ({', '.join('?' * len(health_status))})"
+                params.extend(health_status)
+            elif health_status:
                 query += " AND health_status = ?"
-                params.append(filters['health_status'])
+                params.append(health_status)
         
         with self.get_connection() as conn:
             return pd.read_sql_query(query, conn, params=params)
@@ -415,6 +416,7 @@ class DatabaseClient:
             
             return [dict(row) for row in cursor.fetchall()]
     
+    @cached_result
     def get_namespace_components_view(self, namespace: str) -> Optional[NamespaceComponentsView]:
         """Get detailed components view for a specific namespace."""
         with self.get_connection() as conn:
@@ -450,9 +452,9 @@ class DatabaseClient:
                 
                 component = NamespaceComponent(
                     name=row['name'],
-                    kind=row['kind'],
-                    health_status=row['health_status'],
-                    labels=labels,
+                    kind=_intern(row['kind']),
+                    health_status=_intern(row['health_status']),
+                    labels=make_labels(labels),
                     issues=issues,
                     created_at=row['creation_timestamp']
                 )
@@ -484,10 +486,10 @@ class DatabaseClient:
                 if row['target_name']:  # Only include if target exists
                     relationship = NamespaceRelationship(
                         source_name=row['source_name'],
-                        source_kind=row['source_kind'],
+                        source_kind=_intern(row['source_kind']),
                         target_name=row['target_name'],
-                        target_kind=row['target_kind'],
-                        relationship_type=row['relationship_type'],
+                        target_kind=_intern(row['target_kind']),
+                        relationship_type=_intern(row['relationship_type']),
                         strength=row['strength'] or 1.0,
                         description=row['description']
                     )
@@ -534,49 +536,77 @@ class DatabaseClient:
                 component_groups=component_groups,
                 dependency_chains=dependency_chains,
                 orphaned_components=orphaned_components,
-                critical_components=critical_components
+                critical_components=critical_components,
+                health_distribution=Counter(comp.health_status for comp in components),
+                relationship_types=Counter(rel.relationship_type for rel in relationships)
             )
     
-    def _build_dependency_chains(self, relationships: List[NamespaceRelationship]) -> List[List[str]]:
-        """Build dependency chains from relationships."""
-        # Create adjacency list
-        graph = {}
+    def _build_dependency_chains(self, relationships: List[NamespaceRelationship],
+                                 limit: int = 10) -> List[List[str]]:
+        """Build dependency chains from relationships.
+        
+        The graph is held as integer adjacency in compressed sparse row form
+        over a table of component names, and chains are generated lazily so
+        the walk stops as soon as ``limit`` distinct chains have been found.
+        """
+        # Name table and edges as integer node ids
+        node_ids: Dict[str, int] = {}
+        edges = []
         for rel in relationships:
-            if rel.source_name not in graph:
-                graph[rel.source_name] = []
-            graph[rel.source_name].append(rel.target_name)
+            source = node_ids.setdefault(rel.source_name, len(node_ids))
+            target = node_ids.setdefault(rel.target_name, len(node_ids))
+            edges.append((source, target))
+        names = list(node_ids)
         
-        # Find chains (simplified approach - find paths of length 2+)
-        chains = []
+        # CSR adjacency: the targets of node i are indices[indptr[i]:indptr[i + 1]],
+        # in relationship order
+        indptr = array('i', [0]) * (len(names) + 1)
+        for source, _ in edges:
+            indptr[source + 1] += 1
+        for i in range(len(names)):
+            indptr[i + 1] += indptr[i]
+        indices = array('i', [0]) * len(edges)
+        next_slot = indptr[:-1]
+        for source, target in edges:
+            indices[next_slot[source]] = target
+            next_slot[source] += 1
+        
+        # Find chains (simplified approach - find paths of length 3+)
         visited = set()
         
-        def dfs_chain(node, current_chain):
-            if len(current_chain) > 1 and node in visited:
+        def walk(node: int, chain: List[int]) -> Iterator[List[int]]:
+            if len(chain) > 1 and node in visited:
                 return
             
             visited.add(node)
-            current_chain.append(node)
+            chain = chain + [node]
             
-            if node in graph:
-                for neighbor in graph[node]:
-                    dfs_chain(neighbor, current_chain.copy())
+            for i in range(indptr[node], indptr[node + 1]):
+                yield from walk(indices[i], chain)
             
-            if len(current_chain) > 2:
-                chains.append(current_chain)
+            if len(chain) > 2:
+                yield chain
         
-        # Start DFS from each node
-        for node in graph:
-            if node not in visited:
-                dfs_chain(node, [])
+        def all_chains() -> Iterator[List[int]]:
+            # Start from each node with dependencies, in order of appearance
+            for node in dict.fromkeys(source for source, _ in edges):
+                if node not in visited:
+                    yield from walk(node, [])
         
-        # Remove duplicates and keep only meaningful chains
+        # Keep the first distinct chains only
+        seen = set()
         unique_chains = []
-        for chain in chains:
-            if len(chain) >= 2 and chain not in unique_chains:
-                unique_chains.append(chain)
+        for chain in all_chains():
+            key = tuple(chain)
+            if key not in seen:
+                seen.add(key)
+                unique_chains.append([names[node] for node in chain])
+                if len(unique_chains) == limit:
+                    break
         
-        return unique_chains[:10]  # Limit to 10 chains
+        return unique_chains
     
+    @cached_result
     def get_storage_consumption(self) -> StorageConsumption:
         """Get global storage consumption analysis."""
         with self.get_connection() as conn:
@@ -593,9 +623,9 @@ class DatabaseClient:
             volumes = []
             total_capacity_gb = 0.0
             used_capacity_gb = 0.0
-            volumes_by_class = {}
+            volumes_by_class = Counter()
             capacity_by_class = {}
-            volumes_by_status = {}
+            volumes_by_status = Counter()
             unbound_pvcs = 0
             orphaned_pvs = 0
             
@@ -632,11 +662,8 @@ class DatabaseClient:
                 
                 # Extract storage class
                 storage_class = spec.get('storageClassName', 'default')
-                if storage_class not in volumes_by_class:
-                    volumes_by_class[storage_class] = 0
-                    capacity_by_class[storage_class] = 0.0
                 volumes_by_class[storage_class] += 1
-                capacity_by_class[storage_class] += capacity_gb
+                capacity_by_class[storage_class] = capacity_by_class.get(storage_class, 0.0) + capacity_gb
                 
                 # Extract access modes
                 access_modes = spec.get('accessModes', [])
@@ -652,21 +679,19 @@ class DatabaseClient:
                     if volume_status == 'pending':
                         unbound_pvcs += 1
                 
-                if volume_status not in volumes_by_status:
-                    volumes_by_status[volume_status] = 0
                 volumes_by_status[volume_status] += 1
                 
                 # Create volume object
                 volume = StorageVolume(
                     name=row['name'],
-                    namespace=row['namespace'],
-                    kind=row['kind'],
+                    namespace=_intern(row['namespace']),
+                    kind=_intern(row['kind']),
                     capacity=capacity_str,
-                    storage_class=storage_class,
+                    storage_class=_intern(storage_class),
                     access_modes=access_modes,
-                    status=volume_status,
+                    status=_intern(volume_status),
                     created_at=datetime.fromisoformat(row['creation_timestamp']) if row['creation_timestamp'] else None,
-                    labels=labels
+                    labels=make_labels(labels)
                 )
                 volumes.append(volume)
             
@@ -677,8 +702,6 @@ class DatabaseClient:
                 for v in bound_volumes if v.capacity
             )
             
-            utilization_percentage = (used_capacity_gb / total_capacity_gb * 100) if total_capacity_gb > 0 else 0
-            
             # Get top consumers (largest volumes)
             volumes.sort(key=lambda v: self._parse_storage_size(v.capacity or '0Gi'), reverse=True)
             top_consumers = volumes[:10]
@@ -687,7 +710,6 @@ class DatabaseClient:
                 total_volumes=len(volumes),
                 total_capacity_gb=total_capacity_gb,
                 used_capacity_gb=used_capacity_gb,
-                utilization_percentage=utilization_percentage,
                 volumes_by_class=volumes_by_class,
                 capacity_by_class=capacity_by_class,
                 volumes_by_status=volumes_by_status,
@@ -696,6 +718,7 @@ class DatabaseClient:
                 top_consumers=top_consumers
             )
     
+    @cached_result
     def get_namespace_storage_analysis(self, namespace: str) -> Optional[NamespaceStorageAnalysis]:
         """Get storage analysis for a specific namespace."""
         with self.get_connection() as conn:
@@ -711,9 +734,9 @@ class DatabaseClient:
             
             volumes = []
             total_capacity_gb = 0.0
-            storage_classes = {}
-            access_patterns = {}
-            volume_status = {}
+            storage_classes = Counter()
+            access_patterns = Counter()
+            volume_status = Counter()
             
             for row in cursor.fetchall():
                 spec = {}
@@ -737,25 +760,25 @@ class DatabaseClient:
                 total_capacity_gb += capacity_gb
                 
                 storage_class = spec.get('storageClassName', 'default')
-                storage_classes[storage_class] = storage_classes.get(storage_class, 0) + 1
+                storage_classes[storage_class] += 1
                 
                 access_modes = spec.get('accessModes', [])
                 for mode in access_modes:
-                    access_patterns[mode] = access_patterns.get(mode, 0) + 1
+                    access_patterns[mode] += 1
                 
                 pvc_status = status.get('phase', 'unknown').lower()
-                volume_status[pvc_status] = volume_status.get(pvc_status, 0) + 1
+                volume_status[pvc_status] += 1
                 
                 volume = StorageVolume(
                     name=row['name'],
                     namespace=namespace,
-                    kind=row['kind'],
+                    kind=_intern(row['kind']),
                     capacity=capacity_str,
-                    storage_class=storage_class,
+                    storage_class=_intern(storage_class),
                     access_modes=access_modes,
-                    status=pvc_status,
+                    status=_intern(pvc_status),
                     created_at=datetime.fromisoformat(row['creation_timestamp']) if row['creation_timestamp'] else None,
-                    labels=labels
+                    labels=make_labels(labels)
                 )
                 volumes.append(volume)
             
@@ -810,7 +833,11 @@ class DatabaseClient:
         return conversions.get(unit, value)
     
     def get_temporal_analysis(self, days_back: int = 30) -> TemporalAnalysis:
-        """Get temporal analysis of resource lifecycle patterns."""
+        """Get temporal analysis of resource lifecycle patterns.
+        
+        Not cached: resource ages are measured against the current time, so
+        a stored result would go stale even while the database is unchanged.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
@@ -819,128 +846,120 @@ class DatabaseClient:
             end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=days_back)
             
-            # Get all resources with timestamps
+            # Get all resources with timestamps; SQLite parses them into epoch
+            # seconds, UTC date and weekday so rows need no datetime objects.
+            # Unparseable timestamps come back NULL and are skipped.
             cursor.execute("""
-                SELECT name, kind, namespace, creation_timestamp, uid
+                SELECT name, kind, namespace,
+                       CAST(strftime('%s', creation_timestamp) AS INTEGER) AS created_epoch,
+                       date(creation_timestamp) AS created_date,
+                       CAST(strftime('%w', creation_timestamp) AS INTEGER) AS created_weekday
                 FROM resources
-                WHERE creation_timestamp IS NOT NULL
+                WHERE strftime('%s', creation_timestamp) IS NOT NULL
                 ORDER BY creation_timestamp
             """)
-            
-            all_resources = []
-            creation_timeline = []
+            end_epoch = end_date.timestamp()
+            
+            # Aggregates below scan these per-field columns rather than
+            # walking the row objects once per statistic
+            ages = []
+            kinds = []
+            namespaces = []
+            stages = []
+            weekdays = []
+            dates = []
             newest_resources = []
             oldest_resources = []
             stale_resources = []
             
             # Process resources
             for row in cursor.fetchall():
-                try:
-                    created_at = datetime.fromisoformat(row['creation_timestamp'])
-                    # Ensure both datetimes are timezone-aware for comparison
-                    if created_at.tzinfo is None:
-                        created_at = created_at.replace(tzinfo=timezone.utc)
-                    age_days = (end_date - created_at).days
-                    
-                    # Determine lifecycle stage
-                    if age_days <= 1:
-                        lifecycle_stage = 'new'
-                    elif age_days <= 7:
-                        lifecycle_stage = 'recent'
-                    elif age_days <= 30:
-                        lifecycle_stage = 'active'
-                    elif age_days <= 90:
-                        lifecycle_stage = 'mature'
-                    else:
-                        lifecycle_stage = 'stale'
-                    
-                    timeline_resource = ResourceTimeline(
-                        resource_name=row['name'],
-                        resource_kind=row['kind'],
-                        namespace=row['namespace'],
-                        created_at=created_at,
-                        age_days=age_days,
-                        lifecycle_stage=lifecycle_stage
-                    )
-                    
-                    all_resources.append(timeline_resource)
-                    
-                    # Build creation timeline
-                    creation_timeline.append({
-                        'date': created_at.strftime('%Y-%m-%d'),
-                        'kind': row['kind'],
-                        'namespace': row['namespace'],
-                        'count': 1
-                    })
-                    
-                    # Categorize resources
-                    if age_days <= 7:
-                        newest_resources.append(timeline_resource)
-                    elif age_days >= 90:
-                        oldest_resources.append(timeline_resource)
-                    elif age_days >= 60:  # No updates for 60+ days
-                        stale_resources.append(timeline_resource)
-                        
-                except ValueError:
+                created_epoch = row['created_epoch']
+                age_days = int((end_epoch - created_epoch) // 86400)
+                
+                # Determine lifecycle stage
+                if age_days <= 1:
+                    lifecycle_stage = 'new'
+                elif age_days <= 7:
+                    lifecycle_stage = 'recent'
+                elif age_days <= 30:
+                    lifecycle_stage = 'active'
+                elif age_days <= 90:
+                    lifecycle_stage = 'mature'
+                else:
+                    lifecycle_stage = 'stale'
+                
+                ages.append(age_days)
+                kinds.append(row['kind'])
+                namespaces.append(row['namespace'])
+                stages.append(lifecycle_stage)
+                weekdays.append(row['created_weekday'])
+                dates.append(row['created_date'])
+                
+                # Categorize resources; only these need a timeline record
+                if age_days <= 7:
+                    category = newest_resources
+                elif age_days >= 90:
+                    category = oldest_resources
+                elif age_days >= 60:  # No updates for 60+ days
+                    category = stale_resources
+                else:
                     continue
+                
+                category.append(ResourceTimeline(
+                    resource_name=row['name'],
+                    resource_kind=_intern(row['kind']),
+                    namespace=_intern(row['namespace']),
+                    created_at=datetime.fromtimestamp(created_epoch, tz=timezone.utc),
+                    age_days=age_days,
+                    lifecycle_stage=lifecycle_stage
+                ))
             
             # Aggregate creation timeline by day
             timeline_by_date = {}
-            for entry in creation_timeline:
-                date = entry['date']
-                if date not in timeline_by_date:
-                    timeline_by_date[date] = {'date': date, 'total': 0, 'by_kind': {}}
-                timeline_by_date[date]['total'] += 1
-                kind = entry['kind']
-                if kind not in timeline_by_date[date]['by_kind']:
-                    timeline_by_date[date]['by_kind'][kind] = 0
-                timeline_by_date[date]['by_kind'][kind] += 1
+            for (date, kind), count in Counter(zip(dates, kinds)).items():
+                entry = timeline_by_date.setdefault(date, {'date': date, 'total': 0, 'by_kind': {}})
+                entry['total'] += count
+                entry['by_kind'][kind] = count
             
             aggregated_timeline = list(timeline_by_date.values())
             aggregated_timeline.sort(key=lambda x: x['date'])
             
-            # Age distribution
+            # Age distribution; the buckets share the lifecycle stage thresholds
+            stage_counts = Counter(stages)
             age_distribution = {
-                'new (0-1 days)': len([r for r in all_resources if r.age_days <= 1]),
-                'recent (2-7 days)': len([r for r in all_resources if 1 < r.age_days <= 7]),
-                'active (8-30 days)': len([r for r in all_resources if 7 < r.age_days <= 30]),
-                'mature (31-90 days)': len([r for r in all_resources if 30 < r.age_days <= 90]),
-                'stale (90+ days)': len([r for r in all_resources if r.age_days > 90])
+                'new (0-1 days)': stage_counts['new'],
+                'recent (2-7 days)': stage_counts['recent'],
+                'active (8-30 days)': stage_counts['active'],
+                'mature (31-90 days)': stage_counts['mature'],
+                'stale (90+ days)': stage_counts['stale']
             }
             
             # Most active namespaces (by resource creation)
-            namespace_activity = {}
-            for resource in all_resources:
-                if resource.namespace:
-                    namespace_activity[resource.namespace] = namespace_activity.get(resource.namespace, 0) + 1
-            
+            namespace_activity = Counter(ns for ns in namespaces if ns)
             most_active_namespaces = [
                 {'namespace': ns, 'resource_count': count}
-                for ns, count in sorted(namespace_activity.items(), key=lambda x: x[1], reverse=True)[:10]
+                for ns, count in namespace_activity.most_common(10)
             ]
             
-            # Creation patterns (by day of week)
-            creation_patterns = {}
-            for resource in all_resources:
-                day_of_week = resource.created_at.strftime('%A')
-                creation_patterns[day_of_week] = creation_patterns.get(day_of_week, 0) + 1
+            # Creation patterns (by day of week); SQLite's weekday numbers are
+            # counted and each day is named once rather than once per row
+            creation_patterns = {_WEEKDAYS[day]: count for day, count in Counter(weekdays).items()}
             
             # Resource lifecycle stats (average age by type)
-            resource_lifecycle_stats = {}
-            for resource in all_resources:
-                kind = resource.resource_kind
-                if kind not in resource_lifecycle_stats:
-                    resource_lifecycle_stats[kind] = {'ages': [], 'avg_age': 0.0, 'count': 0}
-                resource_lifecycle_stats[kind]['ages'].append(resource.age_days)
-                resource_lifecycle_stats[kind]['count'] += 1
-            
-            # Calculate averages
-            for kind, stats in resource_lifecycle_stats.items():
-                if stats['ages']:
-                    stats['avg_age'] = sum(stats['ages']) / len(stats['ages'])
-                    stats['min_age'] = min(stats['ages'])
-                    stats['max_age'] = max(stats['ages'])
-                    del stats['ages']  # Remove raw data
+            ages_by_kind = {}
+            for kind, age in zip(kinds, ages):
+                ages_by_kind.setdefault(kind, []).append(age)
+            
+            resource_lifecycle_stats = {
+                kind: {
+                    'avg_age': sum(kind_ages) / len(kind_ages),
+                    'count': len(kind_ages),
+                    'min_age': min(kind_ages),
+                    'max_age': max(kind_ages)
+                }
+                for kind, kind_ages in ages_by_kind.items()
+            }
             
             # Sort lists by relevance
             newest_resources.sort(key=lambda x: x.age_days)
@@ -949,7 +968,7 @@ class DatabaseClient:
             
             return TemporalAnalysis(
                 analysis_period=f"Last {days_back} days",
-                total_resources=len(all_resources),
+                total_resources=len(ages),
                 creation_timeline=aggregated_timeline,
                 update_timeline=[],  # Would need update tracking in schema
                 age_distribution=age_distribution,
@@ -998,6 +1017,7 @@ class DatabaseClient:
             
             return timeline
     
+    @cached_result
     def get_resource_efficiency(self) -> ResourceEfficiency:
         """Get resource efficiency analysis including pods without requests/limits."""
         with self.get_connection() as conn:
@@ -1108,11 +1128,11 @@ class DatabaseClient:
                         
                         pod_issue = PodResourceIssue(
                             name=row['name'],
-                            namespace=row['namespace'],
+                            namespace=_intern(row['namespace']),
                             containers=container_names,
                             missing_requests=pod_missing_requests,
                             missing_limits=pod_missing_limits,
-                            health_status=row['health_status'],
+                            health_status=_intern(row['health_status']),
                             created_at=datetime.fromisoformat(row['creation_timestamp']) if row['creation_timestamp'] else None,
                             issue_severity=severity,
                             recommendations=recommendations
@@ -1170,6 +1190,7 @@ class DatabaseClient:
                 total_pods_analyzed=total_pods_analyzed
             )
     
+    @cached_result
     def get_label_analysis(self) -> 'LabelAnalysis':
         """Get analysis of resource labeling patterns."""
         with self.get_connection() as conn:
@@ -1188,11 +1209,9 @@ class DatabaseClient:
             total_unlabeled = result[1]
             total_resources = result[2]
             
-            coverage_percentage = (total_labeled / total_resources * 100) if total_resources > 0 else 0
-            
             # Extract common labels
             cursor.execute("SELECT labels FROM resources WHERE labels IS NOT NULL AND labels != '{}'")
-            common_labels = {}
+            common_labels = Counter()
             label_values_distribution = {}
             resources_by_label = {}
             
@@ -1201,7 +1220,7 @@ class DatabaseClient:
                     labels = json.loads(row[0])
                     for key, value in labels.items():
                         # Count label occurrences
-                        common_labels[key] = common_labels.get(key, 0) + 1
+                        common_labels[key] += 1
                         
                         # Track value distributions
                         if key not in label_values_distribution:
@@ -1269,7 +1288,6 @@ class DatabaseClient:
             return LabelAnalysis(
                 total_labeled_resources=total_labeled,
                 total_unlabeled_resources=total_unlabeled,
-                label_coverage_percentage=coverage_percentage,
                 common_labels=common_labels,
                 label_values_distribution=label_values_distribution,
                 resources_by_label=resources_by_label,
@@ -1277,6 +1295,7 @@ class DatabaseClient:
                 label_quality_score=label_quality_score
             )
     
+    @cached_result
     def get_application_viewpoint(self) -> 'ApplicationViewpoint':
         """Get application-centric view based on app.kubernetes.io labels."""
         with self.get_connection() as conn:
@@ -1394,6 +1413,7 @@ class DatabaseClient:
                 multi_app_resources=multi_app_resources
             )
     
+    @cached_result
     def get_environment_viewpoint(self) -> 'EnvironmentViewpoint':
         """Get environment-based view using environment labels."""
         with self.get_connection() as conn:
@@ -1406,7 +1426,7 @@ class DatabaseClient:
             """)
             
             environments = set()
-            resources_by_environment = {}
+            resources_by_environment = Counter()
             environment_health = {}
             environment_namespaces = {}
             environment_applications = {}
@@ -1436,7 +1456,7 @@ class DatabaseClient:
                         environments.add(env_name)
                         
                         # Count resources by environment
-                        resources_by_environment[env_name] = resources_by_environment.get(env_name, 0) + 1
+                        resources_by_environment[env_name] += 1
                         
                         # Track health by environment
                         if env_name not in environment_health:
@@ -1493,6 +1513,7 @@ class DatabaseClient:
                 environment_compliance=environment_compliance
             )
     
+    @cached_result
     def get_team_ownership_viewpoint(self) -> 'TeamOwnershipViewpoint':
         """Get team/ownership view based on ownership labels."""
         with self.get_connection() as conn:
@@ -1505,7 +1526,7 @@ class DatabaseClient:
             """)
             
             teams = set()
-            team_resources = {}
+            team_resources = Counter()
             team_namespaces = {}
             team_applications = {}
             unowned_resources = []
@@ -1535,7 +1556,7 @@ class DatabaseClient:
                         teams.add(team_name)
                         
                         # Count resources by team
-                        team_resources[team_name] = team_resources.get(team_name, 0) + 1
+                        team_resources[team_name] += 1
                         
                         # Track namespaces by team
                         if team_name not in team_namespaces:
@@ -1594,6 +1615,7 @@ class DatabaseClient:
                 ownership_coverage=ownership_coverage
             )
     
+    @cached_result
     def get_cost_optimization_viewpoint(self) -> 'CostOptimizationViewpoint':
         """Get cost optimization view based on cost-related labels."""
         with self.get_connection() as conn:
@@ -1606,7 +1628,7 @@ class DatabaseClient:
             """)
             
             cost_centers = set()
-            cost_center_resources = {}
+            cost_center_resources = Counter()
             cost_center_storage = {}
             cost_center_namespaces = {}
             untagged_for_billing = []
@@ -1636,7 +1658,7 @@ class DatabaseClient:
                         cost_centers.add(cost_center)
                         
                         # Count resources by cost center
-                        cost_center_resources[cost_center] = cost_center_resources.get(cost_center, 0) + 1
+                        cost_center_resources[cost_center] += 1
                         
                         # Track namespaces by cost center
                         if cost_center not in cost_center_namespaces:
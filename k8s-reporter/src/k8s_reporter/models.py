@@ -4,49 +4,108 @@ Data models for k8s-reporter.
 These models define the structure for various analysis views and reports.
 """
 
-from dataclasses import dataclass
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, Iterator, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, SkipValidation, computed_field
+from typing_extensions import TypedDict  # pydantic requires it over typing's before 3.12
 
+# Slotted dataclasses need Python 3.10+; fall back to regular ones on 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-class ResourceSummary(BaseModel):
+# Count maps are built by DatabaseClient (usually as Counters) from query
+# results, so per-entry validation of their keys and values is skipped
+CountMap = Annotated[Dict[str, int], SkipValidation]
+
+# Labels/annotations of per-row records: sorted (key, value) pairs of interned
+# strings, since the same few keys and values repeat across most resources
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+def make_labels(labels: Optional[Mapping[str, str]]) -> LabelSet:
+    """Convert a labels mapping into a LabelSet."""
+    if not labels:
+        return ()
+    return tuple(sorted((sys.intern(str(k)), sys.intern(str(v))) for k, v in labels.items()))
+
+
+class _ReportModel(BaseModel):
+    """Base for report models.
+    
+    Validators are built on first use rather than at import, since a session
+    usually renders only a few views. Models are read-only once built.
+    
+    Per-row records built in bulk from trusted database rows (components,
+    volumes, timelines, ...) are plain dataclasses instead; pydantic accepts
+    their instances as-is when they are nested in these models.
+    """
+    
+    model_config = ConfigDict(defer_build=True, extra="ignore", frozen=True)
+
+
+def _read_only(mapping: Mapping) -> Mapping:
+    """Copy a mapping into a read-only view.
+    
+    The dataclass summaries below are cached and shared between sessions, so
+    they keep their mappings this way and their lists as tuples.
+    """
+    return MappingProxyType(dict(mapping))
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ResourceSummary:
     """Summary of resource counts and health status."""
     
     total_resources: int
     total_relationships: int
-    health_distribution: Dict[str, int]
-    resource_types: Dict[str, int]
+    health_distribution: Mapping[str, int]
+    resource_types: Mapping[str, int]
     namespaces_count: int
     issues_count: int
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'health_distribution', _read_only(self.health_distribution))
+        object.__setattr__(self, 'resource_types', _read_only(self.resource_types))
 
 
-class NamespaceAnalysis(BaseModel):
+@dataclass(frozen=True, **_SLOTS)
+class NamespaceAnalysis:
     """Analysis of a specific namespace."""
     
     name: str
     resource_count: int
-    resource_types: Dict[str, int]
-    health_distribution: Dict[str, int]
+    resource_types: Mapping[str, int]
+    health_distribution: Mapping[str, int]
     issues_count: int
     relationships_count: int
-    top_resources: List[Dict[str, str]]
+    top_resources: Tuple[Mapping[str, str], ...]
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'resource_types', _read_only(self.resource_types))
+        object.__setattr__(self, 'health_distribution', _read_only(self.health_distribution))
+        object.__setattr__(self, 'top_resources', tuple(map(_read_only, self.top_resources)))
 
 
-class NamespaceComponent(BaseModel):
+@dataclass(frozen=True, **_SLOTS)
+class NamespaceComponent:
     """Individual component within a namespace."""
     
     name: str
     kind: str
     health_status: str
-    labels: Dict[str, str] = {}
-    annotations: Dict[str, str] = {}
-    issues: List[str] = []
+    labels: LabelSet = ()
+    annotations: LabelSet = ()
+    issues: List[str] = field(default_factory=list)
     created_at: Optional[str] = None
     
 
-class NamespaceRelationship(BaseModel):
+@dataclass(frozen=True, **_SLOTS)
+class NamespaceRelationship:
     """Relationship between components in a namespace."""
     
     source_name: str
@@ -58,7 +117,7 @@ class NamespaceRelationship(BaseModel):
     description: Optional[str] = None
 
 
-class NamespaceComponentsView(BaseModel):
+class NamespaceComponentsView(_ReportModel):
     """Detailed view of namespace components and their relationships."""
     
     namespace: str
@@ -69,22 +128,51 @@ class NamespaceComponentsView(BaseModel):
     dependency_chains: List[List[str]]  # Ordered dependency chains
     orphaned_components: List[str]  # Components with no relationships
     critical_components: List[str]  # Components with many relationships
+    health_distribution: CountMap  # Components by health status
+    relationship_types: CountMap  # Relationships by type
+
 
+class NamespaceStat(TypedDict):
+    """Resource count of a namespace."""
+    
+    name: str
+    count: int
 
-class ClusterOverview(BaseModel):
+
+class NamespaceActivity(TypedDict):
+    """Number of resources created in a namespace."""
+    
+    namespace: str
+    resource_count: int
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ClusterOverview:
     """High-level cluster overview."""
     
-    cluster_name: Optional[str] = None
     analysis_timestamp: datetime
     total_resources: int
+    healthy_resources: int  # Status 'healthy' only; NULL statuses are not counted
     total_namespaces: int
-    health_ratio: float  # Percentage of healthy resources
-    top_namespaces: List[Dict[str, Union[str, int]]]  # Allow both str and int values
-    resource_distribution: Dict[str, int]
-    issues_summary: Dict[str, int]
+    top_namespaces: Tuple[NamespaceStat, ...]  # Stored as read-only mappings
+    resource_distribution: Mapping[str, int]
+    issues_summary: Mapping[str, int]  # Counts of every non-healthy status
+    cluster_name: Optional[str] = None
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'top_namespaces', tuple(map(_read_only, self.top_namespaces)))
+        object.__setattr__(self, 'resource_distribution', _read_only(self.resource_distribution))
+        object.__setattr__(self, 'issues_summary', _read_only(self.issues_summary))
+    
+    @property
+    def health_ratio(self) -> float:
+        """Percentage of healthy resources."""
+        if not self.total_resources:
+            return 0.0
+        return self.healthy_resources * 100.0 / self.total_resources
 
 
-class SecurityAnalysis(BaseModel):
+class SecurityAnalysis(_ReportModel):
     """Security-focused analysis of the cluster."""
     
     privileged_pods: int
@@ -97,7 +185,8 @@ class SecurityAnalysis(BaseModel):
     config_maps_count: int
 
 
-class PodResourceIssue(BaseModel):
+@dataclass(frozen=True, **_SLOTS)
+class PodResourceIssue:
     """Pod with resource configuration issues."""
     
     name: str
@@ -106,13 +195,13 @@ class PodResourceIssue(BaseModel):
     missing_requests: List[str]  # cpu, memory
     missing_limits: List[str]   # cpu, memory
     health_status: str
+    issue_severity: str  # low, medium, high, critical
     created_at: Optional[datetime] = None
     node: Optional[str] = None
-    issue_severity: str  # low, medium, high, critical
-    recommendations: List[str] = []
+    recommendations: List[str] = field(default_factory=list)
 
 
-class ResourceEfficiency(BaseModel):
+class ResourceEfficiency(_ReportModel):
     """Resource efficiency and optimization insights."""
     
     pods_without_limits: int
@@ -128,7 +217,7 @@ class ResourceEfficiency(BaseModel):
     total_pods_analyzed: int
 
 
-class ComplianceReport(BaseModel):
+class ComplianceReport(_ReportModel):
     """Compliance and best practices report."""
     
     total_checks: int
@@ -140,92 +229,115 @@ class ComplianceReport(BaseModel):
     recommendations: List[str]
 
 
-class StorageVolume(BaseModel):
+@dataclass(frozen=True, **_SLOTS)
+class StorageVolume:
     """Individual storage volume information."""
     
     name: str
-    namespace: Optional[str] = None
     kind: str  # PV, PVC, etc.
+    status: str
+    namespace: Optional[str] = None
     capacity: Optional[str] = None
     storage_class: Optional[str] = None
-    access_modes: List[str] = []
-    status: str
+    access_modes: List[str] = field(default_factory=list)
     bound_to: Optional[str] = None  # For PVC -> PV binding
     created_at: Optional[datetime] = None
-    labels: Dict[str, str] = {}
+    labels: LabelSet = ()
 
 
-class StorageConsumption(BaseModel):
+class StorageConsumption(_ReportModel):
     """Storage consumption analysis."""
     
     total_volumes: int
     total_capacity_gb: float
     used_capacity_gb: float
-    utilization_percentage: float
-    volumes_by_class: Dict[str, int]
+    volumes_by_class: CountMap
     capacity_by_class: Dict[str, float]
-    volumes_by_status: Dict[str, int]
+    volumes_by_status: CountMap
     unbound_pvcs: int
     orphaned_pvs: int
     top_consumers: List[StorageVolume]
+    
+    @computed_field
+    @property
+    def utilization_percentage(self) -> float:
+        """Used capacity as a percentage of total capacity."""
+        if self.total_capacity_gb <= 0:
+            return 0.0
+        return self.used_capacity_gb / self.total_capacity_gb * 100
 
 
-class NamespaceStorageAnalysis(BaseModel):
+class NamespaceStorageAnalysis(_ReportModel):
     """Per-namespace storage analysis."""
     
     namespace: str
     total_volumes: int
     total_capacity_gb: float
-    storage_classes: Dict[str, int]
-    access_patterns: Dict[str, int]  # ReadWriteOnce, ReadOnlyMany, etc.
-    volume_status: Dict[str, int]
+    storage_classes: CountMap
+    access_patterns: CountMap  # ReadWriteOnce, ReadOnlyMany, etc.
+    volume_status: CountMap
     volumes: List[StorageVolume]
     largest_volumes: List[StorageVolume]
 
 
-class ResourceTimeline(BaseModel):
+class TimelineEvent(TypedDict):
+    """Lifecycle event of a resource."""
+    
+    timestamp: datetime
+    action: str  # created, updated, deleted, ...
+    message: Optional[str]
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ResourceTimeline:
     """Timeline data for resource lifecycle events."""
     
     resource_name: str
     resource_kind: str
-    namespace: Optional[str] = None
     created_at: datetime
-    updated_at: Optional[datetime] = None
-    events: List[Dict[str, Any]] = []  # Timeline events
-    age_days: float
+    age_days: int  # Whole days (timedelta.days)
     lifecycle_stage: str  # new, active, stale, etc.
+    namespace: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    events: List[TimelineEvent] = field(default_factory=list)
 
 
-class TemporalAnalysis(BaseModel):
+class TemporalAnalysis(_ReportModel):
     """Temporal analysis of cluster resources."""
     
     analysis_period: str  # Description of time period analyzed
     total_resources: int
     creation_timeline: List[Dict[str, Any]]  # Resources created over time
     update_timeline: List[Dict[str, Any]]  # Resources updated over time
-    age_distribution: Dict[str, int]  # Resources by age groups
-    most_active_namespaces: List[Dict[str, Union[str, int]]]
+    age_distribution: CountMap  # Resources by age groups
+    most_active_namespaces: List[NamespaceActivity]
     newest_resources: List[ResourceTimeline]
     oldest_resources: List[ResourceTimeline]
     stale_resources: List[ResourceTimeline]  # Not updated recently
-    creation_patterns: Dict[str, int]  # Creation by day of week, hour, etc.
+    creation_patterns: CountMap  # Creation by day of week, hour, etc.
     resource_lifecycle_stats: Dict[str, Dict[str, float]]  # Avg age by type
 
 
-class LabelAnalysis(BaseModel):
+class LabelAnalysis(_ReportModel):
     """Analysis of resources grouped by metadata labels."""
     
     total_labeled_resources: int
     total_unlabeled_resources: int
-    label_coverage_percentage: float
-    common_labels: Dict[str, int]  # label key -> count of resources with this label
+    common_labels: CountMap  # label key -> count of resources with this label
     label_values_distribution: Dict[str, Dict[str, int]]  # label key -> {value -> count}
     resources_by_label: Dict[str, List[Dict[str, Any]]]  # label key -> list of resources
     orphaned_resources: List[Dict[str, Any]]  # resources without common organizational labels
     label_quality_score: float  # Overall labeling quality percentage
+    
+    @computed_field
+    @property
+    def label_coverage_percentage(self) -> float:
+        """Labeled resources as a percentage of all resources."""
+        total = self.total_labeled_resources + self.total_unlabeled_resources
+        return self.total_labeled_resources / total * 100 if total > 0 else 0.0
 
 
-class ApplicationViewpoint(BaseModel):
+class ApplicationViewpoint(_ReportModel):
     """Application-centric view based on app.kubernetes.io labels."""
     
     total_applications: int
@@ -238,11 +350,11 @@ class ApplicationViewpoint(BaseModel):
     multi_app_resources: List[Dict[str, Any]]  # resources belonging to multiple apps
 
 
-class EnvironmentViewpoint(BaseModel):
+class EnvironmentViewpoint(_ReportModel):
     """Environment-based view using environment labels."""
     
     environments: List[str]  # detected environments (prod, staging, dev, etc.)
-    resources_by_environment: Dict[str, int]  # env -> resource count
+    resources_by_environment: CountMap  # env -> resource count
     environment_health: Dict[str, Dict[str, int]]  # env -> {health_status -> count}
     environment_namespaces: Dict[str, List[str]]  # env -> namespaces
     environment_applications: Dict[str, List[str]]  # env -> applications
@@ -250,11 +362,11 @@ class EnvironmentViewpoint(BaseModel):
     environment_compliance: Dict[str, float]  # env -> compliance percentage
 
 
-class TeamOwnershipViewpoint(BaseModel):
+class TeamOwnershipViewpoint(_ReportModel):
     """Team/ownership view based on ownership labels."""
     
     teams: List[str]  # detected teams
-    team_resources: Dict[str, int]  # team -> resource count
+    team_resources: CountMap  # team -> resource count
     team_namespaces: Dict[str, List[str]]  # team -> namespaces they own
     team_applications: Dict[str, List[str]]  # team -> applications they own
     unowned_resources: List[Dict[str, Any]]  # resources without ownership labels
@@ -263,11 +375,11 @@ class TeamOwnershipViewpoint(BaseModel):
     ownership_coverage: float  # percentage of resources with ownership labels
 
 
-class CostOptimizationViewpoint(BaseModel):
+class CostOptimizationViewpoint(_ReportModel):
     """Cost optimization view based on cost-related labels."""
     
     cost_centers: List[str]  # detected cost centers
-    cost_center_resources: Dict[str, int]  # cost center -> resource count
+    cost_center_resources: CountMap  # cost center -> resource count
     cost_center_storage: Dict[str, float]  # cost center -> storage consumption (GB)
     cost_center_namespaces: Dict[str, List[str]]  # cost center -> namespaces
     untagged_for_billing: List[Dict[str, Any]]  # resources missing cost/billing labels
@@ -275,7 +387,7 @@ class CostOptimizationViewpoint(BaseModel):
     billing_coverage: float  # percentage of resources with cost/billing labels
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ViewConfig:
     """Configuration for different analysis views."""
     
@@ -289,149 +401,129 @@ class ViewConfig:
 class AnalysisView:
     """Base class for different analysis views."""
     
+    __slots__ = ("name", "config", "_title")
+    
     def __init__(self, name: str, config: ViewConfig):
         self.name = name
         self.config = config
+        # ViewConfig is frozen, so the title can be formatted once
+        self._title = f"{config.icon} {config.title}"
     
     def get_title(self) -> str:
-        return f"{self.config.icon} {self.config.title}"
+        return self._title
     
     def get_description(self) -> str:
         return self.config.description
 
 
-# Predefined analysis views
-ANALYSIS_VIEWS = {
-    "overview": AnalysisView(
-        "overview",
-        ViewConfig(
-            title="Cluster Overview",
-            description="High-level cluster health and resource distribution",
-            icon="🏠",
-        )
+# Predefined analysis views as ViewConfig arguments; see ANALYSIS_VIEWS
+_VIEW_SPECS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    "overview": dict(
+        title="Cluster Overview",
+        description="High-level cluster health and resource distribution",
+        icon="🏠",
     ),
-    "security": AnalysisView(
-        "security", 
-        ViewConfig(
-            title="Security Analysis",
-            description="Security posture and RBAC analysis",
-            icon="🔒",
-        )
+    "security": dict(
+        title="Security Analysis",
+        description="Security posture and RBAC analysis",
+        icon="🔒",
     ),
-    "efficiency": AnalysisView(
-        "efficiency",
-        ViewConfig(
-            title="Resource Efficiency", 
-            description="Resource utilization and optimization opportunities",
-            icon="⚡",
-        )
+    "efficiency": dict(
+        title="Resource Efficiency", 
+        description="Resource utilization and optimization opportunities",
+        icon="⚡",
     ),
-    "compliance": AnalysisView(
-        "compliance",
-        ViewConfig(
-            title="Compliance Report",
-            description="Best practices and policy compliance",
-            icon="✅",
-        )
+    "compliance": dict(
+        title="Compliance Report",
+        description="Best practices and policy compliance",
+        icon="✅",
     ),
-    "namespaces": AnalysisView(
-        "namespaces",
-        ViewConfig(
-            title="Namespace Analysis",
-            description="Per-namespace resource breakdown and health",
-            icon="🏷️",
-            requires_namespace_filter=True,
-        )
+    "namespaces": dict(
+        title="Namespace Analysis",
+        description="Per-namespace resource breakdown and health",
+        icon="🏷️",
+        requires_namespace_filter=True,
     ),
-    "relationships": AnalysisView(
-        "relationships",
-        ViewConfig(
-            title="Resource Relationships",
-            description="Resource dependencies and interconnections",
-            icon="🔗",
-        )
+    "relationships": dict(
+        title="Resource Relationships",
+        description="Resource dependencies and interconnections",
+        icon="🔗",
     ),
-    "namespace_components": AnalysisView(
-        "namespace_components",
-        ViewConfig(
-            title="Namespace Components",
-            description="Detailed per-namespace component analysis with relationships",
-            icon="🏗️",
-            requires_namespace_filter=False,  # We handle namespace selection internally
-        )
+    "namespace_components": dict(
+        title="Namespace Components",
+        description="Detailed per-namespace component analysis with relationships",
+        icon="🏗️",
+        requires_namespace_filter=False,  # We handle namespace selection internally
     ),
-    "health": AnalysisView(
-        "health",
-        ViewConfig(
-            title="Health Dashboard",
-            description="Resource health status and issues tracking",
-            icon="❤️",
-        )
+    "health": dict(
+        title="Health Dashboard",
+        description="Resource health status and issues tracking",
+        icon="❤️",
     ),
-    "trends": AnalysisView(
-        "trends",
-        ViewConfig(
-            title="Trends Analysis",
-            description="Historical trends and changes over time",
-            icon="📈",
-            supports_time_range=True,
-        )
+    "trends": dict(
+        title="Trends Analysis",
+        description="Historical trends and changes over time",
+        icon="📈",
+        supports_time_range=True,
     ),
-    "storage": AnalysisView(
-        "storage",
-        ViewConfig(
-            title="Storage Analysis",
-            description="Storage consumption and volume analysis",
-            icon="💾",
-        )
+    "storage": dict(
+        title="Storage Analysis",
+        description="Storage consumption and volume analysis",
+        icon="💾",
     ),
-    "temporal": AnalysisView(
-        "temporal",
-        ViewConfig(
-            title="Temporal Analysis",
-            description="Resource lifecycle and creation patterns over time",
-            icon="⏰",
-            supports_time_range=True,
-        )
+    "temporal": dict(
+        title="Temporal Analysis",
+        description="Resource lifecycle and creation patterns over time",
+        icon="⏰",
+        supports_time_range=True,
     ),
-    "labels": AnalysisView(
-        "labels",
-        ViewConfig(
-            title="Label Analysis",
-            description="Resource organization and labeling patterns",
-            icon="🏷️",
-        )
+    "labels": dict(
+        title="Label Analysis",
+        description="Resource organization and labeling patterns",
+        icon="🏷️",
     ),
-    "applications": AnalysisView(
-        "applications",
-        ViewConfig(
-            title="Application View",
-            description="Application-centric analysis based on app.kubernetes.io labels",
-            icon="🚀",
-        )
+    "applications": dict(
+        title="Application View",
+        description="Application-centric analysis based on app.kubernetes.io labels",
+        icon="🚀",
     ),
-    "environments": AnalysisView(
-        "environments",
-        ViewConfig(
-            title="Environment View",
-            description="Environment-based resource organization and health",
-            icon="🌍",
-        )
+    "environments": dict(
+        title="Environment View",
+        description="Environment-based resource organization and health",
+        icon="🌍",
     ),
-    "team_ownership": AnalysisView(
-        "team_ownership",
-        ViewConfig(
-            title="Team Ownership",
-            description="Team-based resource ownership and responsibilities",
-            icon="👥",
-        )
+    "team_ownership": dict(
+        title="Team Ownership",
+        description="Team-based resource ownership and responsibilities",
+        icon="👥",
     ),
-    "cost_optimization": AnalysisView(
-        "cost_optimization",
-        ViewConfig(
-            title="Cost Optimization",
-            description="Cost center analysis and optimization opportunities",
-            icon="💰",
-        )
+    "cost_optimization": dict(
+        title="Cost Optimization",
+        description="Cost center analysis and optimization opportunities",
+        icon="💰",
     ),
-}
+})
+
+
+@lru_cache(maxsize=None)
+def get_view(name: str) -> AnalysisView:
+    """Get the predefined analysis view ``name``, building it on first use."""
+    return AnalysisView(name, ViewConfig(**_VIEW_SPECS[name]))
+
+
+class _LazyViews(Mapping):
+    """Read-only mapping of view name to AnalysisView, built on access."""
+    
+    __slots__ = ()
+    
+    def __getitem__(self, name: str) -> AnalysisView:
+        return get_view(name)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_VIEW_SPECS)
+    
+    def __len__(self) -> int:
+        return len(_VIEW_SPECS)
+
+
+ANALYSIS_VIEWS = _LazyViews()
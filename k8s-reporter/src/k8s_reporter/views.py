@@ -4,15 +4,470 @@ Analysis views for k8s-reporter.
 This module contains different view implementations for various analysis perspectives.
 """
 
+import csv
+import io
 import json
+import math
+from collections import defaultdict
+from importlib.util import find_spec
+from dataclasses import fields, is_dataclass
 from datetime import datetime
 import streamlit as st
 import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Hashable, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from k8s_reporter.cache import database_fingerprint
 from k8s_reporter.database import DatabaseClient
+from k8s_reporter.models import NamespaceComponent
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# networkx and plotly.graph_objects are only needed for the relationship
+# network, so they are imported on first use rather than with this module
+_nx = None
+_go = None
+
+
+def _lazy_nx():
+    """Return the networkx module, importing it on first use."""
+    global _nx
+    if _nx is None:
+        import networkx
+        _nx = networkx
+    return _nx
+
+
+def _lazy_go():
+    """Return the plotly.graph_objects module, importing it on first use."""
+    global _go
+    if _go is None:
+        import plotly.graph_objects
+        _go = plotly.graph_objects
+    return _go
+
+# Icon and display label for each health status
+HEALTH_ICONS = {
+    'healthy': '🟢',
+    'warning': '🟡',
+    'error': '🔴',
+    'unknown': '⚪',
+}
+HEALTH_BADGE = {status: f"{icon} {status.title()}" for status, icon in HEALTH_ICONS.items()}
+
+
+# Component fields exported as they are; labels and annotations become objects
+_COMPONENT_FIELDS = tuple(field.name for field in fields(NamespaceComponent))
+
+
+def _json_default(value: Any) -> Any:
+    """Encode record dataclasses, datetimes and numpy scalars the way orjson does."""
+    if is_dataclass(value):
+        # Shallow: the encoder recurses into the field values itself, so
+        # there is no need for asdict's deep copy of every list
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _export_json(data: Any) -> bytes:
+    """Serialize an export payload as indented JSON."""
+    # Large exports go through orjson when available, falling back to json
+    # for anything it rejects
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=_json_default).encode()
+
+
+# Views decorated with _fragment rerun on their own widget events instead of
+# the whole app (st.fragment since Streamlit 1.37, experimental before that);
+# older releases render them as plain functions
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+# pyarrow is an optional speedup for string columns
+_STRING_DTYPE = 'string[pyarrow]' if find_spec('pyarrow') else None
+
+# Seconds a cached DataFrame is kept; entries are also keyed on the database
+# file's identity, so a changed file is re-read immediately
+CACHE_TTL = 300
+
+
+def _db_key(db_client: DatabaseClient) -> Hashable:
+    """Stable cache key for the database behind a client."""
+    return database_fingerprint(db_client.db_path)
+
+
+def _filters_key(filters: Dict[str, Any]) -> Tuple:
+    """Hashable form of a filters dict."""
+    return tuple(sorted(filters.items()))
+
+
+def _small_table(columns: Dict[str, Any]) -> Any:
+    """Table data for a handful of rows, given as display columns.
+    
+    Streamlit serializes a pyarrow Table as is, skipping the pandas DataFrame
+    it would otherwise build; without pyarrow the columns go through pandas.
+    """
+    if _STRING_DTYPE:
+        import pyarrow as pa
+        return pa.table(columns)
+    return pd.DataFrame(columns)
+
+
+# DataFrame queries cached across reruns. Streamlit skips hashing parameters
+# with a leading underscore, so the client is passed through and the cache is
+# keyed on db_key instead.
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _health_over_time(db_key: Hashable, _db_client: DatabaseClient) -> pd.DataFrame:
+    return _db_client.get_health_over_time()
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _namespaces(db_key: Hashable, _db_client: DatabaseClient) -> List[str]:
+    return _db_client.get_namespaces()
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=64, show_spinner=False)
+def _namespace_storage_timeline(db_key: Hashable, namespace: str, _db_client: DatabaseClient) -> pd.DataFrame:
+    return pd.DataFrame(_db_client.get_namespace_storage_timeline(namespace))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _resources_dataframe(db_key: Hashable, filters: Tuple, _db_client: DatabaseClient) -> pd.DataFrame:
+    return _db_client.get_resources_dataframe(dict(filters))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _relationships_dataframe(db_key: Hashable, filters: Tuple, _db_client: DatabaseClient) -> pd.DataFrame:
+    relationships_df = _db_client.get_relationships_dataframe(dict(filters))
+    
+    # Searched, counted and grouped text columns are stored as Arrow strings
+    # when pyarrow is available, so str.contains, nunique, value_counts and
+    # the kind matrix grouping run in Arrow kernels
+    if _STRING_DTYPE:
+        for column in (
+            'source_name', 'target_name', 'source_kind', 'target_kind',
+            'source_namespace', 'target_namespace', 'relationship_type'
+        ):
+            if column in relationships_df:
+                relationships_df[column] = relationships_df[column].astype(_STRING_DTYPE)
+    
+    return relationships_df
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _relationships_haystack(db_key: Hashable, filters: Tuple, _relationships_df: pd.DataFrame) -> pd.Series:
+    """Lower-cased searchable text of each relationship row.
+    
+    Keyed like _relationships_dataframe, so typing in the search box reuses it.
+    """
+    columns = ['source_name', 'target_name', 'source_kind', 'target_kind']
+    # One str.cat joins every column at once; the separator keeps a match
+    # from spanning two fields
+    haystack = _relationships_df[columns[0]].str.cat(
+        [_relationships_df[column] for column in columns[1:]], sep='\x1f', na_rep=''
+    )
+    return haystack.str.lower()
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _component_names_lower(db_key: Hashable, namespace: str, _components_view: Any) -> np.ndarray:
+    """Lower-cased component names of a namespace, in component order."""
+    return np.array([comp.name.lower() for comp in _components_view.components], dtype=str)
+
+
+# Largest relationship graph laid out and drawn in the components view; a
+# spring layout is quadratic in the node count and denser graphs are unreadable
+MAX_NETWORK_NODES = 150
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _network_layout(nodes: Tuple[str, ...], edges: Tuple[Tuple[str, str], ...]) -> Dict[str, Tuple[float, float]]:
+    """Compute deterministic spring-layout positions for a relationship graph."""
+    nx = _lazy_nx()
+    G = nx.DiGraph()
+    G.add_nodes_from(nodes)
+    G.add_edges_from(edges)
+    
+    try:
+        if len(G) > 50:
+            pos = nx.spring_layout(G, k=3 / math.sqrt(len(G)), iterations=30, seed=0)
+        else:
+            pos = nx.spring_layout(G, k=3, iterations=50, seed=0)
+    except Exception:
+        pos = nx.random_layout(G, seed=0)
+    
+    return {node: (float(x), float(y)) for node, (x, y) in pos.items()}
+
+
+# Largest relationship network drawn with a text label on each node
+MAX_LABELED_NODES = 50
+
+# Color mapping for different component types in the relationship network
+KIND_COLORS = {
+    'Pod': '#1f77b4',
+    'Service': '#ff7f0e',
+    'ConfigMap': '#2ca02c',
+    'PersistentVolumeClaim': '#d62728',
+    'Secret': '#9467bd',
+    'Ingress': '#8c564b',
+    'ServiceAccount': '#e377c2'
+}
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def _build_components_figure(namespace: str, sig: Tuple[Tuple, Tuple]) -> Tuple['go.Figure', int]:
+    """Build the relationship network figure of a namespace.
+    
+    ``sig`` holds (name, kind, health_status) per component and (source, target,
+    relationship_type) per relationship. Returns the figure and the node count
+    of the full graph, which exceeds the drawn nodes when the graph is capped.
+    """
+    nx = _lazy_nx()
+    go = _lazy_go()
+    components, relationships = sig
+    
+    # First component wins when names repeat
+    by_name = {name: (kind, health) for name, kind, health in reversed(components)}
+    
+    # Create a force-directed graph visualization
+    G = nx.DiGraph()
+    for source, target, relationship in relationships:
+        G.add_edge(source, target, relationship=relationship)
+    
+    # Keep only the most connected components of large graphs
+    total_nodes = G.number_of_nodes()
+    if total_nodes > MAX_NETWORK_NODES:
+        degrees = dict(G.degree())
+        keep = sorted(sorted(degrees), key=degrees.get, reverse=True)[:MAX_NETWORK_NODES]
+        G = G.subgraph(keep).copy()
+    
+    # Create layout
+    pos = _network_layout(tuple(sorted(G.nodes())), tuple(sorted(G.edges())))
+    
+    # Create plotly figure; each edge is a (source, target, NaN) segment,
+    # the NaN breaking the line between consecutive edges
+    graph_edges = list(G.edges())
+    segments = np.full((len(graph_edges), 3, 2), np.nan)
+    if graph_edges:
+        segments[:, 0] = [pos[source] for source, _ in graph_edges]
+        segments[:, 1] = [pos[target] for _, target in graph_edges]
+    edge_x, edge_y = segments.reshape(-1, 2).T
+    
+    # WebGL traces keep large graphs responsive in the browser
+    edge_trace = go.Scattergl(
+        x=edge_x, y=edge_y,
+        line=dict(width=2, color='#888'),
+        hoverinfo='none',
+        mode='lines'
+    )
+    
+    node_text = list(G.nodes())
+    node_x, node_y = np.array([pos[node] for node in node_text]).reshape(-1, 2).T
+    node_info = []
+    node_colors = []
+    
+    for node in node_text:
+        # Get component details
+        if node in by_name:
+            kind, health = by_name[node]
+            node_info.append(f"{node}<br>Type: {kind}<br>Health: {health}")
+            node_colors.append(KIND_COLORS.get(kind, '#636efa'))
+        else:
+            node_info.append(f"{node}<br>Type: Unknown")
+            node_colors.append('#636efa')
+    
+    # Labels on every node only stay readable on small graphs; larger ones
+    # rely on the hover text
+    node_trace = go.Scattergl(
+        x=node_x, y=node_y,
+        mode='markers+text' if len(node_text) <= MAX_LABELED_NODES else 'markers',
+        hoverinfo='text',
+        text=node_text,
+        textposition="middle center",
+        hovertext=node_info,
+        marker=dict(
+            size=20,
+            color=node_colors,
+            line=dict(width=2, color='white')
+        )
+    )
+    
+    fig_network = go.Figure(data=[edge_trace, node_trace],
+                            layout=go.Layout(
+                                title=dict(text=f"Component Relationships in {namespace}", font=dict(size=16)),
+                                showlegend=False,
+                                hovermode='closest',
+                                margin=dict(b=20,l=5,r=5,t=40),
+                                annotations=[ dict(
+                                    text="Hover over components for details",
+                                    showarrow=False,
+                                    xref="paper", yref="paper",
+                                    x=0.005, y=-0.002,
+                                    xanchor="left", yanchor="bottom",
+                                    font=dict(color="gray", size=12)
+                                )],
+                                xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                                yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+                            ))
+    
+    return fig_network, total_nodes
+
+
+# Colors of health statuses in charts
+HEALTH_COLORS = {
+    'healthy': '#28a745',
+    'warning': '#ffc107',
+    'error': '#dc3545',
+    'unknown': '#6c757d'
+}
+
+
+# Icon of each volume status; any other status is shown as failing
+VOLUME_STATUS_ICONS = {
+    'bound': '🟢',
+    'pending': '🟡',
+}
+
+
+# Icon of each pod issue severity
+SEVERITY_ICONS = {
+    'critical': '🚨',
+    'high': '⚠️',
+    'medium': 'ℹ️',
+    'low': '📝'
+}
+SEVERITY_BADGE = {severity: f"{icon} {severity.title()}" for severity, icon in SEVERITY_ICONS.items()}
+
+
+# Chart figures cached across reruns, keyed on the values that feed them. The
+# figure objects are shared, so every styling step happens inside the helper.
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def _pie_chart(names: Tuple, values: Tuple, title: str, color_map: Optional[Dict[str, str]] = None,
+               text_inside: bool = False) -> 'go.Figure':
+    fig = px.pie(
+        names=list(names),
+        values=list(values),
+        title=title,
+        color=list(names) if color_map else None,
+        color_discrete_map=color_map
+    )
+    if text_inside:
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def _bar_chart(x: Tuple, y: Tuple, title: str, x_label: str = 'x', y_label: str = 'y',
+               color_map: Optional[Dict[str, str]] = None, colored: bool = False,
+               showlegend: bool = True, color_scale: Optional[str] = None) -> 'go.Figure':
+    if color_scale:
+        # Shade the bars by value rather than by category
+        color, color_label = list(y), y_label
+    else:
+        color, color_label = (list(x) if colored or color_map else None), x_label
+    fig = px.bar(
+        x=list(x),
+        y=list(y),
+        title=title,
+        labels={'x': x_label, 'y': y_label, 'color': color_label},
+        color=color,
+        color_discrete_map=color_map,
+        color_continuous_scale=color_scale
+    )
+    if not showlegend:
+        fig.update_layout(showlegend=False)
+    return fig
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def _line_chart(x: Tuple, y: Tuple, title: str, x_label: str = 'x', y_label: str = 'y',
+                color: Optional[Tuple] = None, color_label: str = 'color',
+                markers: bool = False, color_map: Optional[Dict[str, str]] = None) -> 'go.Figure':
+    fig = px.line(
+        x=list(x),
+        y=list(y),
+        title=title,
+        labels={'x': x_label, 'y': y_label, 'color': color_label},
+        color=list(color) if color else None,
+        color_discrete_map=color_map
+    )
+    if markers:
+        fig.update_traces(mode='lines+markers')
+    return fig
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def _scatter_chart(x: Tuple, y: Tuple, size: Tuple, title: str, x_label: str = 'x',
+                   y_label: str = 'y', size_label: str = 'size') -> 'go.Figure':
+    return px.scatter(
+        x=list(x),
+        y=list(y),
+        size=list(size),
+        title=title,
+        labels={'x': x_label, 'y': y_label, 'size': size_label}
+    )
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def _pie_bar_chart(pie_names: Tuple, pie_values: Tuple, pie_title: str,
+                   bar_x: Tuple, bar_y: Tuple, bar_title: str,
+                   x_label: str = 'x', y_label: str = 'y',
+                   pie_color_map: Optional[Dict[str, str]] = None,
+                   bar_color_map: Optional[Dict[str, str]] = None,
+                   text_inside: bool = False) -> 'go.Figure':
+    """A pie and a bar chart side by side in one figure."""
+    from plotly.subplots import make_subplots
+    go = _lazy_go()
+    
+    fig = make_subplots(
+        rows=1, cols=2,
+        specs=[[{'type': 'domain'}, {'type': 'xy'}]],
+        subplot_titles=(pie_title, bar_title)
+    )
+    fig.add_trace(
+        go.Pie(
+            labels=list(pie_names),
+            values=list(pie_values),
+            marker=dict(colors=[pie_color_map.get(name, '#6c757d') for name in pie_names]) if pie_color_map else None,
+            textposition='inside' if text_inside else None,
+            textinfo='percent+label' if text_inside else None
+        ),
+        row=1, col=1
+    )
+    
+    # Bars take the map's color, or the default palette like px.bar does
+    palette = px.colors.qualitative.Plotly
+    bar_colors = [
+        bar_color_map.get(x, '#6c757d') if bar_color_map else palette[i % len(palette)]
+        for i, x in enumerate(bar_x)
+    ]
+    fig.add_trace(
+        go.Bar(x=list(bar_x), y=list(bar_y), marker_color=bar_colors, showlegend=False),
+        row=1, col=2
+    )
+    fig.update_xaxes(title_text=x_label, row=1, col=2)
+    fig.update_yaxes(title_text=y_label, row=1, col=2)
+    return fig
 
 
 def render_overview(db_client: DatabaseClient, filters: Dict[str, Any]):
@@ -20,8 +475,7 @@ def render_overview(db_client: DatabaseClient, filters: Dict[str, Any]):
     st.header("🏠 Cluster Overview")
     
     # Get overview data
-    overview = db_client.get_cluster_overview()
-    summary = db_client.get_resource_summary()
+    overview, summary = db_client.get_dashboard_bundle()
     
     # Top metrics row
     col1, col2, col3, col4 = st.columns(4)
@@ -71,12 +525,10 @@ def render_overview(db_client: DatabaseClient, filters: Dict[str, Any]):
                 other_count = sum(count for _, count in sorted_resources[8:])
                 top_resources['Others'] = other_count
             
-            fig_pie = px.pie(
-                values=list(top_resources.values()),
-                names=list(top_resources.keys()),
-                title="Resource Types Distribution"
+            fig_pie = _pie_chart(
+                tuple(top_resources), tuple(top_resources.values()),
+                "Resource Types Distribution", text_inside=True
             )
-            fig_pie.update_traces(textposition='inside', textinfo='percent+label')
             st.plotly_chart(fig_pie, use_container_width=True)
         else:
             st.info("No resource data available")
@@ -85,28 +537,11 @@ def render_overview(db_client: DatabaseClient, filters: Dict[str, Any]):
         # Health status distribution
         st.subheader("❤️ Health Status")
         if summary.health_distribution:
-            # Create color mapping for health status
-            color_map = {
-                'healthy': '#28a745',
-                'warning': '#ffc107', 
-                'error': '#dc3545',
-                'unknown': '#6c757d'
-            }
-            
-            health_data = pd.DataFrame([
-                {'status': status, 'count': count}
-                for status, count in summary.health_distribution.items()
-            ])
-            
-            fig_bar = px.bar(
-                health_data,
-                x='status',
-                y='count',
-                title="Health Status Distribution",
-                color='status',
-                color_discrete_map=color_map
+            fig_bar = _bar_chart(
+                tuple(summary.health_distribution), tuple(summary.health_distribution.values()),
+                "Health Status Distribution", 'status', 'count',
+                color_map=HEALTH_COLORS, showlegend=False
             )
-            fig_bar.update_layout(showlegend=False)
             st.plotly_chart(fig_bar, use_container_width=True)
         else:
             st.info("No health data available")
@@ -114,12 +549,17 @@ def render_overview(db_client: DatabaseClient, filters: Dict[str, Any]):
     # Top namespaces table
     st.subheader("🏷️ Top Namespaces")
     if overview.top_namespaces:
-        ns_data = pd.DataFrame(overview.top_namespaces)
-        ns_data['percentage'] = (ns_data['count'] / overview.total_resources * 100).round(1)
+        ns_counts = np.array([ns['count'] for ns in overview.top_namespaces])
+        ns_data = _small_table({
+            'Namespace': [ns['name'] for ns in overview.top_namespaces],
+            'Resources': ns_counts,
+            # One scaled numpy pass instead of divide, multiply and round Series temporaries
+            'Percentage (%)': np.round(ns_counts * (100.0 / overview.total_resources), 1)
+        })
         
         # Use st.dataframe with column configuration
         st.dataframe(
-            ns_data.rename(columns={'name': 'Namespace', 'count': 'Resources', 'percentage': 'Percentage (%)'}),
+            ns_data,
             use_container_width=True,
             hide_index=True
         )
@@ -129,21 +569,13 @@ def render_overview(db_client: DatabaseClient, filters: Dict[str, Any]):
     # Issues summary
     if overview.issues_summary:
         st.subheader("⚠️ Issues Summary")
-        issues_data = pd.DataFrame([
-            {'Status': status.title(), 'Count': count}
-            for status, count in overview.issues_summary.items()
-        ])
-        
-        if not issues_data.empty:
-            fig_issues = px.bar(
-                issues_data,
-                x='Status',
-                y='Count',
-                title="Resources by Issue Type",
-                color='Status',
-                color_discrete_map={'Warning': '#ffc107', 'Error': '#dc3545'}
-            )
-            st.plotly_chart(fig_issues, use_container_width=True)
+        fig_issues = _bar_chart(
+            tuple(status.title() for status in overview.issues_summary),
+            tuple(overview.issues_summary.values()),
+            "Resources by Issue Type", 'Status', 'Count',
+            color_map={'Warning': '#ffc107', 'Error': '#dc3545'}
+        )
+        st.plotly_chart(fig_issues, use_container_width=True)
 
 
 def render_security_analysis(db_client: DatabaseClient, filters: Dict[str, Any]):
@@ -240,7 +672,7 @@ def render_namespace_analysis(db_client: DatabaseClient, filters: Dict[str, Any]
     st.header("🏷️ Namespace Analysis")
     
     # Namespace selection
-    namespaces = db_client.get_namespaces()
+    namespaces = _namespaces(_db_key(db_client), db_client)
     
     if not namespaces:
         st.warning("No namespaces found in the database.")
@@ -285,43 +717,34 @@ def render_namespace_analysis(db_client: DatabaseClient, filters: Dict[str, Any]
         # Resource types in namespace
         st.subheader("📦 Resource Types")
         if analysis.resource_types:
-            fig = px.bar(
-                x=list(analysis.resource_types.keys()),
-                y=list(analysis.resource_types.values()),
-                title=f"Resource Types in {selected_namespace}"
+            fig = _bar_chart(
+                tuple(analysis.resource_types), tuple(analysis.resource_types.values()),
+                f"Resource Types in {selected_namespace}", "Resource Type", "Count"
             )
-            fig.update_layout(xaxis_title="Resource Type", yaxis_title="Count")
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Health distribution
         st.subheader("❤️ Health Distribution")
         if analysis.health_distribution:
-            color_map = {'healthy': '#28a745', 'warning': '#ffc107', 'error': '#dc3545'}
-            
-            fig = px.pie(
-                values=list(analysis.health_distribution.values()),
-                names=list(analysis.health_distribution.keys()),
-                title=f"Health Status in {selected_namespace}",
-                color=list(analysis.health_distribution.keys()),
-                color_discrete_map=color_map
+            fig = _pie_chart(
+                tuple(analysis.health_distribution), tuple(analysis.health_distribution.values()),
+                f"Health Status in {selected_namespace}", color_map=HEALTH_COLORS
             )
             st.plotly_chart(fig, use_container_width=True)
     
     # Top resources table
     st.subheader("🔝 Top Resources")
     if analysis.top_resources:
-        resources_df = pd.DataFrame(analysis.top_resources)
-        resources_df['Health'] = resources_df['health'].apply(
-            lambda x: f"{'🟢' if x == 'healthy' else '🟡' if x == 'warning' else '🔴'} {x.title()}"
-        )
+        resources = analysis.top_resources
+        resources_df = _small_table({
+            'Resource Name': [resource['name'] for resource in resources],
+            'Kind': [resource['kind'] for resource in resources],
+            'Health Status': [HEALTH_BADGE.get(resource['health'], resource['health']) for resource in resources]
+        })
         
         st.dataframe(
-            resources_df[['name', 'kind', 'Health']].rename(columns={
-                'name': 'Resource Name',
-                'kind': 'Kind',
-                'Health': 'Health Status'
-            }),
+            resources_df,
             use_container_width=True,
             hide_index=True
         )
@@ -349,55 +772,45 @@ def render_health_dashboard(db_client: DatabaseClient, filters: Dict[str, Any]):
             help="Total resources monitored"
         )
     
-    with col2:
-        health_ratio = (healthy_count / total_resources * 100) if total_resources > 0 else 0
-        st.metric(
-            "Healthy",
-            f"{healthy_count:,} ({health_ratio:.1f}%)",
-            delta=f"{health_ratio:.1f}%",
-            delta_color="normal",
-            help="Resources in healthy state"
-        )
-    
-    with col3:
-        warning_ratio = (warning_count / total_resources * 100) if total_resources > 0 else 0
-        st.metric(
-            "Warnings",
-            f"{warning_count:,} ({warning_ratio:.1f}%)",
-            delta=f"-{warning_ratio:.1f}%" if warning_count > 0 else "0%",
-            delta_color="inverse",
-            help="Resources with warnings"
-        )
-    
-    with col4:
-        error_ratio = (error_count / total_resources * 100) if total_resources > 0 else 0
-        st.metric(
-            "Errors",
-            f"{error_count:,} ({error_ratio:.1f}%)",
-            delta=f"-{error_ratio:.1f}%" if error_count > 0 else "0%",
-            delta_color="inverse",
-            help="Resources with errors"
-        )
+    # Share of all resources per status; unhealthy shares are shown as
+    # negative deltas
+    counts = np.array([healthy_count, warning_count, error_count])
+    ratios = np.divide(
+        counts * 100.0, total_resources, out=np.zeros(len(counts)), where=total_resources > 0
+    )
+    tiles = [
+        (col2, "Healthy", "normal", "Resources in healthy state"),
+        (col3, "Warnings", "inverse", "Resources with warnings"),
+        (col4, "Errors", "inverse", "Resources with errors"),
+    ]
+    
+    for (col, label, delta_color, help_text), count, ratio in zip(tiles, counts, ratios):
+        if delta_color == "normal":
+            delta = f"{ratio:.1f}%"
+        else:
+            delta = f"-{ratio:.1f}%" if count > 0 else "0%"
+        
+        with col:
+            st.metric(
+                label,
+                f"{count:,} ({ratio:.1f}%)",
+                delta=delta,
+                delta_color=delta_color,
+                help=help_text
+            )
     
     # Health trends over time
     st.subheader("📈 Health Trends")
     try:
-        health_history = db_client.get_health_over_time()
+        health_history = _health_over_time(_db_key(db_client), db_client)
         
         if not health_history.empty:
-            fig = px.line(
-                health_history,
-                x='date',
-                y='count',
-                color='health_status',
-                title="Health Status Over Time",
-                color_discrete_map={
-                    'healthy': '#28a745',
-                    'warning': '#ffc107',
-                    'error': '#dc3545'
-                }
+            fig = _line_chart(
+                tuple(health_history['date']), tuple(health_history['count']),
+                "Health Status Over Time", "Date", "Count",
+                color=tuple(health_history['health_status']), color_label='health_status',
+                color_map=HEALTH_COLORS
             )
-            fig.update_layout(xaxis_title="Date", yaxis_title="Count")
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No historical health data available")
@@ -409,26 +822,24 @@ def render_health_dashboard(db_client: DatabaseClient, filters: Dict[str, Any]):
         st.subheader("⚠️ Resources with Issues")
         
         # Get resources with issues
-        resources_df = db_client.get_resources_dataframe({'health_status': 'warning'})
-        error_resources_df = db_client.get_resources_dataframe({'health_status': 'error'})
+        issues_df = _resources_dataframe(
+            _db_key(db_client), (('health_status', ('warning', 'error')),), db_client
+        )
         
-        if not resources_df.empty or not error_resources_df.empty:
-            issues_df = pd.concat([resources_df, error_resources_df], ignore_index=True)
-            
+        if not issues_df.empty:
             # Display as table
-            display_cols = ['name', 'namespace', 'kind', 'health_status']
-            issues_display = issues_df[display_cols].copy()
-            issues_display['health_status'] = issues_display['health_status'].apply(
-                lambda x: f"{'🟡' if x == 'warning' else '🔴'} {x.title()}"
-            )
+            # The cached frame is already a private copy, so derive the
+            # display columns from it directly
+            statuses = issues_df['health_status']
+            issues_display = pd.DataFrame({
+                'Resource Name': issues_df['name'],
+                'Namespace': issues_df['namespace'],
+                'Kind': issues_df['kind'],
+                'Status': statuses.map(HEALTH_BADGE).fillna(statuses)
+            })
             
             st.dataframe(
-                issues_display.rename(columns={
-                    'name': 'Resource Name',
-                    'namespace': 'Namespace',
-                    'kind': 'Kind',
-                    'health_status': 'Status'
-                }),
+                issues_display,
                 use_container_width=True,
                 hide_index=True
             )
@@ -439,12 +850,20 @@ def render_relationships_view(db_client: DatabaseClient, filters: Dict[str, Any]
     st.header("🔗 Resource Relationships")
     
     # Get relationships data
-    relationships_df = db_client.get_relationships_dataframe(filters)
+    relationships_df = _relationships_dataframe(_db_key(db_client), _filters_key(filters), db_client)
     
     if relationships_df.empty:
         st.warning("No relationships found in the database.")
         return
     
+    # One hash pass over both kind columns serves the type metrics and the
+    # source-target matrix; pairs with a missing kind only count towards the
+    # metrics. Sorting the few pairs keeps the matrix axes in kind order
+    kind_pairs = (
+        relationships_df.value_counts(['source_kind', 'target_kind'], sort=False, dropna=False)
+        .sort_index()
+    )
+    
     # Relationships overview
     col1, col2, col3 = st.columns(3)
     
@@ -452,11 +871,11 @@ def render_relationships_view(db_client: DatabaseClient, filters: Dict[str, Any]
         st.metric("Total Relationships", len(relationships_df))
     
     with col2:
-        unique_sources = relationships_df['source_kind'].nunique()
+        unique_sources = kind_pairs.index.get_level_values('source_kind').nunique()
         st.metric("Source Types", unique_sources)
     
     with col3:
-        unique_targets = relationships_df['target_kind'].nunique()
+        unique_targets = kind_pairs.index.get_level_values('target_kind').nunique()
         st.metric("Target Types", unique_targets)
     
     # Relationship types distribution
@@ -464,30 +883,23 @@ def render_relationships_view(db_client: DatabaseClient, filters: Dict[str, Any]
     rel_types = relationships_df['relationship_type'].value_counts()
     
     if not rel_types.empty:
-        fig = px.bar(
-            x=rel_types.index,
-            y=rel_types.values,
-            title="Distribution of Relationship Types"
+        fig = _bar_chart(
+            tuple(rel_types.index), tuple(rel_types.tolist()),
+            "Distribution of Relationship Types", "Relationship Type", "Count"
         )
-        fig.update_layout(xaxis_title="Relationship Type", yaxis_title="Count")
         st.plotly_chart(fig, use_container_width=True)
     
     # Source-Target matrix
     st.subheader("🎯 Source-Target Matrix")
-    if 'source_kind' in relationships_df.columns and 'target_kind' in relationships_df.columns:
-        matrix_data = relationships_df.groupby(['source_kind', 'target_kind']).size().reset_index(name='count')
-        
-        if not matrix_data.empty:
-            fig = px.scatter(
-                matrix_data,
-                x='source_kind',
-                y='target_kind',
-                size='count',
-                title="Relationship Matrix (Source → Target)",
-                hover_data=['count']
-            )
-            fig.update_layout(xaxis_title="Source Kind", yaxis_title="Target Kind")
-            st.plotly_chart(fig, use_container_width=True)
+    matrix_data = kind_pairs.reset_index(name='count').dropna(subset=['source_kind', 'target_kind'])
+    
+    if not matrix_data.empty:
+        fig = _scatter_chart(
+            tuple(matrix_data['source_kind']), tuple(matrix_data['target_kind']),
+            tuple(matrix_data['count']), "Relationship Matrix (Source → Target)",
+            "Source Kind", "Target Kind", 'count'
+        )
+        st.plotly_chart(fig, use_container_width=True)
     
     # Detailed relationships table
     st.subheader("📋 Relationship Details")
@@ -495,50 +907,95 @@ def render_relationships_view(db_client: DatabaseClient, filters: Dict[str, Any]
     # Add search functionality
     search_term = st.text_input("🔍 Search relationships", placeholder="Enter resource name or type...")
     
-    display_df = relationships_df.copy()
+    # Rows are only materialized for the displayed slice; a search keeps the
+    # positions of its matches instead of filtering the whole frame
+    rows = slice(0, 100)  # Limit to 100 rows
+    n_total = len(relationships_df)
     if search_term:
-        mask = (
-            display_df['source_name'].str.contains(search_term, case=False, na=False) |
-            display_df['target_name'].str.contains(search_term, case=False, na=False) |
-            display_df['source_kind'].str.contains(search_term, case=False, na=False) |
-            display_df['target_kind'].str.contains(search_term, case=False, na=False)
-        )
-        display_df = display_df[mask]
+        haystack = _relationships_haystack(_db_key(db_client), _filters_key(filters), relationships_df)
+        matches = np.flatnonzero(haystack.str.contains(search_term.lower(), regex=False).to_numpy(dtype=bool))
+        rows = matches[:100]
+        n_total = len(matches)
     
     # Display the table
-    if not display_df.empty:
+    if n_total:
         # Select columns to display
         display_cols = ['source_name', 'source_kind', 'relationship_type', 'target_name', 'target_kind']
-        if 'source_namespace' in display_df.columns:
+        if 'source_namespace' in relationships_df.columns:
             display_cols.insert(2, 'source_namespace')
         
-        table_df = display_df[display_cols].head(100)  # Limit to 100 rows
+        table_df = relationships_df.iloc[rows][display_cols]
         
+        # Display names are column labels, so the slice is shown without a renamed copy
         st.dataframe(
-            table_df.rename(columns={
+            table_df,
+            column_config={
                 'source_name': 'Source Name',
                 'source_kind': 'Source Type',
                 'source_namespace': 'Source Namespace',
                 'relationship_type': 'Relationship',
                 'target_name': 'Target Name',
                 'target_kind': 'Target Type'
-            }),
+            },
             use_container_width=True,
             hide_index=True
         )
         
-        if len(display_df) > 100:
-            st.info(f"Showing first 100 of {len(display_df)} relationships")
+        if n_total > 100:
+            st.info(f"Showing first 100 of {n_total} relationships")
     else:
         st.info("No relationships match your search criteria")
 
 
+def _component_list_markdown(names, by_name: Dict[str, Any]) -> str:
+    """Markdown bullet list of the named components with health icon and kind.
+    
+    Emitting one markdown element per tab instead of one per component keeps
+    long lists cheap to send and render.
+    """
+    lines = []
+    for comp_name in names:
+        component = by_name.get(comp_name)
+        if component:
+            status_icon = HEALTH_ICONS.get(component.health_status, '🔴')
+            lines.append(f"- {status_icon} **{comp_name}** ({component.kind})")
+    return "\n".join(lines)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _components_export(db_key: Hashable, namespace: str, _components_view: Any) -> bytes:
+    """JSON export of a namespace's components, relationships and summary.
+    
+    Keyed on the database and namespace, so repeated export clicks reuse the
+    serialized bytes.
+    """
+    export_data = {
+        'components': [
+            {
+                **{name: getattr(comp, name) for name in _COMPONENT_FIELDS},
+                'labels': dict(comp.labels),
+                'annotations': dict(comp.annotations)
+            }
+            for comp in _components_view.components
+        ],
+        'relationships': _components_view.relationships,
+        'summary': {
+            'namespace': _components_view.namespace,
+            'total_components': _components_view.total_components,
+            'critical_components': _components_view.critical_components,
+            'orphaned_components': _components_view.orphaned_components
+        }
+    }
+    return _export_json(export_data)
+
+
+@_fragment
 def render_namespace_components_view(db_client: DatabaseClient, filters: Dict[str, Any]):
     """Render detailed namespace components view with relationships."""
     st.header("🏗️ Namespace Components & Relationships")
     
     # Namespace selection
-    namespaces = db_client.get_namespaces()
+    namespaces = _namespaces(_db_key(db_client), db_client)
     
     if not namespaces:
         st.warning("No namespaces found in the database.")
@@ -561,6 +1018,9 @@ def render_namespace_components_view(db_client: DatabaseClient, filters: Dict[st
         st.error(f"No components found in namespace: {selected_namespace}")
         return
     
+    # Index components by name; the first component wins when names repeat
+    by_name = {comp.name: comp for comp in reversed(components_view.components)}
+    
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -584,196 +1044,52 @@ def render_namespace_components_view(db_client: DatabaseClient, filters: Dict[st
     with col1:
         # Component types pie chart
         if components_view.component_groups:
-            group_data = pd.DataFrame([
-                {'type': kind, 'count': len(components)}
-                for kind, components in components_view.component_groups.items()
-            ])
-            
-            fig_pie = px.pie(
-                group_data,
-                values='count',
-                names='type',
-                title=f"Component Types in {selected_namespace}"
+            fig_pie = _pie_chart(
+                tuple(components_view.component_groups),
+                tuple(len(components) for components in components_view.component_groups.values()),
+                f"Component Types in {selected_namespace}", text_inside=True
             )
-            fig_pie.update_traces(textposition='inside', textinfo='percent+label')
             st.plotly_chart(fig_pie, use_container_width=True)
     
     with col2:
         # Health status distribution
-        health_counts = {}
-        for component in components_view.components:
-            status = component.health_status
-            health_counts[status] = health_counts.get(status, 0) + 1
+        health_counts = components_view.health_distribution
         
         if health_counts:
-            health_data = pd.DataFrame([
-                {'status': status, 'count': count}
-                for status, count in health_counts.items()
-            ])
-            
-            color_map = {
-                'healthy': '#28a745',
-                'warning': '#ffc107',
-                'error': '#dc3545',
-                'unknown': '#6c757d'
-            }
-            
-            fig_health = px.bar(
-                health_data,
-                x='status',
-                y='count',
-                title=f"Health Status Distribution",
-                color='status',
-                color_discrete_map=color_map
+            fig_health = _bar_chart(
+                tuple(health_counts), tuple(health_counts.values()),
+                "Health Status Distribution", 'status', 'count',
+                color_map=HEALTH_COLORS, showlegend=False
             )
-            fig_health.update_layout(showlegend=False)
             st.plotly_chart(fig_health, use_container_width=True)
     
     # Relationships network visualization
     st.subheader("🔗 Component Relationships")
     
     if components_view.relationships:
-        # Create network data for visualization
-        nodes = set()
-        edges = []
-        
-        for rel in components_view.relationships:
-            nodes.add(rel.source_name)
-            nodes.add(rel.target_name)
-            edges.append({
-                'source': rel.source_name,
-                'target': rel.target_name,
-                'relationship': rel.relationship_type,
-                'strength': rel.strength
-            })
-        
-        # Create a force-directed graph visualization
-        import networkx as nx
-        G = nx.DiGraph()
-        
-        # Add nodes with component type information
-        component_types = {comp.name: comp.kind for comp in components_view.components}
-        for node in nodes:
-            G.add_node(node, kind=component_types.get(node, 'Unknown'))
-        
-        # Add edges
-        for edge in edges:
-            G.add_edge(edge['source'], edge['target'], 
-                      relationship=edge['relationship'],
-                      weight=edge['strength'])
-        
-        # Create layout
-        try:
-            pos = nx.spring_layout(G, k=3, iterations=50)
-        except:
-            pos = nx.random_layout(G)
-        
-        # Create plotly figure
-        edge_x = []
-        edge_y = []
-        edge_info = []
-        
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-            edge_info.append(G[edge[0]][edge[1]].get('relationship', 'UNKNOWN'))
-        
-        edge_trace = go.Scatter(
-            x=edge_x, y=edge_y,
-            line=dict(width=2, color='#888'),
-            hoverinfo='none',
-            mode='lines'
-        )
-        
-        node_x = []
-        node_y = []
-        node_text = []
-        node_info = []
-        node_colors = []
-        
-        # Color mapping for different component types
-        kind_colors = {
-            'Pod': '#1f77b4',
-            'Service': '#ff7f0e', 
-            'ConfigMap': '#2ca02c',
-            'PersistentVolumeClaim': '#d62728',
-            'Secret': '#9467bd',
-            'Ingress': '#8c564b',
-            'ServiceAccount': '#e377c2'
-        }
-        
-        for node in G.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-            node_text.append(node)
-            
-            # Get component details
-            component = next((c for c in components_view.components if c.name == node), None)
-            if component:
-                node_info.append(f"{component.name}<br>Type: {component.kind}<br>Health: {component.health_status}")
-                node_colors.append(kind_colors.get(component.kind, '#636efa'))
-            else:
-                node_info.append(f"{node}<br>Type: Unknown")
-                node_colors.append('#636efa')
-        
-        node_trace = go.Scatter(
-            x=node_x, y=node_y,
-            mode='markers+text',
-            hoverinfo='text',
-            text=node_text,
-            textposition="middle center",
-            hovertext=node_info,
-            marker=dict(
-                size=20,
-                color=node_colors,
-                line=dict(width=2, color='white')
-            )
+        # Components and relationships fully determine the figure, so reruns
+        # for the same namespace reuse the cached one
+        sig = (
+            tuple((c.name, c.kind, c.health_status) for c in components_view.components),
+            tuple((r.source_name, r.target_name, r.relationship_type) for r in components_view.relationships),
         )
+        fig_network, total_nodes = _build_components_figure(selected_namespace, sig)
         
-        fig_network = go.Figure(data=[edge_trace, node_trace],
-                               layout=go.Layout(
-                                   title=f"Component Relationships in {selected_namespace}",
-                                   titlefont_size=16,
-                                   showlegend=False,
-                                   hovermode='closest',
-                                   margin=dict(b=20,l=5,r=5,t=40),
-                                   annotations=[ dict(
-                                       text="Hover over components for details",
-                                       showarrow=False,
-                                       xref="paper", yref="paper",
-                                       x=0.005, y=-0.002,
-                                       xanchor="left", yanchor="bottom",
-                                       font=dict(color="gray", size=12)
-                                   )],
-                                   xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                                   yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
-                               ))
+        if total_nodes > MAX_NETWORK_NODES:
+            st.caption(f"Showing the {MAX_NETWORK_NODES} most connected of {total_nodes} components")
         
         st.plotly_chart(fig_network, use_container_width=True)
         
         # Relationship types summary
         st.subheader("📊 Relationship Types")
-        rel_types = {}
-        for rel in components_view.relationships:
-            rel_types[rel.relationship_type] = rel_types.get(rel.relationship_type, 0) + 1
+        rel_types = components_view.relationship_types
         
         if rel_types:
-            rel_data = pd.DataFrame([
-                {'type': rel_type, 'count': count}
-                for rel_type, count in rel_types.items()
-            ])
-            
-            fig_rel = px.bar(
-                rel_data,
-                x='type',
-                y='count',
-                title="Relationship Types Distribution",
-                color='type'
+            fig_rel = _bar_chart(
+                tuple(rel_types), tuple(rel_types.values()),
+                "Relationship Types Distribution", "Relationship Type", "Count",
+                colored=True, showlegend=False
             )
-            fig_rel.update_layout(showlegend=False, xaxis_title="Relationship Type", yaxis_title="Count")
             st.plotly_chart(fig_rel, use_container_width=True)
     
     else:
@@ -786,39 +1102,33 @@ def render_namespace_components_view(db_client: DatabaseClient, filters: Dict[st
     tab1, tab2, tab3, tab4 = st.tabs(["All Components", "Critical Components", "Orphaned Components", "Dependency Chains"])
     
     with tab1:
-        if components_view.components:
-            components_data = []
-            for comp in components_view.components:
-                components_data.append({
-                    'Name': comp.name,
-                    'Type': comp.kind,
-                    'Health': f"{'🟢' if comp.health_status == 'healthy' else '🟡' if comp.health_status == 'warning' else '🔴'} {comp.health_status.title()}",
-                    'Issues': len(comp.issues),
-                    'Labels': ', '.join([f"{k}={v}" for k, v in list(comp.labels.items())[:3]]) if comp.labels else 'None'
-                })
-            
-            components_df = pd.DataFrame(components_data)
+        comps = components_view.components
+        if comps:
+            # Build the table column by column rather than one dict per row
+            healths = pd.Series([comp.health_status for comp in comps], dtype=object)
+            components_df = pd.DataFrame({
+                'Name': [comp.name for comp in comps],
+                'Type': [comp.kind for comp in comps],
+                'Health': healths.map(HEALTH_BADGE).fillna(healths),
+                'Issues': [len(comp.issues) for comp in comps],
+                'Labels': [
+                    ', '.join(f"{k}={v}" for k, v in comp.labels[:3]) if comp.labels else 'None'
+                    for comp in comps
+                ],
+            })
             st.dataframe(components_df, use_container_width=True, hide_index=True)
     
     with tab2:
         if components_view.critical_components:
             st.markdown(f"**{len(components_view.critical_components)} critical components** (3+ relationships):")
-            for comp_name in components_view.critical_components:
-                component = next((c for c in components_view.components if c.name == comp_name), None)
-                if component:
-                    status_icon = '🟢' if component.health_status == 'healthy' else '🟡' if component.health_status == 'warning' else '🔴'
-                    st.markdown(f"- {status_icon} **{comp_name}** ({component.kind})")
+            st.markdown(_component_list_markdown(components_view.critical_components, by_name))
         else:
             st.info("No critical components identified.")
     
     with tab3:
         if components_view.orphaned_components:
             st.markdown(f"**{len(components_view.orphaned_components)} orphaned components** (no relationships):")
-            for comp_name in components_view.orphaned_components:
-                component = next((c for c in components_view.components if c.name == comp_name), None)
-                if component:
-                    status_icon = '🟢' if component.health_status == 'healthy' else '🟡' if component.health_status == 'warning' else '🔴'
-                    st.markdown(f"- {status_icon} **{comp_name}** ({component.kind})")
+            st.markdown(_component_list_markdown(components_view.orphaned_components, by_name))
         else:
             st.info("All components have relationships.")
     
@@ -837,37 +1147,35 @@ def render_namespace_components_view(db_client: DatabaseClient, filters: Dict[st
     col1, col2, col3 = st.columns(3)
     
     with col1:
+        # Typing in the search box reruns the view, so the opened search is
+        # remembered in session state rather than taken from the button; the
+        # key is per namespace so switching namespaces starts with it closed
+        search_open_key = f"component_search_open_{selected_namespace}"
         if st.button("🔍 Search Components"):
+            st.session_state[search_open_key] = True
+        
+        if st.session_state.get(search_open_key):
             search_term = st.text_input("Search components by name:")
             if search_term:
-                matching_components = [
-                    comp for comp in components_view.components 
-                    if search_term.lower() in comp.name.lower()
-                ]
-                if matching_components:
-                    st.write(f"Found {len(matching_components)} matching components:")
-                    for comp in matching_components:
-                        st.write(f"- {comp.name} ({comp.kind})")
+                names_lower = _component_names_lower(_db_key(db_client), selected_namespace, components_view)
+                matches = np.flatnonzero(np.char.find(names_lower, search_term.lower()) >= 0)
+                if matches.size:
+                    st.write(f"Found {matches.size} matching components:")
+                    st.markdown("\n".join(
+                        f"- {components_view.components[i].name} ({components_view.components[i].kind})"
+                        for i in matches
+                    ))
                 else:
                     st.write("No matching components found.")
     
     with col2:
         if st.button("📊 Export Component Data"):
-            # Create export data
-            export_data = {
-                'components': [comp.dict() for comp in components_view.components],
-                'relationships': [rel.dict() for rel in components_view.relationships],
-                'summary': {
-                    'namespace': components_view.namespace,
-                    'total_components': components_view.total_components,
-                    'critical_components': components_view.critical_components,
-                    'orphaned_components': components_view.orphaned_components
-                }
-            }
+            with st.spinner("Preparing component export..."):
+                export_bytes = _components_export(_db_key(db_client), selected_namespace, components_view)
             
             st.download_button(
                 label="Download JSON",
-                data=json.dumps(export_data, indent=2),
+                data=export_bytes,
                 file_name=f"{selected_namespace}_components.json",
                 mime="application/json"
             )
@@ -883,6 +1191,7 @@ def render_storage_analysis(db_client: DatabaseClient, filters: Dict[str, Any]):
     
     # Get storage consumption data
     storage = db_client.get_storage_consumption()
+    storage_issues = storage.unbound_pvcs + storage.orphaned_pvs
     
     # Storage overview metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -912,139 +1221,107 @@ def render_storage_analysis(db_client: DatabaseClient, filters: Dict[str, Any]):
     with col4:
         st.metric(
             "Issues",
-            storage.unbound_pvcs + storage.orphaned_pvs,
-            delta=-(storage.unbound_pvcs + storage.orphaned_pvs) if storage.unbound_pvcs + storage.orphaned_pvs > 0 else None,
+            storage_issues,
+            delta=-storage_issues if storage_issues > 0 else None,
             delta_color="inverse",
             help="Unbound PVCs and orphaned PVs"
         )
     
     # Storage distribution charts
-    st.subheader("📈 Storage Distribution")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Volumes by storage class
-        if storage.volumes_by_class:
-            class_data = pd.DataFrame([
-                {'storage_class': sc, 'volume_count': count}
-                for sc, count in storage.volumes_by_class.items()
-            ])
-            
-            fig_volumes = px.pie(
-                class_data,
-                values='volume_count',
-                names='storage_class',
-                title="Volumes by Storage Class"
-            )
-            fig_volumes.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig_volumes, use_container_width=True)
+    # Sections without data are skipped entirely, header included
+    if storage.volumes_by_class:
+        st.subheader("📈 Storage Distribution")
+        
+        # Volume count and capacity are tallied over the same storage classes,
+        # so both are drawn in one figure
+        fig_distribution = _pie_bar_chart(
+            tuple(storage.volumes_by_class),
+            tuple(storage.volumes_by_class.values()),
+            "Volumes by Storage Class",
+            tuple(storage.capacity_by_class),
+            tuple(storage.capacity_by_class.values()),
+            "Capacity by Storage Class (GB)",
+            x_label="Storage Class",
+            y_label="Capacity (GB)",
+            text_inside=True
+        )
+        st.plotly_chart(fig_distribution, use_container_width=True)
     
-    with col2:
-        # Capacity by storage class
-        if storage.capacity_by_class:
-            capacity_data = pd.DataFrame([
-                {'storage_class': sc, 'capacity_gb': capacity}
-                for sc, capacity in storage.capacity_by_class.items()
-            ])
-            
-            fig_capacity = px.bar(
-                capacity_data,
-                x='storage_class',
-                y='capacity_gb',
-                title="Capacity by Storage Class (GB)",
-                color='storage_class'
-            )
-            fig_capacity.update_layout(showlegend=False, xaxis_title="Storage Class", yaxis_title="Capacity (GB)")
-            st.plotly_chart(fig_capacity, use_container_width=True)
+    # Issue summary
+    issue_data = {
+        'Unbound PVCs': storage.unbound_pvcs,
+        'Orphaned PVs': storage.orphaned_pvs,
+        'Healthy Volumes': storage.total_volumes - storage_issues
+    }
     
     # Volume status analysis
-    st.subheader("📊 Volume Status Analysis")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Volume status distribution
-        if storage.volumes_by_status:
-            status_data = pd.DataFrame([
-                {'status': status, 'count': count}
-                for status, count in storage.volumes_by_status.items()
-            ])
-            
-            color_map = {
-                'bound': '#28a745',
-                'available': '#17a2b8',
-                'pending': '#ffc107',
-                'failed': '#dc3545',
-                'unknown': '#6c757d'
-            }
-            
-            fig_status = px.bar(
-                status_data,
-                x='status',
-                y='count',
-                title="Volume Status Distribution",
-                color='status',
-                color_discrete_map=color_map
-            )
-            fig_status.update_layout(showlegend=False)
-            st.plotly_chart(fig_status, use_container_width=True)
-    
-    with col2:
-        # Issue summary
-        issue_data = {
-            'Unbound PVCs': storage.unbound_pvcs,
-            'Orphaned PVs': storage.orphaned_pvs,
-            'Healthy Volumes': storage.total_volumes - storage.unbound_pvcs - storage.orphaned_pvs
-        }
+    if storage.volumes_by_status or any(issue_data.values()):
+        st.subheader("📊 Volume Status Analysis")
         
-        if any(issue_data.values()):
-            issue_df = pd.DataFrame([
-                {'category': cat, 'count': count}
-                for cat, count in issue_data.items()
-            ])
-            
-            issue_colors = {
-                'Unbound PVCs': '#ffc107',
-                'Orphaned PVs': '#dc3545',
-                'Healthy Volumes': '#28a745'
-            }
-            
-            fig_issues = px.pie(
-                issue_df,
-                values='count',
-                names='category',
-                title="Storage Health Overview",
-                color='category',
-                color_discrete_map=issue_colors
-            )
-            st.plotly_chart(fig_issues, use_container_width=True)
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Volume status distribution
+            if storage.volumes_by_status:
+                color_map = {
+                    'bound': '#28a745',
+                    'available': '#17a2b8',
+                    'pending': '#ffc107',
+                    'failed': '#dc3545',
+                    'unknown': '#6c757d'
+                }
+                
+                fig_status = _bar_chart(
+                    tuple(storage.volumes_by_status),
+                    tuple(storage.volumes_by_status.values()),
+                    "Volume Status Distribution",
+                    x_label='status',
+                    y_label='count',
+                    color_map=color_map,
+                    showlegend=False
+                )
+                st.plotly_chart(fig_status, use_container_width=True)
+        
+        with col2:
+            if any(issue_data.values()):
+                issue_colors = {
+                    'Unbound PVCs': '#ffc107',
+                    'Orphaned PVs': '#dc3545',
+                    'Healthy Volumes': '#28a745'
+                }
+                
+                fig_issues = _pie_chart(
+                    tuple(issue_data),
+                    tuple(issue_data.values()),
+                    "Storage Health Overview",
+                    color_map=issue_colors
+                )
+                st.plotly_chart(fig_issues, use_container_width=True)
     
     # Top consumers table
-    st.subheader("🔝 Top Storage Consumers")
-    
     if storage.top_consumers:
-        consumers_data = []
-        for volume in storage.top_consumers[:10]:
-            consumers_data.append({
-                'Name': volume.name,
-                'Namespace': volume.namespace or 'cluster-wide',
-                'Type': volume.kind,
-                'Capacity': volume.capacity or 'Unknown',
-                'Storage Class': volume.storage_class or 'default',
-                'Status': f"{'🟢' if volume.status == 'bound' else '🟡' if volume.status == 'pending' else '🔴'} {volume.status.title()}",
-                'Created': volume.created_at.strftime('%Y-%m-%d') if volume.created_at else 'Unknown'
-            })
-        
-        consumers_df = pd.DataFrame(consumers_data)
+        st.subheader("🔝 Top Storage Consumers")
+        
+        top_consumers = storage.top_consumers[:10]
+        statuses = pd.Series([volume.status for volume in top_consumers])
+        # Kubernetes timestamps are UTC, so utc=True only normalizes naive values
+        created = pd.to_datetime(pd.Series([volume.created_at for volume in top_consumers]), utc=True)
+        
+        consumers_df = pd.DataFrame({
+            'Name': [volume.name for volume in top_consumers],
+            'Namespace': [volume.namespace or 'cluster-wide' for volume in top_consumers],
+            'Type': [volume.kind for volume in top_consumers],
+            'Capacity': [volume.capacity or 'Unknown' for volume in top_consumers],
+            'Storage Class': [volume.storage_class or 'default' for volume in top_consumers],
+            'Status': statuses.map(VOLUME_STATUS_ICONS).fillna('🔴') + ' ' + statuses.str.title(),
+            'Created': created.dt.strftime('%Y-%m-%d').fillna('Unknown')
+        })
         st.dataframe(consumers_df, use_container_width=True, hide_index=True)
-    else:
-        st.info("No storage volumes found.")
     
     # Per-namespace storage analysis
     st.subheader("🏷️ Per-Namespace Storage Analysis")
     
-    namespaces = db_client.get_namespaces()
+    namespaces = _namespaces(_db_key(db_client), db_client)
     if namespaces:
         selected_ns = st.selectbox("Select namespace for detailed storage analysis", 
                                   ['Select a namespace...'] + namespaces)
@@ -1085,11 +1362,9 @@ def render_storage_analysis(db_client: DatabaseClient, filters: Dict[str, Any]):
                 
                 # Storage timeline for namespace
                 st.write("**Storage Creation Timeline:**")
-                timeline = db_client.get_namespace_storage_timeline(selected_ns)
+                timeline_df = _namespace_storage_timeline(_db_key(db_client), selected_ns, db_client)
                 
-                if timeline:
-                    timeline_df = pd.DataFrame(timeline)
-                    
+                if not timeline_df.empty:
                     # Create timeline chart
                     fig_timeline = px.scatter(
                         timeline_df,
@@ -1104,12 +1379,13 @@ def render_storage_analysis(db_client: DatabaseClient, filters: Dict[str, Any]):
                     
                     # Timeline table
                     st.dataframe(
-                        timeline_df[['date', 'time', 'name', 'capacity']].rename(columns={
+                        timeline_df[['date', 'time', 'name', 'capacity']],
+                        column_config={
                             'date': 'Date',
                             'time': 'Time',
                             'name': 'Volume Name',
                             'capacity': 'Capacity'
-                        }),
+                        },
                         use_container_width=True,
                         hide_index=True
                     )
@@ -1138,8 +1414,23 @@ def render_storage_analysis(db_client: DatabaseClient, filters: Dict[str, Any]):
     if not recommendations:
         recommendations.append("✅ **Storage health looks good!** No immediate issues detected.")
     
-    for rec in recommendations:
-        st.markdown(rec)
+    # One markdown element for all recommendations
+    st.markdown("\n\n".join(recommendations))
+
+
+def _resource_timeline_table(resources, age_format: str, created_format: str) -> pd.DataFrame:
+    """Table of resource timelines, built one column at a time."""
+    # Timeline timestamps are UTC; the whole column is formatted in one call
+    created = pd.to_datetime(pd.Series([resource.created_at for resource in resources]), utc=True)
+    
+    return pd.DataFrame({
+        'Name': [resource.resource_name for resource in resources],
+        'Type': [resource.resource_kind for resource in resources],
+        'Namespace': [resource.namespace or 'cluster-wide' for resource in resources],
+        'Age (days)': [format(resource.age_days, age_format) for resource in resources],
+        'Created': created.dt.strftime(created_format),
+        'Stage': [resource.lifecycle_stage.title() for resource in resources]
+    })
 
 
 def render_temporal_analysis(db_client: DatabaseClient, filters: Dict[str, Any]):
@@ -1208,40 +1499,37 @@ def render_temporal_analysis(db_client: DatabaseClient, filters: Dict[str, Any])
         timeline_df = pd.DataFrame(temporal.creation_timeline)
         
         # Create main timeline chart
-        fig_timeline = px.line(
-            timeline_df,
-            x='date',
-            y='total',
-            title=f"Daily Resource Creation - Last {days_back} Days",
-            labels={'date': 'Date', 'total': 'Resources Created'}
+        fig_timeline = _line_chart(
+            tuple(timeline_df['date']),
+            tuple(timeline_df['total']),
+            f"Daily Resource Creation - Last {days_back} Days",
+            x_label='Date',
+            y_label='Resources Created',
+            markers=True
         )
-        fig_timeline.update_traces(mode='lines+markers')
         st.plotly_chart(fig_timeline, use_container_width=True)
         
         # Resource creation by type over time
-        if any(entry.get('by_kind') for entry in temporal.creation_timeline):
-            # Flatten the by_kind data
-            kind_timeline = []
-            for entry in temporal.creation_timeline:
-                for kind, count in entry.get('by_kind', {}).items():
-                    kind_timeline.append({
-                        'date': entry['date'],
-                        'kind': kind,
-                        'count': count
-                    })
+        # Flatten the by_kind data into one (date, kind, count) row per kind and day
+        kind_timeline = [
+            (entry['date'], kind, count)
+            for entry in temporal.creation_timeline
+            for kind, count in entry.get('by_kind', {}).items()
+        ]
+        
+        if kind_timeline:
+            dates, kinds, counts = zip(*kind_timeline)
             
-            if kind_timeline:
-                kind_df = pd.DataFrame(kind_timeline)
-                
-                fig_kind_timeline = px.line(
-                    kind_df,
-                    x='date',
-                    y='count',
-                    color='kind',
-                    title="Resource Creation by Type Over Time",
-                    labels={'date': 'Date', 'count': 'Count', 'kind': 'Resource Type'}
-                )
-                st.plotly_chart(fig_kind_timeline, use_container_width=True)
+            fig_kind_timeline = _line_chart(
+                dates,
+                counts,
+                "Resource Creation by Type Over Time",
+                x_label='Date',
+                y_label='Count',
+                color=kinds,
+                color_label='Resource Type'
+            )
+            st.plotly_chart(fig_kind_timeline, use_container_width=True)
     else:
         st.info("No timeline data available for the selected period.")
     
@@ -1253,138 +1541,101 @@ def render_temporal_analysis(db_client: DatabaseClient, filters: Dict[str, Any])
     with col1:
         # Age distribution pie chart
         if temporal.age_distribution:
-            age_data = pd.DataFrame([
-                {'age_group': group, 'count': count}
-                for group, count in temporal.age_distribution.items()
-                if count > 0
-            ])
+            age_groups = {group: count for group, count in temporal.age_distribution.items() if count > 0}
             
-            if not age_data.empty:
-                fig_age = px.pie(
-                    age_data,
-                    values='count',
-                    names='age_group',
-                    title="Resource Age Distribution"
+            if age_groups:
+                fig_age = _pie_chart(
+                    tuple(age_groups),
+                    tuple(age_groups.values()),
+                    "Resource Age Distribution",
+                    text_inside=True
                 )
-                fig_age.update_traces(textposition='inside', textinfo='percent+label')
                 st.plotly_chart(fig_age, use_container_width=True)
     
     with col2:
         # Creation patterns (day of week)
         if temporal.creation_patterns:
             # Order days of week properly
-            days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            pattern_data = []
+            days_order = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
             
-            for day in days_order:
-                count = temporal.creation_patterns.get(day, 0)
-                pattern_data.append({'day': day, 'count': count})
-            
-            pattern_df = pd.DataFrame(pattern_data)
-            
-            fig_patterns = px.bar(
-                pattern_df,
-                x='day',
-                y='count',
-                title="Resource Creation by Day of Week",
-                color='count',
-                color_continuous_scale='viridis'
+            fig_patterns = _bar_chart(
+                days_order,
+                tuple(temporal.creation_patterns.get(day, 0) for day in days_order),
+                "Resource Creation by Day of Week",
+                x_label="Day of Week",
+                y_label="Resources Created",
+                showlegend=False,
+                color_scale='viridis'
             )
-            fig_patterns.update_layout(showlegend=False, xaxis_title="Day of Week", yaxis_title="Resources Created")
             st.plotly_chart(fig_patterns, use_container_width=True)
     
     # Most active namespaces
     st.subheader("🏷️ Most Active Namespaces")
     
     if temporal.most_active_namespaces:
-        ns_data = pd.DataFrame(temporal.most_active_namespaces[:10])
-        
-        fig_namespaces = px.bar(
-            ns_data,
-            x='namespace',
-            y='resource_count',
-            title="Resource Count by Namespace",
-            color='resource_count',
-            color_continuous_scale='blues'
+        top_namespaces = temporal.most_active_namespaces[:10]
+        
+        fig_namespaces = _bar_chart(
+            tuple(ns['namespace'] for ns in top_namespaces),
+            tuple(ns['resource_count'] for ns in top_namespaces),
+            "Resource Count by Namespace",
+            x_label="Namespace",
+            y_label="Resource Count",
+            showlegend=False,
+            color_scale='blues'
         )
-        fig_namespaces.update_layout(showlegend=False, xaxis_title="Namespace", yaxis_title="Resource Count")
         st.plotly_chart(fig_namespaces, use_container_width=True)
     
     # Resource lifecycle statistics
     st.subheader("📉 Resource Lifecycle Statistics")
     
     if temporal.resource_lifecycle_stats:
-        lifecycle_data = []
-        for kind, stats in temporal.resource_lifecycle_stats.items():
-            lifecycle_data.append({
-                'Resource Type': kind,
-                'Count': stats['count'],
-                'Avg Age (days)': f"{stats['avg_age']:.1f}",
-                'Min Age (days)': stats.get('min_age', 0),
-                'Max Age (days)': stats.get('max_age', 0)
-            })
-        
-        lifecycle_df = pd.DataFrame(lifecycle_data)
+        # Ages stay numeric and are formatted by the column config, so the
+        # columns keep numeric dtypes for sorting and Arrow serialization
+        lifecycle_stats = temporal.resource_lifecycle_stats.values()
+        lifecycle_df = pd.DataFrame({
+            'Resource Type': list(temporal.resource_lifecycle_stats),
+            'Count': [stats['count'] for stats in lifecycle_stats],
+            'Avg Age (days)': [stats['avg_age'] for stats in lifecycle_stats],
+            'Min Age (days)': [stats.get('min_age', 0) for stats in lifecycle_stats],
+            'Max Age (days)': [stats.get('max_age', 0) for stats in lifecycle_stats]
+        })
         lifecycle_df = lifecycle_df.sort_values('Count', ascending=False)
         
-        st.dataframe(lifecycle_df, use_container_width=True, hide_index=True)
+        st.dataframe(
+            lifecycle_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={'Avg Age (days)': st.column_config.NumberColumn(format='%.1f')}
+        )
     
     # Resource details tables
     st.subheader("📋 Resource Details")
     
-    # Create tabs for different resource categories
-    tab1, tab2, tab3 = st.tabs(["Newest Resources", "Oldest Resources", "Stale Resources"])
+    # Only the selected category's table is built; st.tabs would build all three
+    category = st.radio(
+        "Resource category",
+        ["Newest Resources", "Oldest Resources", "Stale Resources"],
+        horizontal=True
+    )
     
-    with tab1:
+    if category == "Newest Resources":
         if temporal.newest_resources:
-            newest_data = []
-            for resource in temporal.newest_resources:
-                newest_data.append({
-                    'Name': resource.resource_name,
-                    'Type': resource.resource_kind,
-                    'Namespace': resource.namespace or 'cluster-wide',
-                    'Age (days)': f"{resource.age_days:.1f}",
-                    'Created': resource.created_at.strftime('%Y-%m-%d %H:%M'),
-                    'Stage': resource.lifecycle_stage.title()
-                })
-            
-            newest_df = pd.DataFrame(newest_data)
+            newest_df = _resource_timeline_table(temporal.newest_resources, '.1f', '%Y-%m-%d %H:%M')
             st.dataframe(newest_df, use_container_width=True, hide_index=True)
         else:
             st.info("No new resources in the selected time period.")
     
-    with tab2:
+    elif category == "Oldest Resources":
         if temporal.oldest_resources:
-            oldest_data = []
-            for resource in temporal.oldest_resources:
-                oldest_data.append({
-                    'Name': resource.resource_name,
-                    'Type': resource.resource_kind,
-                    'Namespace': resource.namespace or 'cluster-wide',
-                    'Age (days)': f"{resource.age_days:.0f}",
-                    'Created': resource.created_at.strftime('%Y-%m-%d'),
-                    'Stage': resource.lifecycle_stage.title()
-                })
-            
-            oldest_df = pd.DataFrame(oldest_data)
+            oldest_df = _resource_timeline_table(temporal.oldest_resources, '.0f', '%Y-%m-%d')
             st.dataframe(oldest_df, use_container_width=True, hide_index=True)
         else:
             st.info("No old resources found.")
     
-    with tab3:
+    else:
         if temporal.stale_resources:
-            stale_data = []
-            for resource in temporal.stale_resources:
-                stale_data.append({
-                    'Name': resource.resource_name,
-                    'Type': resource.resource_kind,
-                    'Namespace': resource.namespace or 'cluster-wide',
-                    'Age (days)': f"{resource.age_days:.0f}",
-                    'Created': resource.created_at.strftime('%Y-%m-%d'),
-                    'Stage': resource.lifecycle_stage.title()
-                })
-            
-            stale_df = pd.DataFrame(stale_data)
+            stale_df = _resource_timeline_table(temporal.stale_resources, '.0f', '%Y-%m-%d')
             st.dataframe(stale_df, use_container_width=True, hide_index=True)
             
             st.warning("⚠️ Consider reviewing these stale resources for potential cleanup or archival.")
@@ -1392,6 +1643,107 @@ def render_temporal_analysis(db_client: DatabaseClient, filters: Dict[str, Any])
             st.success("✅ No stale resources found! All resources are relatively recent.")
 
 
+# Resource efficiency recommendations as (predicate, template) pairs, in
+# display order; templates are formatted with the efficiency report as ``e``
+EFFICIENCY_RECOMMENDATIONS = (
+    (
+        lambda e: e.pods_without_any_resources > 0,
+        "🚨 **CRITICAL**: {e.pods_without_any_resources} pods have NO resource constraints. "
+        "This can cause cluster instability and resource starvation. Add requests and limits immediately."
+    ),
+    (
+        lambda e: e.pods_without_requests > 0,
+        "⚠️ **{e.pods_without_requests} pods missing resource requests**. "
+        "Add CPU and memory requests to ensure proper scheduling and prevent resource contention."
+    ),
+    (
+        lambda e: e.pods_without_limits > 0,
+        "⚠️ **{e.pods_without_limits} pods missing resource limits**. "
+        "Add CPU and memory limits to prevent resource exhaustion and OOM kills affecting other pods."
+    ),
+    (
+        lambda e: e.resource_coverage_percentage < 70,
+        "📊 **Low resource coverage** ({e.resource_coverage_percentage:.1f}%). "
+        "Aim for 90%+ coverage to ensure cluster stability and predictable performance."
+    ),
+    (
+        lambda e: e.unused_config_maps > 0,
+        "🗂️ **{e.unused_config_maps} unused ConfigMaps** detected. "
+        "Review and clean up unused configuration objects to reduce cluster clutter."
+    ),
+    (
+        lambda e: e.orphaned_pvcs > 0,
+        "💾 **{e.orphaned_pvcs} orphaned PVCs** in pending state. "
+        "Check storage classes and provisioners to resolve storage issues."
+    ),
+)
+
+
+def _pod_issues_table(pods) -> pd.DataFrame:
+    """Table of pods with resource issues, one row per pod."""
+    severities = pd.Series([pod.issue_severity for pod in pods], dtype=object)
+    health = pd.Series([pod.health_status for pod in pods], dtype=object)
+    return pd.DataFrame({
+        'Severity': severities.map(SEVERITY_BADGE).fillna(severities),
+        'Pod Name': [pod.name for pod in pods],
+        'Namespace': [pod.namespace for pod in pods],
+        'Missing Requests': [', '.join(pod.missing_requests) or '✅' for pod in pods],
+        'Missing Limits': [', '.join(pod.missing_limits) or '✅' for pod in pods],
+        'Health': health.map(HEALTH_BADGE).fillna(health),
+        'Containers': [len(pod.containers) for pod in pods]
+    })
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _efficiency_json_export(db_key: Hashable, _efficiency: Any, _recommendations: List[str]) -> bytes:
+    """JSON export of the resource efficiency summary, problematic pods and recommendations.
+    
+    The recommendations are derived from the efficiency report, so the
+    database key alone identifies the payload.
+    """
+    export_data = {
+        'summary': {
+            'total_pods_analyzed': _efficiency.total_pods_analyzed,
+            'resource_coverage_percentage': _efficiency.resource_coverage_percentage,
+            'pods_without_requests': _efficiency.pods_without_requests,
+            'pods_without_limits': _efficiency.pods_without_limits,
+            'pods_without_any_resources': _efficiency.pods_without_any_resources
+        },
+        'problematic_pods': _efficiency.problematic_pods,
+        'recommendations': _recommendations
+    }
+    return _export_json(export_data)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _efficiency_csv_export(db_key: Hashable, _efficiency: Any) -> str:
+    """CSV export of the problematic pods, one row per pod."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    
+    # Write header
+    writer.writerow([
+        'pod_name', 'namespace', 'severity', 'missing_requests', 'missing_limits',
+        'health_status', 'containers', 'recommendations'
+    ])
+    
+    # Stream rows straight into the buffer rather than through a DataFrame
+    writer.writerows(
+        (
+            pod.name,
+            pod.namespace,
+            pod.issue_severity,
+            ','.join(pod.missing_requests),
+            ','.join(pod.missing_limits),
+            pod.health_status,
+            ','.join(pod.containers),
+            ' | '.join(pod.recommendations)
+        )
+        for pod in _efficiency.problematic_pods
+    )
+    return buffer.getvalue()
+
+
 def render_resource_efficiency(db_client: DatabaseClient, filters: Dict[str, Any]):
     """Render resource efficiency analysis with Pod resource issues."""
     st.header("⚡ Resource Efficiency Analysis")
@@ -1399,6 +1751,14 @@ def render_resource_efficiency(db_client: DatabaseClient, filters: Dict[str, Any
     # Get resource efficiency data
     efficiency = db_client.get_resource_efficiency()
     
+    # Problematic pods, and their positions in the issues table, grouped by
+    # severity in a single pass
+    pods_by_severity = defaultdict(list)
+    rows_by_severity = defaultdict(list)
+    for row, pod in enumerate(efficiency.problematic_pods):
+        pods_by_severity[pod.issue_severity].append(pod)
+        rows_by_severity[pod.issue_severity].append(row)
+    
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -1418,20 +1778,21 @@ def render_resource_efficiency(db_client: DatabaseClient, filters: Dict[str, Any
         )
     
     with col3:
+        problematic_count = len(efficiency.problematic_pods)
         st.metric(
             "Problematic Pods",
-            len(efficiency.problematic_pods),
-            delta=-len(efficiency.problematic_pods) if len(efficiency.problematic_pods) > 0 else None,
+            problematic_count,
+            delta=-problematic_count if problematic_count > 0 else None,
             delta_color="inverse",
             help="Pods with missing resource requests or limits"
         )
     
     with col4:
-        critical_pods = len([p for p in efficiency.problematic_pods if p.issue_severity == 'critical'])
+        critical_count = len(pods_by_severity.get('critical', []))
         st.metric(
             "Critical Issues",
-            critical_pods,
-            delta=-critical_pods if critical_pods > 0 else None,
+            critical_count,
+            delta=-critical_count if critical_count > 0 else None,
             delta_color="inverse",
             help="Pods with no resource constraints at all"
         )
@@ -1439,80 +1800,65 @@ def render_resource_efficiency(db_client: DatabaseClient, filters: Dict[str, Any
     # Resource configuration issues breakdown
     st.subheader("📊 Resource Configuration Issues")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Pod resource issues pie chart
-        issue_data = {
-            'Complete Resources': efficiency.total_pods_analyzed - len(efficiency.problematic_pods),
-            'Missing Requests': efficiency.pods_without_requests,
-            'Missing Limits': efficiency.pods_without_limits,
-            'No Resources': efficiency.pods_without_any_resources
-        }
-        
-        if any(issue_data.values()):
-            issue_df = pd.DataFrame([
-                {'category': cat, 'count': count}
-                for cat, count in issue_data.items()
-                if count > 0
-            ])
-            
-            issue_colors = {
-                'Complete Resources': '#28a745',
-                'Missing Requests': '#ffc107',
-                'Missing Limits': '#fd7e14',
-                'No Resources': '#dc3545'
-            }
-            
-            fig_issues = px.pie(
-                issue_df,
-                values='count',
-                names='category',
-                title="Pod Resource Configuration Status",
-                color='category',
-                color_discrete_map=issue_colors
-            )
-            st.plotly_chart(fig_issues, use_container_width=True)
+    # Pod resource issues
+    issue_data = {
+        'Complete Resources': efficiency.total_pods_analyzed - problematic_count,
+        'Missing Requests': efficiency.pods_without_requests,
+        'Missing Limits': efficiency.pods_without_limits,
+        'No Resources': efficiency.pods_without_any_resources
+    }
+    issue_counts = {cat: count for cat, count in issue_data.items() if count > 0}
+    
+    issue_colors = {
+        'Complete Resources': '#28a745',
+        'Missing Requests': '#ffc107',
+        'Missing Limits': '#fd7e14',
+        'No Resources': '#dc3545'
+    }
+    
+    severity_colors = {
+        'critical': '#dc3545',
+        'high': '#fd7e14',
+        'medium': '#ffc107',
+        'low': '#17a2b8'
+    }
     
-    with col2:
-        # Severity distribution
-        if efficiency.problematic_pods:
-            severity_counts = {}
-            for pod in efficiency.problematic_pods:
-                severity_counts[pod.issue_severity] = severity_counts.get(pod.issue_severity, 0) + 1
-            
-            severity_data = pd.DataFrame([
-                {'severity': sev, 'count': count}
-                for sev, count in severity_counts.items()
-            ])
-            
-            severity_colors = {
-                'critical': '#dc3545',
-                'high': '#fd7e14',
-                'medium': '#ffc107',
-                'low': '#17a2b8'
-            }
-            
-            fig_severity = px.bar(
-                severity_data,
-                x='severity',
-                y='count',
-                title="Issue Severity Distribution",
-                color='severity',
-                color_discrete_map=severity_colors
-            )
-            fig_severity.update_layout(showlegend=False)
-            st.plotly_chart(fig_severity, use_container_width=True)
+    if efficiency.problematic_pods:
+        # Configuration status and severity distribution in one figure
+        fig_issues = _pie_bar_chart(
+            tuple(issue_counts),
+            tuple(issue_counts.values()),
+            "Pod Resource Configuration Status",
+            tuple(pods_by_severity),
+            tuple(len(pods) for pods in pods_by_severity.values()),
+            "Issue Severity Distribution",
+            x_label='severity',
+            y_label='count',
+            pie_color_map=issue_colors,
+            bar_color_map=severity_colors
+        )
+        st.plotly_chart(fig_issues, use_container_width=True)
+    elif issue_counts:
+        fig_issues = _pie_chart(
+            tuple(issue_counts),
+            tuple(issue_counts.values()),
+            "Pod Resource Configuration Status",
+            color_map=issue_colors
+        )
+        st.plotly_chart(fig_issues, use_container_width=True)
     
     # Problematic pods detailed analysis
     st.subheader("🚨 Pods with Resource Issues")
     
     if efficiency.problematic_pods:
         # Create tabs for different severity levels
-        critical_pods = [p for p in efficiency.problematic_pods if p.issue_severity == 'critical']
-        high_pods = [p for p in efficiency.problematic_pods if p.issue_severity == 'high']
-        medium_pods = [p for p in efficiency.problematic_pods if p.issue_severity == 'medium']
-        low_pods = [p for p in efficiency.problematic_pods if p.issue_severity == 'low']
+        critical_pods = pods_by_severity.get('critical', [])
+        high_pods = pods_by_severity.get('high', [])
+        medium_pods = pods_by_severity.get('medium', [])
+        low_pods = pods_by_severity.get('low', [])
+        
+        # Built once; each severity tab shows a slice of it
+        issues_df = _pod_issues_table(efficiency.problematic_pods)
         
         tabs = []
         if critical_pods:
@@ -1561,20 +1907,10 @@ def render_resource_efficiency(db_client: DatabaseClient, filters: Dict[str, Any
             with tab_objects[tab_index]:
                 st.warning(f"⚠️ **{len(high_pods)} pods with HIGH priority resource issues**")
                 
-                high_data = []
-                for pod in high_pods:
-                    high_data.append({
-                        'Pod Name': pod.name,
-                        'Namespace': pod.namespace,
-                        'Missing Requests': ', '.join(pod.missing_requests) if pod.missing_requests else '✅',
-                        'Missing Limits': ', '.join(pod.missing_limits) if pod.missing_limits else '✅',
-                        'Health': f"{'🟢' if pod.health_status == 'healthy' else '🟡' if pod.health_status == 'warning' else '🔴'} {pod.health_status.title()}",
-                        'Containers': len(pod.containers)
-                    })
-                
-                if high_data:
-                    high_df = pd.DataFrame(high_data)
-                    st.dataframe(high_df, use_container_width=True, hide_index=True)
+                high_df = issues_df.iloc[rows_by_severity['high']][
+                    ['Pod Name', 'Namespace', 'Missing Requests', 'Missing Limits', 'Health', 'Containers']
+                ]
+                st.dataframe(high_df, use_container_width=True, hide_index=True)
             tab_index += 1
         
         # Medium issues tab
@@ -1582,19 +1918,10 @@ def render_resource_efficiency(db_client: DatabaseClient, filters: Dict[str, Any
             with tab_objects[tab_index]:
                 st.info(f"ℹ️ **{len(medium_pods)} pods with MEDIUM priority resource issues**")
                 
-                medium_data = []
-                for pod in medium_pods:
-                    medium_data.append({
-                        'Pod Name': pod.name,
-                        'Namespace': pod.namespace,
-                        'Missing Requests': ', '.join(pod.missing_requests) if pod.missing_requests else '✅',
-                        'Missing Limits': ', '.join(pod.missing_limits) if pod.missing_limits else '✅',
-                        'Health': f"{'🟢' if pod.health_status == 'healthy' else '🟡' if pod.health_status == 'warning' else '🔴'} {pod.health_status.title()}",
-                    })
-                
-                if medium_data:
-                    medium_df = pd.DataFrame(medium_data)
-                    st.dataframe(medium_df, use_container_width=True, hide_index=True)
+                medium_df = issues_df.iloc[rows_by_severity['medium']][
+                    ['Pod Name', 'Namespace', 'Missing Requests', 'Missing Limits', 'Health']
+                ]
+                st.dataframe(medium_df, use_container_width=True, hide_index=True)
             tab_index += 1
         
         # Low issues tab
@@ -1602,46 +1929,17 @@ def render_resource_efficiency(db_client: DatabaseClient, filters: Dict[str, Any
             with tab_objects[tab_index]:
                 st.success(f"📝 **{len(low_pods)} pods with LOW priority resource issues**")
                 
-                low_data = []
-                for pod in low_pods:
-                    low_data.append({
-                        'Pod Name': pod.name,
-                        'Namespace': pod.namespace,
-                        'Missing Requests': ', '.join(pod.missing_requests) if pod.missing_requests else '✅',
-                        'Missing Limits': ', '.join(pod.missing_limits) if pod.missing_limits else '✅',
-                    })
-                
-                if low_data:
-                    low_df = pd.DataFrame(low_data)
-                    st.dataframe(low_df, use_container_width=True, hide_index=True)
+                low_df = issues_df.iloc[rows_by_severity['low']][
+                    ['Pod Name', 'Namespace', 'Missing Requests', 'Missing Limits']
+                ]
+                st.dataframe(low_df, use_container_width=True, hide_index=True)
             tab_index += 1
         
         # All issues tab
         with tab_objects[tab_index]:
             st.subheader("Complete Resource Issues Overview")
             
-            all_issues_data = []
-            for pod in efficiency.problematic_pods:
-                severity_icon = {
-                    'critical': '🚨',
-                    'high': '⚠️', 
-                    'medium': 'ℹ️',
-                    'low': '📝'
-                }.get(pod.issue_severity, '❓')
-                
-                all_issues_data.append({
-                    'Severity': f"{severity_icon} {pod.issue_severity.title()}",
-                    'Pod Name': pod.name,
-                    'Namespace': pod.namespace,
-                    'Missing Requests': ', '.join(pod.missing_requests) if pod.missing_requests else '✅',
-                    'Missing Limits': ', '.join(pod.missing_limits) if pod.missing_limits else '✅',
-                    'Health': f"{'🟢' if pod.health_status == 'healthy' else '🟡' if pod.health_status == 'warning' else '🔴'} {pod.health_status.title()}",
-                    'Containers': len(pod.containers)
-                })
-            
-            if all_issues_data:
-                all_df = pd.DataFrame(all_issues_data)
-                st.dataframe(all_df, use_container_width=True, hide_index=True)
+            st.dataframe(issues_df, use_container_width=True, hide_index=True)
     
     else:
         st.success("🎉 **Excellent!** All pods have proper resource requests and limits configured.")
@@ -1679,43 +1977,11 @@ def render_resource_efficiency(db_client: DatabaseClient, filters: Dict[str, Any
     # Resource optimization recommendations
     st.subheader("💡 Resource Optimization Recommendations")
     
-    recommendations = []
-    
-    if efficiency.pods_without_any_resources > 0:
-        recommendations.append(
-            f"🚨 **CRITICAL**: {efficiency.pods_without_any_resources} pods have NO resource constraints. "
-            "This can cause cluster instability and resource starvation. Add requests and limits immediately."
-        )
-    
-    if efficiency.pods_without_requests > 0:
-        recommendations.append(
-            f"⚠️ **{efficiency.pods_without_requests} pods missing resource requests**. "
-            "Add CPU and memory requests to ensure proper scheduling and prevent resource contention."
-        )
-    
-    if efficiency.pods_without_limits > 0:
-        recommendations.append(
-            f"⚠️ **{efficiency.pods_without_limits} pods missing resource limits**. "
-            "Add CPU and memory limits to prevent resource exhaustion and OOM kills affecting other pods."
-        )
-    
-    if efficiency.resource_coverage_percentage < 70:
-        recommendations.append(
-            f"📊 **Low resource coverage** ({efficiency.resource_coverage_percentage:.1f}%). "
-            "Aim for 90%+ coverage to ensure cluster stability and predictable performance."
-        )
-    
-    if efficiency.unused_config_maps > 0:
-        recommendations.append(
-            f"🗂️ **{efficiency.unused_config_maps} unused ConfigMaps** detected. "
-            "Review and clean up unused configuration objects to reduce cluster clutter."
-        )
-    
-    if efficiency.orphaned_pvcs > 0:
-        recommendations.append(
-            f"💾 **{efficiency.orphaned_pvcs} orphaned PVCs** in pending state. "
-            "Check storage classes and provisioners to resolve storage issues."
-        )
+    recommendations = [
+        template.format(e=efficiency)
+        for applies, template in EFFICIENCY_RECOMMENDATIONS
+        if applies(efficiency)
+    ]
     
     if not recommendations:
         recommendations.append(
@@ -1723,8 +1989,63 @@ def render_resource_efficiency(db_client: DatabaseClient, filters: Dict[str, Any
             "Continue monitoring to maintain this high standard."
         )
     
-    for rec in recommendations:
-        st.markdown(rec)
+    # One markdown element for all recommendations
+    st.markdown("\n\n".join(recommendations))
+    
+    # Export functionality
+    st.subheader("📤 Export Resource Issues")
+    
+    if efficiency.problematic_pods:
+        db_key = _db_key(db_client)
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.download_button(
+                label="📄 Download Full Report (JSON)",
+                data=_efficiency_json_export(db_key, efficiency, recommendations),
+                file_name=f"resource_efficiency_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                mime="application/json"
+            )
+        
+        with col2:
+            st.download_button(
+                label="📊 Download CSV Report",
+                data=_efficiency_csv_export(db_key, efficiency),
+                file_name=f"pod_resource_issues_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv"
+            )
+    
+    # Quick fix examples
+    if efficiency.problematic_pods:
+        st.subheader("🔧 Quick Fix Examples")
+        
+        st.markdown("""
+        **Add resource requests and limits to your pod specifications:**
+        
+        ```yaml
+        apiVersion: v1
+        kind: Pod
+        metadata:
+          name: example-pod
+        spec:
+          containers:
+          - name: app-container
+            image: nginx
+            resources:
+              requests:
+                memory: "64Mi"
+                cpu: "250m"
+              limits:
+                memory: "128Mi"
+                cpu: "500m"
+        ```
+        
+        **Best Practices:**
+        - Set requests based on actual resource usage patterns
+        - Set limits slightly higher than requests to allow bursting
+        - Monitor actual usage and adjust over time
+        - Use VPA (Vertical Pod Autoscaler) for automatic recommendations
+        """)
 
 
 def render_label_analysis(db_client: DatabaseClient, filters: Dict[str, Any]):
@@ -1851,11 +2172,11 @@ def render_application_view(db_client: DatabaseClient, filters: Dict[str, Any]):
                 if app_health in health_counts:
                     health_counts[app_health] += 1
             
-            health_data = pd.DataFrame([
-                {'status': status, 'count': count}
-                for status, count in health_counts.items()
-                if count > 0
-            ])
+            present = [status for status, count in health_counts.items() if count > 0]
+            health_data = pd.DataFrame({
+                'status': present,
+                'count': [health_counts[status] for status in present]
+            })
             
             if not health_data.empty:
                 color_map = {
@@ -1878,15 +2199,13 @@ def render_application_view(db_client: DatabaseClient, filters: Dict[str, Any]):
     with col2:
         # Applications by resource count
         if app_viewpoint.applications:
-            app_resources_data = pd.DataFrame([
-                {
-                    'application': app['name'],
-                    'resources': app['resource_count'],
-                    'namespaces': len(app['namespaces']),
-                    'components': len(app['component_types'])
-                }
-                for app in sorted(app_viewpoint.applications, key=lambda x: x['resource_count'], reverse=True)[:10]
-            ])
+            top_apps = sorted(app_viewpoint.applications, key=lambda x: x['resource_count'], reverse=True)[:10]
+            app_resources_data = pd.DataFrame({
+                'application': [app['name'] for app in top_apps],
+                'resources': [app['resource_count'] for app in top_apps],
+                'namespaces': [len(app['namespaces']) for app in top_apps],
+                'components': [len(app['component_types']) for app in top_apps]
+            })
             
             fig_apps = px.bar(
                 app_resources_data,
@@ -1965,11 +2284,12 @@ def render_application_view(db_client: DatabaseClient, filters: Dict[str, Any]):
                             'Namespace': resource['namespace'],
                             'Kind': resource['kind'],
                             'Label Value': resource['labels'][selected_label],
-                            'Health': f"{'🟢' if resource['health_status'] == 'healthy' else '🟡' if resource['health_status'] == 'warning' else '🔴'} {resource['health_status'].title()}"
+                            'Health': resource['health_status']
                         })
             
             if selected_resources:
                 selected_df = pd.DataFrame(selected_resources)
+                selected_df['Health'] = selected_df['Health'].map(HEALTH_BADGE).fillna(selected_df['Health'])
                 st.dataframe(selected_df, use_container_width=True, hide_index=True)
                 st.info(f"Found {len(selected_resources)} resources with label '{selected_label}'")
             else:
@@ -2025,12 +2345,13 @@ def render_application_view(db_client: DatabaseClient, filters: Dict[str, Any]):
                 'Resource Name': resource['name'],
                 'Namespace': resource.get('namespace', 'cluster-wide'),
                 'Kind': resource['kind'],
-                'Health': f"{'🟢' if resource['health_status'] == 'healthy' else '🟡' if resource['health_status'] == 'warning' else '🔴'} {resource['health_status'].title()}",
+                'Health': resource['health_status'],
                 'Existing Labels': label_summary if label_summary else 'None',
                 'Labels Count': len(existing_labels)
             })
         
         orphaned_df = pd.DataFrame(orphaned_data)
+        orphaned_df['Health'] = orphaned_df['Health'].map(HEALTH_BADGE).fillna(orphaned_df['Health'])
         orphaned_df = orphaned_df.sort_values(['Namespace', 'Kind', 'Resource Name'])
         
         st.dataframe(orphaned_df, use_container_width=True, hide_index=True)
@@ -2070,11 +2391,9 @@ def render_application_view(db_client: DatabaseClient, filters: Dict[str, Any]):
         app_details_data = []
         for app in app_viewpoint.applications:
             app_name = app['name']
-            health_icon = '🟢' if app['health'] == 'healthy' else '🟡' if app['health'] == 'warning' else '🔴'
-            
             app_details_data.append({
                 'Application': app_name,
-                'Health': f"{health_icon} {app['health'].title()}",
+                'Health': app['health'],
                 'Resources': app['resource_count'],
                 'Namespaces': ', '.join(app['namespaces']),
                 'Component Types': ', '.join(app['component_types']),
@@ -2083,6 +2402,7 @@ def render_application_view(db_client: DatabaseClient, filters: Dict[str, Any]):
             })
         
         app_details_df = pd.DataFrame(app_details_data)
+        app_details_df['Health'] = app_details_df['Health'].map(HEALTH_BADGE).fillna(app_details_df['Health'])
         app_details_df = app_details_df.sort_values('Resources', ascending=False)
         
         st.dataframe(app_details_df, use_container_width=True, hide_index=True)
@@ -2117,8 +2437,7 @@ def render_application_view(db_client: DatabaseClient, filters: Dict[str, Any]):
                 
                 with col4:
                     health_status = app_viewpoint.application_health.get(selected_app, 'unknown')
-                    health_icon = '🟢' if health_status == 'healthy' else '🟡' if health_status == 'warning' else '🔴'
-                    st.metric("Health", f"{health_icon} {health_status.title()}")
+                    st.metric("Health", HEALTH_BADGE.get(health_status, health_status))
                 
                 # Resource breakdown for selected application
                 resource_details = []
@@ -2127,11 +2446,14 @@ def render_application_view(db_client: DatabaseClient, filters: Dict[str, Any]):
                         'Resource Name': resource['name'],
                         'Namespace': resource['namespace'],
                         'Kind': resource['kind'],
-                        'Health': f"{'🟢' if resource['health_status'] == 'healthy' else '🟡' if resource['health_status'] == 'warning' else '🔴'} {resource['health_status'].title()}",
+                        'Health': resource['health_status'],
                         'Labels Count': len(resource.get('labels', {}))
                     })
                 
                 resource_details_df = pd.DataFrame(resource_details)
+                resource_details_df['Health'] = (
+                    resource_details_df['Health'].map(HEALTH_BADGE).fillna(resource_details_df['Health'])
+                )
                 resource_details_df = resource_details_df.sort_values(['Namespace', 'Kind', 'Resource Name'])
                 
                 st.dataframe(resource_details_df, use_container_width=True, hide_index=True)
@@ -2166,7 +2488,7 @@ def render_application_view(db_client: DatabaseClient, filters: Dict[str, Any]):
         
         st.download_button(
             label="📊 Download Application Report (JSON)",
-            data=json.dumps(export_data, indent=2, default=str),
+            data=_export_json(export_data),
             file_name=f"application_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json"
         )
@@ -2188,88 +2510,3 @@ def render_cost_optimization_view(db_client: DatabaseClient, filters: Dict[str,
     """Render cost optimization view (placeholder)."""
     st.header("💰 Cost Optimization")
     st.info("Cost optimization view coming soon!")
-    
-    # Export functionality
-    st.subheader("📤 Export Resource Issues")
-    
-    if efficiency.problematic_pods:
-        # Create export data
-        export_data = {
-            'summary': {
-                'total_pods_analyzed': efficiency.total_pods_analyzed,
-                'resource_coverage_percentage': efficiency.resource_coverage_percentage,
-                'pods_without_requests': efficiency.pods_without_requests,
-                'pods_without_limits': efficiency.pods_without_limits,
-                'pods_without_any_resources': efficiency.pods_without_any_resources
-            },
-            'problematic_pods': [pod.dict() for pod in efficiency.problematic_pods],
-            'recommendations': recommendations
-        }
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.download_button(
-                label="📄 Download Full Report (JSON)",
-                data=json.dumps(export_data, indent=2, default=str),
-                file_name=f"resource_efficiency_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
-            )
-        
-        with col2:
-            # Create CSV for problematic pods
-            csv_data = []
-            for pod in efficiency.problematic_pods:
-                csv_data.append({
-                    'pod_name': pod.name,
-                    'namespace': pod.namespace,
-                    'severity': pod.issue_severity,
-                    'missing_requests': ','.join(pod.missing_requests),
-                    'missing_limits': ','.join(pod.missing_limits),
-                    'health_status': pod.health_status,
-                    'containers': ','.join(pod.containers),
-                    'recommendations': ' | '.join(pod.recommendations)
-                })
-            
-            if csv_data:
-                csv_df = pd.DataFrame(csv_data)
-                csv_string = csv_df.to_csv(index=False)
-                
-                st.download_button(
-                    label="📊 Download CSV Report",
-                    data=csv_string,
-                    file_name=f"pod_resource_issues_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-    
-    # Quick fix examples
-    if efficiency.problematic_pods:
-        st.subheader("🔧 Quick Fix Examples")
-        
-        st.markdown("""
-        **Add resource requests and limits to your pod specifications:**
-        
-        ```yaml
-        apiVersion: v1
-        kind: Pod
-        metadata:
-          name: example-pod
-        spec:
-          containers:
-          - name: app-container
-            image: nginx
-            resources:
-              requests:
-                memory: "64Mi"
-                cpu: "250m"
-              limits:
-                memory: "128Mi"
-                cpu: "500m"
-        ```
-        
-        **Best Practices:**
-        - Set requests based on actual resource usage patterns
-        - Set limits slightly higher than requests to allow bursting
-        - Monitor actual usage and adjust over time
-        - Use VPA (Vertical Pod Autoscaler) for automatic recommendations
-        """)
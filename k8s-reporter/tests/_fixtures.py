@@ -0,0 +1,49 @@
+"""
+Shared helpers for building throwaway SQLite fixture databases.
+"""
+
+import os
+import sqlite3
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+# DatabaseClient reads from a file path, so fixtures cannot be ':memory:'
+# databases; they are kept on a tmpfs instead when one is available
+SHM_PATH = Path("/dev/shm")
+FIXTURE_DIR = str(SHM_PATH) if SHM_PATH.is_dir() and os.access(SHM_PATH, os.W_OK) else None
+
+Builder = Callable[[sqlite3.Connection], None]
+
+
+@lru_cache(maxsize=None)
+def template_image(build: Builder) -> bytes:
+    """Run a builder once into an in-memory database and return its file image."""
+    conn = sqlite3.connect(":memory:")
+    build(conn)
+    
+    if hasattr(conn, "serialize"):
+        image = conn.serialize()
+    else:
+        # Connection.serialize is new in Python 3.11; go through a file instead
+        with tempfile.TemporaryDirectory(dir=FIXTURE_DIR) as tmp_dir:
+            tmp_path = Path(tmp_dir) / "template.db"
+            dest = sqlite3.connect(tmp_path)
+            conn.backup(dest)
+            dest.close()
+            image = tmp_path.read_bytes()
+    
+    conn.close()
+    return image
+
+
+def create_fixture_database(build: Builder) -> str:
+    """Create a fixture database file holding a copy of the builder's template.
+    
+    The serialized template is written out as is, so no SQL runs per fixture.
+    """
+    with tempfile.NamedTemporaryFile(suffix='.db', dir=FIXTURE_DIR, delete=False) as db_file:
+        db_file.write(template_image(build))
+    
+    return db_file.name
@@ -2,182 +2,434 @@
 Tests for k8s-reporter database functionality.
 """
 
+import os
 import pytest
-import tempfile
 import sqlite3
+import subprocess
+import sys
 from pathlib import Path
 
+from _fixtures import create_fixture_database
 from k8s_reporter.database import DatabaseClient
 from k8s_reporter.models import ResourceSummary
 
+# Simplified k8s-analyzer schema for the sample data
+SCHEMA_SQL = """
+    CREATE TABLE resources (
+        id INTEGER PRIMARY KEY,
+        uid TEXT,
+        name TEXT,
+        namespace TEXT,
+        kind TEXT,
+        health_status TEXT,
+        issues TEXT
+    );
 
-def create_test_database():
-    """Create a test SQLite database with sample data."""
-    # Create temporary database
-    db_file = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
-    db_path = db_file.name
-    db_file.close()
-    
-    # Create database schema and sample data
-    conn = sqlite3.connect(db_path)
+    -- Mirror the k8s-analyzer indexes behind the namespace and kind lookups
+    CREATE INDEX idx_resources_kind ON resources (kind);
+    CREATE INDEX idx_resources_namespace ON resources (namespace);
+
+    CREATE TABLE relationships (
+        id INTEGER PRIMARY KEY,
+        source_uid TEXT,
+        target_resource TEXT,
+        relationship_type TEXT,
+        source_kind TEXT,
+        target_kind TEXT
+    );
+
+    CREATE TABLE analysis_summary (
+        id INTEGER PRIMARY KEY,
+        analysis_timestamp TEXT,
+        total_resources INTEGER,
+        total_relationships INTEGER,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+
+def populate_sample_database(conn: sqlite3.Connection) -> None:
+    """Create the sample schema and data."""
     cursor = conn.cursor()
     
-    # Create tables (simplified schema)
-    cursor.execute("""
-        CREATE TABLE resources (
-            id INTEGER PRIMARY KEY,
-            uid TEXT,
-            name TEXT,
-            namespace TEXT,
-            kind TEXT,
-            health_status TEXT,
-            issues TEXT
-        )
-    """)
+    cursor.executescript(SCHEMA_SQL)
     
-    cursor.execute("""
-        CREATE TABLE relationships (
-            id INTEGER PRIMARY KEY,
-            source_uid TEXT,
-            target_resource TEXT,
-            relationship_type TEXT,
-            source_kind TEXT,
-            target_kind TEXT
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE analysis_summary (
-            id INTEGER PRIMARY KEY,
-            analysis_timestamp TEXT,
-            total_resources INTEGER,
-            total_relationships INTEGER
-        )
-    """)
-    
-    # Insert sample data
-    cursor.execute("""
+    # Insert sample data in a single transaction
+    cursor.executescript("""
+        BEGIN;
+        
         INSERT INTO resources (uid, name, namespace, kind, health_status, issues)
         VALUES 
             ('pod-1', 'test-pod', 'default', 'Pod', 'healthy', '[]'),
             ('svc-1', 'test-service', 'default', 'Service', 'warning', '["No endpoints"]'),
-            ('cm-1', 'config-map', 'default', 'ConfigMap', 'healthy', '[]')
-    """)
-    
-    cursor.execute("""
+            ('cm-1', 'config-map', 'default', 'ConfigMap', 'healthy', '[]');
+        
         INSERT INTO relationships (source_uid, target_resource, relationship_type, source_kind, target_kind)
-        VALUES ('svc-1', 'Pod/test-pod', 'selects', 'Service', 'Pod')
-    """)
-    
-    cursor.execute("""
+        VALUES ('svc-1', 'Pod/test-pod', 'selects', 'Service', 'Pod');
+        
         INSERT INTO analysis_summary (analysis_timestamp, total_resources, total_relationships)
-        VALUES ('2023-01-01T00:00:00', 3, 1)
+        VALUES ('2023-01-01T00:00:00', 3, 1);
+        
+        COMMIT;
     """)
-    
-    conn.commit()
-    conn.close()
-    
-    return db_path
+
+
+def create_test_database():
+    """Create a test SQLite database with sample data."""
+    return create_fixture_database(populate_sample_database)
+
+
+@pytest.fixture(scope="module")
+def db_client():
+    """A client over one sample database shared by the read-only tests."""
+    db_path = create_test_database()
+    client = DatabaseClient(db_path)
+    yield client
+    client.close()
+    Path(db_path).unlink()
 
 
 class TestDatabaseClient:
     """Test DatabaseClient functionality."""
     
-    def test_database_client_initialization(self):
+    def test_database_client_initialization(self, db_client):
         """Test DatabaseClient initialization."""
-        db_path = create_test_database()
-        
-        try:
-            client = DatabaseClient(db_path)
-            assert client.db_path.exists()
-        finally:
-            Path(db_path).unlink()
+        assert db_client.db_path.exists()
     
     def test_database_client_nonexistent_file(self):
         """Test DatabaseClient with nonexistent file."""
         with pytest.raises(FileNotFoundError):
             DatabaseClient("/nonexistent/path.db")
     
-    def test_get_resource_summary(self):
+    def test_database_client_does_not_create_file(self):
+        """Test that a database removed after initialization is not recreated."""
+        db_path = create_test_database()
+        client = DatabaseClient(db_path)
+        Path(db_path).unlink()
+        
+        with pytest.raises(sqlite3.OperationalError):
+            client.get_connection()
+        assert not Path(db_path).exists()
+    
+    def test_get_resource_summary(self, db_client):
         """Test getting resource summary."""
+        summary = db_client.get_resource_summary()
+        
+        assert isinstance(summary, ResourceSummary)
+        assert summary.total_resources == 3
+        assert summary.total_relationships == 1
+        assert 'healthy' in summary.health_distribution
+        assert 'warning' in summary.health_distribution
+        assert 'Pod' in summary.resource_types
+        assert 'Service' in summary.resource_types
+        assert 'ConfigMap' in summary.resource_types
+    
+    def test_get_resource_summary_counts(self):
+        """Test that summary counts agree with the individual resources."""
         db_path = create_test_database()
         
         try:
-            client = DatabaseClient(db_path)
-            summary = client.get_resource_summary()
+            conn = sqlite3.connect(db_path)
+            conn.execute("""
+                INSERT INTO resources (uid, name, namespace, kind, health_status, issues)
+                VALUES
+                    ('pod-2', 'other-pod', 'kube-system', 'Pod', 'error', '["CrashLoopBackOff"]'),
+                    ('node-1', 'node', NULL, 'Node', 'healthy', NULL)
+            """)
+            conn.commit()
+            conn.close()
+            
+            summary = DatabaseClient(db_path).get_resource_summary()
             
-            assert isinstance(summary, ResourceSummary)
-            assert summary.total_resources == 3
-            assert summary.total_relationships == 1
-            assert 'healthy' in summary.health_distribution
-            assert 'warning' in summary.health_distribution
-            assert 'Pod' in summary.resource_types
-            assert 'Service' in summary.resource_types
-            assert 'ConfigMap' in summary.resource_types
+            assert summary.total_resources == 5
+            assert summary.namespaces_count == 2
+            assert summary.issues_count == 2
+            assert summary.health_distribution == {'error': 1, 'healthy': 3, 'warning': 1}
+            assert list(summary.resource_types.items()) == [
+                ('Pod', 2), ('ConfigMap', 1), ('Node', 1), ('Service', 1)
+            ]
             
         finally:
             Path(db_path).unlink()
     
-    def test_get_namespaces(self):
-        """Test getting namespace list."""
+    def test_cluster_overview_health_ratio_ignores_null_status(self):
+        """Test that resources without a health status do not count as healthy."""
         db_path = create_test_database()
         
         try:
-            client = DatabaseClient(db_path)
-            namespaces = client.get_namespaces()
+            conn = sqlite3.connect(db_path)
+            conn.execute("""
+                INSERT INTO resources (uid, name, namespace, kind, health_status, issues)
+                VALUES ('cm-2', 'unknown-config', 'default', 'ConfigMap', NULL, NULL)
+            """)
+            conn.commit()
+            conn.close()
+            
+            overview = DatabaseClient(db_path).get_cluster_overview()
             
-            assert isinstance(namespaces, list)
-            assert 'default' in namespaces
+            assert overview.total_resources == 4
+            assert overview.healthy_resources == 2
+            assert dict(overview.issues_summary) == {'warning': 1}
+            assert overview.health_ratio == 50.0
             
         finally:
             Path(db_path).unlink()
     
-    def test_get_resource_kinds(self):
+    def test_get_namespaces(self, db_client):
+        """Test getting namespace list."""
+        namespaces = db_client.get_namespaces()
+        
+        assert isinstance(namespaces, list)
+        assert 'default' in namespaces
+    
+    def test_get_resource_kinds(self, db_client):
         """Test getting resource kinds."""
-        db_path = create_test_database()
+        kinds = db_client.get_resource_kinds()
         
-        try:
-            client = DatabaseClient(db_path)
-            kinds = client.get_resource_kinds()
-            
-            assert isinstance(kinds, list)
-            assert 'Pod' in kinds
-            assert 'Service' in kinds
-            assert 'ConfigMap' in kinds
-            
-        finally:
-            Path(db_path).unlink()
+        assert isinstance(kinds, list)
+        assert 'Pod' in kinds
+        assert 'Service' in kinds
+        assert 'ConfigMap' in kinds
     
-    def test_search_resources(self):
+    def test_search_resources(self, db_client):
         """Test resource search functionality."""
-        db_path = create_test_database()
+        results = db_client.search_resources('test')
         
-        try:
-            client = DatabaseClient(db_path)
-            results = client.search_resources('test')
-            
-            assert isinstance(results, list)
-            assert len(results) >= 2  # Should find test-pod and test-service
-            
-            # Check result structure
-            if results:
-                result = results[0]
-                assert 'name' in result
-                assert 'namespace' in result
-                assert 'kind' in result
-                assert 'health_status' in result
-            
-        finally:
-            Path(db_path).unlink()
+        assert isinstance(results, list)
+        assert len(results) >= 2  # Should find test-pod and test-service
+        
+        # Check result structure
+        if results:
+            result = results[0]
+            assert 'name' in result
+            assert 'namespace' in result
+            assert 'kind' in result
+            assert 'health_status' in result
+    
+    def test_get_resources_dataframe_health_filter(self, db_client):
+        """Test filtering resources by one or several health statuses."""
+        warning_df = db_client.get_resources_dataframe({'health_status': 'warning'})
+        assert list(warning_df['name']) == ['test-service']
+        
+        both_df = db_client.get_resources_dataframe({'health_status': ('warning', 'healthy')})
+        assert sorted(both_df['name']) == ['config-map', 'test-pod', 'test-service']
 
 
-def test_imports():
-    """Test that all modules can be imported."""
-    from k8s_reporter import DatabaseClient
-    from k8s_reporter.models import ResourceSummary, ClusterOverview
-    from k8s_reporter.database import DatabaseClient as DatabaseClientImport
+def test_package_reexports():
+    """Test that package re-exports resolve to the defining modules."""
+    import k8s_reporter
+    from k8s_reporter.models import ClusterOverview
     
-    assert DatabaseClient is not None
-    assert ResourceSummary is not None
-    assert ClusterOverview is not None
-    assert DatabaseClientImport is not None
+    assert k8s_reporter.ClusterOverview is ClusterOverview
+    assert k8s_reporter.DatabaseClient is DatabaseClient
+
+
+def test_package_import_is_lazy():
+    """Test that importing the package does not pull in heavy dependencies."""
+    code = (
+        "import sys, k8s_reporter; "
+        "assert 'pandas' not in sys.modules; "
+        "assert 'k8s_reporter.database' not in sys.modules; "
+        "assert k8s_reporter.DatabaseClient.__name__ == 'DatabaseClient'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_analysis_views_are_built_lazily():
+    """Test that analysis views are built on access and then reused."""
+    from k8s_reporter.models import ANALYSIS_VIEWS
+    
+    assert "overview" in ANALYSIS_VIEWS
+    assert len(ANALYSIS_VIEWS) == len(list(ANALYSIS_VIEWS))
+    
+    view = ANALYSIS_VIEWS["overview"]
+    assert view.get_title() == "🏠 Cluster Overview"
+    assert ANALYSIS_VIEWS["overview"] is view
+    
+    with pytest.raises(KeyError):
+        ANALYSIS_VIEWS["missing"]
+
+
+def test_report_models_are_immutable():
+    """Test that report records are frozen and do not share mutable defaults."""
+    from dataclasses import FrozenInstanceError
+    from pydantic import ValidationError
+    from k8s_reporter.models import NamespaceComponent, SecurityAnalysis
+    
+    first = NamespaceComponent(name="a", kind="Pod", health_status="healthy")
+    second = NamespaceComponent(name="b", kind="Pod", health_status="healthy")
+    assert first.issues is not second.issues
+    with pytest.raises(FrozenInstanceError):
+        first.name = "c"
+    
+    security = SecurityAnalysis(
+        privileged_pods=0,
+        pods_without_security_context=0,
+        root_containers=0,
+        service_accounts_count=0,
+        role_bindings_count=0,
+        cluster_role_bindings=0,
+        secrets_count=0,
+        config_maps_count=0,
+    )
+    with pytest.raises(ValidationError):
+        security.privileged_pods = 1
+    
+    counts = {'Pod': 1}
+    summary = ResourceSummary(
+        total_resources=1,
+        total_relationships=0,
+        health_distribution={'healthy': 1},
+        resource_types=counts,
+        namespaces_count=1,
+        issues_count=0,
+    )
+    counts['Service'] = 1
+    assert dict(summary.resource_types) == {'Pod': 1}
+    with pytest.raises(TypeError):
+        summary.health_distribution['error'] = 1
+    with pytest.raises(FrozenInstanceError):
+        summary.total_resources = 2
+
+
+def test_aggregates_are_cached_until_database_changes():
+    """Test that aggregates are reused across clients until the file changes."""
+    from k8s_reporter.cache import clear_cache
+    
+    db_path = create_test_database()
+    clear_cache()
+    
+    try:
+        summary = DatabaseClient(db_path).get_resource_summary()
+        assert DatabaseClient(db_path).get_resource_summary() is summary
+        
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            INSERT INTO resources (uid, name, namespace, kind, health_status, issues)
+            VALUES ('pod-2', 'other-pod', 'default', 'Pod', 'healthy', '[]')
+        """)
+        conn.commit()
+        conn.close()
+        stat = os.stat(db_path)
+        os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        refreshed = DatabaseClient(db_path).get_resource_summary()
+        assert refreshed is not summary
+        assert refreshed.total_resources == 4
+    finally:
+        clear_cache()
+        Path(db_path).unlink()
+
+
+def test_aggregates_see_uncheckpointed_wal_writes():
+    """Test that commits still in the WAL file invalidate cached aggregates."""
+    from k8s_reporter.cache import clear_cache
+    
+    db_path = create_test_database()
+    clear_cache()
+    writer = sqlite3.connect(db_path)
+    writer.execute("PRAGMA journal_mode=WAL")
+    client = DatabaseClient(db_path)
+    
+    try:
+        assert client.get_resource_summary().total_resources == 3
+        main_stat = os.stat(db_path)
+        
+        writer.execute("""
+            INSERT INTO resources (uid, name, namespace, kind, health_status, issues)
+            VALUES ('pod-2', 'other-pod', 'default', 'Pod', 'healthy', '[]')
+        """)
+        writer.commit()
+        
+        # The commit only reached the WAL file
+        assert os.stat(db_path).st_size == main_stat.st_size
+        assert client.get_resource_summary().total_resources == 4
+    finally:
+        writer.close()
+        client.close()
+        clear_cache()
+        for suffix in ("", "-wal", "-shm"):
+            Path(db_path + suffix).unlink(missing_ok=True)
+
+
+def test_report_containers_keep_record_instances():
+    """Test that record lists are stored as built, without per-row revalidation."""
+    from k8s_reporter.models import NamespaceComponent, NamespaceComponentsView
+    
+    components = [
+        NamespaceComponent(name=f"pod-{i}", kind="Pod", health_status="healthy")
+        for i in range(3)
+    ]
+    view = NamespaceComponentsView(
+        namespace="default",
+        total_components=len(components),
+        components=components,
+        relationships=[],
+        component_groups={},
+        dependency_chains=[],
+        orphaned_components=[],
+        critical_components=[],
+        health_distribution={"healthy": len(components)},
+        relationship_types={},
+    )
+    
+    assert all(a is b for a, b in zip(view.components, components))
+
+
+def test_temporal_analysis_parses_timestamps_in_sqlite():
+    """Test that temporal analysis skips unparseable creation timestamps."""
+    from datetime import datetime, timedelta, timezone
+    
+    db_path = create_test_database()
+    recent = (datetime.now(timezone.utc) - timedelta(days=3)).replace(microsecond=0)
+    
+    try:
+        conn = sqlite3.connect(db_path)
+        conn.execute("ALTER TABLE resources ADD COLUMN creation_timestamp TEXT")
+        conn.execute(
+            "UPDATE resources SET creation_timestamp = ? WHERE uid = 'pod-1'",
+            (recent.isoformat().replace("+00:00", "Z"),),
+        )
+        conn.execute("UPDATE resources SET creation_timestamp = 'not-a-date' WHERE uid = 'svc-1'")
+        conn.commit()
+        conn.close()
+        
+        temporal = DatabaseClient(db_path).get_temporal_analysis()
+        
+        assert temporal.total_resources == 1
+        assert temporal.creation_patterns == {recent.strftime('%A'): 1}
+        assert temporal.creation_timeline[0]['date'] == recent.strftime('%Y-%m-%d')
+        [newest] = temporal.newest_resources
+        assert newest.age_days == 3
+        assert newest.created_at == recent
+    finally:
+        Path(db_path).unlink()
+
+
+def test_build_dependency_chains():
+    """Test dependency chain discovery over namespace relationships."""
+    from k8s_reporter.models import NamespaceRelationship
+    
+    def rel(source, target):
+        return NamespaceRelationship(
+            source_name=source, source_kind="Deployment",
+            target_name=target, target_kind="Service",
+            relationship_type="depends_on",
+        )
+    
+    db_path = create_test_database()
+    
+    try:
+        client = DatabaseClient(db_path)
+        relationships = [rel("ingress", "svc"), rel("svc", "pod"), rel("pod", "ingress")]
+        
+        assert client._build_dependency_chains(relationships) == [["ingress", "svc", "pod"]]
+        assert client._build_dependency_chains(relationships[:1]) == []
+        
+        separate = [rel(f"{name}-{i}", f"{name}-{i + 1}") for name in "abc" for i in range(2)]
+        assert client._build_dependency_chains(separate, limit=2) == [
+            ["a-0", "a-1", "a-2"],
+            ["b-0", "b-1", "b-2"],
+        ]
+    finally:
+        Path(db_path).unlink()
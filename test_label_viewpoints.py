@@ -1,276 +1,274 @@
-#!/usr/bin/env python3
 """
-Test script to verify the new label-based viewpoints work correctly.
+Tests for the label-based viewpoints.
+
+Run with pytest from the repository root.
 """
 
-import sys
-import os
-import sqlite3
 import json
+import logging
 from datetime import datetime, timezone
+from pathlib import Path
 
-# Add the k8s-reporter src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'k8s-reporter', 'src'))
+import pytest
 
-from k8s_reporter.models import (
-    LabelAnalysis, 
-    ApplicationViewpoint, 
-    EnvironmentViewpoint, 
-    TeamOwnershipViewpoint, 
-    CostOptimizationViewpoint,
-    ANALYSIS_VIEWS
-)
+from _fixtures import create_fixture_database
+from k8s_reporter.models import ANALYSIS_VIEWS
 from k8s_reporter.database import DatabaseClient
 
+logger = logging.getLogger(__name__)
 
-def create_test_database():
-    """Create a temporary SQLite database with test data."""
-    db_path = "/tmp/test_labels.db"
-    
-    # Remove existing database
-    if os.path.exists(db_path):
-        os.remove(db_path)
-    
-    conn = sqlite3.connect(db_path)
+# Schema of the tables the label viewpoints read
+SCHEMA_SQL = '''
+    CREATE TABLE resources (
+        uid TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        namespace TEXT,
+        kind TEXT NOT NULL,
+        labels TEXT,
+        health_status TEXT DEFAULT 'healthy',
+        issues TEXT DEFAULT '[]',
+        spec TEXT,
+        status TEXT,
+        creation_timestamp TEXT
+    );
+
+    CREATE TABLE relationships (
+        id INTEGER PRIMARY KEY,
+        source_uid TEXT,
+        target_resource TEXT,
+        relationship_type TEXT,
+        strength REAL DEFAULT 1.0,
+        description TEXT,
+        source_namespace TEXT,
+        target_namespace TEXT
+    );
+
+    CREATE TABLE analysis_summary (
+        id INTEGER PRIMARY KEY,
+        analysis_timestamp TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+'''
+
+# Test resources, with their labels serialized once at import rather than on
+# every fixture build
+TEST_RESOURCES = [
+    {
+        'uid': 'pod-1',
+        'name': 'webapp-frontend',
+        'namespace': 'production',
+        'kind': 'Pod',
+        'labels': json.dumps({
+            'app.kubernetes.io/name': 'webapp',
+            'app.kubernetes.io/component': 'frontend',
+            'app.kubernetes.io/version': '1.2.0',
+            'environment': 'production',
+            'team': 'frontend-team',
+            'cost-center': 'engineering'
+        }),
+        'health_status': 'healthy',
+        'creation_timestamp': '2024-01-15T10:30:00Z'
+    },
+    {
+        'uid': 'pod-2',
+        'name': 'webapp-backend',
+        'namespace': 'production',
+        'kind': 'Pod',
+        'labels': json.dumps({
+            'app.kubernetes.io/name': 'webapp',
+            'app.kubernetes.io/component': 'backend',
+            'app.kubernetes.io/version': '1.2.0',
+            'environment': 'production',
+            'team': 'backend-team',
+            'cost-center': 'engineering'
+        }),
+        'health_status': 'healthy',
+        'creation_timestamp': '2024-01-15T10:31:00Z'
+    },
+    {
+        'uid': 'pod-3',
+        'name': 'database',
+        'namespace': 'production',
+        'kind': 'Pod',
+        'labels': json.dumps({
+            'app.kubernetes.io/name': 'database',
+            'app.kubernetes.io/component': 'storage',
+            'environment': 'production',
+            'team': 'data-team',
+            'cost-center': 'infrastructure'
+        }),
+        'health_status': 'warning',
+        'creation_timestamp': '2024-01-10T09:00:00Z'
+    },
+    {
+        'uid': 'pod-4',
+        'name': 'test-app',
+        'namespace': 'staging',
+        'kind': 'Pod',
+        'labels': json.dumps({
+            'app.kubernetes.io/name': 'webapp',
+            'app.kubernetes.io/component': 'frontend',
+            'app.kubernetes.io/version': '1.3.0-beta',
+            'environment': 'staging',
+            'team': 'frontend-team',
+            'cost-center': 'engineering'
+        }),
+        'health_status': 'healthy',
+        'creation_timestamp': '2024-01-20T14:00:00Z'
+    },
+    {
+        'uid': 'pod-5',
+        'name': 'legacy-service',
+        'namespace': 'default',
+        'kind': 'Pod',
+        'labels': json.dumps({}),  # No labels
+        'health_status': 'error',
+        'creation_timestamp': '2023-12-01T08:00:00Z'
+    },
+    {
+        'uid': 'svc-1',
+        'name': 'webapp-service',
+        'namespace': 'production',
+        'kind': 'Service',
+        'labels': json.dumps({
+            'app.kubernetes.io/name': 'webapp',
+            'environment': 'production',
+            'team': 'frontend-team'
+        }),
+        'health_status': 'healthy',
+        'creation_timestamp': '2024-01-15T10:00:00Z'
+    }
+]
+
+INSERT_RESOURCE_SQL = '''
+    INSERT INTO resources (uid, name, namespace, kind, labels, health_status, creation_timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def populate_label_database(conn):
+    """Create the label test schema and data."""
     cursor = conn.cursor()
     
-    # Create schema
-    cursor.execute('''
-        CREATE TABLE resources (
-            uid TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            namespace TEXT,
-            kind TEXT NOT NULL,
-            labels TEXT,
-            health_status TEXT DEFAULT 'healthy',
-            issues TEXT DEFAULT '[]',
-            spec TEXT,
-            status TEXT,
-            creation_timestamp TEXT
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE relationships (
-            id INTEGER PRIMARY KEY,
-            source_uid TEXT,
-            target_resource TEXT,
-            relationship_type TEXT,
-            strength REAL DEFAULT 1.0,
-            description TEXT,
-            source_namespace TEXT,
-            target_namespace TEXT
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE analysis_summary (
-            id INTEGER PRIMARY KEY,
-            analysis_timestamp TEXT,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
+    cursor.executescript(SCHEMA_SQL)
     
-    # Insert test data
-    test_resources = [
-        {
-            'uid': 'pod-1',
-            'name': 'webapp-frontend',
-            'namespace': 'production',
-            'kind': 'Pod',
-            'labels': json.dumps({
-                'app.kubernetes.io/name': 'webapp',
-                'app.kubernetes.io/component': 'frontend',
-                'app.kubernetes.io/version': '1.2.0',
-                'environment': 'production',
-                'team': 'frontend-team',
-                'cost-center': 'engineering'
-            }),
-            'health_status': 'healthy',
-            'creation_timestamp': '2024-01-15T10:30:00Z'
-        },
-        {
-            'uid': 'pod-2',
-            'name': 'webapp-backend',
-            'namespace': 'production',
-            'kind': 'Pod',
-            'labels': json.dumps({
-                'app.kubernetes.io/name': 'webapp',
-                'app.kubernetes.io/component': 'backend',
-                'app.kubernetes.io/version': '1.2.0',
-                'environment': 'production',
-                'team': 'backend-team',
-                'cost-center': 'engineering'
-            }),
-            'health_status': 'healthy',
-            'creation_timestamp': '2024-01-15T10:31:00Z'
-        },
-        {
-            'uid': 'pod-3',
-            'name': 'database',
-            'namespace': 'production',
-            'kind': 'Pod',
-            'labels': json.dumps({
-                'app.kubernetes.io/name': 'database',
-                'app.kubernetes.io/component': 'storage',
-                'environment': 'production',
-                'team': 'data-team',
-                'cost-center': 'infrastructure'
-            }),
-            'health_status': 'warning',
-            'creation_timestamp': '2024-01-10T09:00:00Z'
-        },
-        {
-            'uid': 'pod-4',
-            'name': 'test-app',
-            'namespace': 'staging',
-            'kind': 'Pod',
-            'labels': json.dumps({
-                'app.kubernetes.io/name': 'webapp',
-                'app.kubernetes.io/component': 'frontend',
-                'app.kubernetes.io/version': '1.3.0-beta',
-                'environment': 'staging',
-                'team': 'frontend-team',
-                'cost-center': 'engineering'
-            }),
-            'health_status': 'healthy',
-            'creation_timestamp': '2024-01-20T14:00:00Z'
-        },
-        {
-            'uid': 'pod-5',
-            'name': 'legacy-service',
-            'namespace': 'default',
-            'kind': 'Pod',
-            'labels': json.dumps({}),  # No labels
-            'health_status': 'error',
-            'creation_timestamp': '2023-12-01T08:00:00Z'
-        },
-        {
-            'uid': 'svc-1',
-            'name': 'webapp-service',
-            'namespace': 'production',
-            'kind': 'Service',
-            'labels': json.dumps({
-                'app.kubernetes.io/name': 'webapp',
-                'environment': 'production',
-                'team': 'frontend-team'
-            }),
-            'health_status': 'healthy',
-            'creation_timestamp': '2024-01-15T10:00:00Z'
-        }
-    ]
-    
-    for resource in test_resources:
-        cursor.execute('''
-            INSERT INTO resources (uid, name, namespace, kind, labels, health_status, creation_timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            resource['uid'],
-            resource['name'],
-            resource['namespace'],
-            resource['kind'],
-            resource['labels'],
-            resource['health_status'],
-            resource['creation_timestamp']
+    # Insert the rows and the analysis summary in a single transaction
+    with conn:
+        cursor.executemany(INSERT_RESOURCE_SQL, (
+            (
+                resource['uid'],
+                resource['name'],
+                resource['namespace'],
+                resource['kind'],
+                resource['labels'],
+                resource['health_status'],
+                resource['creation_timestamp']
+            )
+            for resource in TEST_RESOURCES
         ))
+        
+        # Insert analysis summary
+        cursor.execute('''
+            INSERT INTO analysis_summary (analysis_timestamp)
+            VALUES (?)
+        ''', (datetime.now(timezone.utc).isoformat(),))
+
+
+def create_test_database():
+    """Create a temporary SQLite database with test data."""
+    return create_fixture_database(populate_label_database)
+
+
+@pytest.fixture(scope="module")
+def db_client():
+    """A client over one label test database shared by the viewpoint tests."""
+    db_path = create_test_database()
+    client = DatabaseClient(db_path)
+    yield client
+    client.close()
+    Path(db_path).unlink(missing_ok=True)
+
+
+def test_label_analysis(db_client):
+    """Test label coverage and common label detection."""
+    label_analysis = db_client.get_label_analysis()
+    logger.debug(
+        "Label coverage %.1f%%, quality score %.1f, common labels %s",
+        label_analysis.label_coverage_percentage,
+        label_analysis.label_quality_score,
+        list(label_analysis.common_labels),
+    )
     
-    # Insert analysis summary
-    cursor.execute('''
-        INSERT INTO analysis_summary (analysis_timestamp)
-        VALUES (?)
-    ''', (datetime.now(timezone.utc).isoformat(),))
+    assert label_analysis.total_labeled_resources == 5
+    assert label_analysis.total_unlabeled_resources == 1
+    assert label_analysis.label_coverage_percentage == pytest.approx(500 / 6)
+    assert {'app.kubernetes.io/name', 'environment', 'team', 'cost-center'} <= set(label_analysis.common_labels)
+    assert 0 <= label_analysis.label_quality_score <= 100
+
+
+def test_application_viewpoint(db_client):
+    """Test applications are grouped by their app.kubernetes.io/name label."""
+    app_viewpoint = db_client.get_application_viewpoint()
+    applications = {app['name']: app for app in app_viewpoint.applications}
+    logger.debug("Applications: %s", applications)
     
-    conn.commit()
-    conn.close()
+    assert app_viewpoint.total_applications == 2
+    assert set(applications) == {'webapp', 'database'}
+    assert applications['webapp']['resource_count'] == 4
+    assert applications['webapp']['health'] == 'healthy'
+    assert applications['database']['resource_count'] == 1
+    assert applications['database']['health'] == 'warning'
+
+
+def test_environment_viewpoint(db_client):
+    """Test resources are grouped by their environment label."""
+    env_viewpoint = db_client.get_environment_viewpoint()
+    logger.debug("Resources by environment: %s", env_viewpoint.resources_by_environment)
     
-    return db_path
+    assert set(env_viewpoint.environments) == {'production', 'staging'}
+    assert env_viewpoint.resources_by_environment['production'] == 4
+    assert env_viewpoint.resources_by_environment['staging'] == 1
 
 
-def test_new_viewpoints():
-    """Test the new label-based viewpoints."""
-    print("🧪 Testing new label-based viewpoints for k8s-reporter")
-    print("=" * 60)
+def test_team_ownership_viewpoint(db_client):
+    """Test resources are grouped by their team label."""
+    team_viewpoint = db_client.get_team_ownership_viewpoint()
+    logger.debug(
+        "Resources by team: %s, ownership coverage %.1f%%",
+        team_viewpoint.team_resources,
+        team_viewpoint.ownership_coverage,
+    )
     
-    # Create test database
-    db_path = create_test_database()
-    print(f"✅ Created test database: {db_path}")
+    assert set(team_viewpoint.teams) == {'frontend-team', 'backend-team', 'data-team'}
+    assert team_viewpoint.team_resources['frontend-team'] == 3
+    assert team_viewpoint.team_resources['backend-team'] == 1
+    assert team_viewpoint.team_resources['data-team'] == 1
+    assert team_viewpoint.ownership_coverage == pytest.approx(500 / 6)
+
+
+def test_cost_optimization_viewpoint(db_client):
+    """Test resources are grouped by their cost-center label."""
+    cost_viewpoint = db_client.get_cost_optimization_viewpoint()
+    logger.debug(
+        "Resources by cost center: %s, billing coverage %.1f%%",
+        cost_viewpoint.cost_center_resources,
+        cost_viewpoint.billing_coverage,
+    )
     
-    try:
-        # Initialize database client
-        db_client = DatabaseClient(db_path)
-        print("✅ Database client initialized")
-        
-        # Test 1: Label Analysis
-        print("\n📊 Testing Label Analysis...")
-        label_analysis = db_client.get_label_analysis()
-        print(f"   Total labeled resources: {label_analysis.total_labeled_resources}")
-        print(f"   Total unlabeled resources: {label_analysis.total_unlabeled_resources}")
-        print(f"   Label coverage: {label_analysis.label_coverage_percentage:.1f}%")
-        print(f"   Common labels: {list(label_analysis.common_labels.keys())}")
-        print(f"   Label quality score: {label_analysis.label_quality_score:.1f}")
-        
-        # Test 2: Application Viewpoint
-        print("\n🚀 Testing Application Viewpoint...")
-        app_viewpoint = db_client.get_application_viewpoint()
-        print(f"   Total applications: {app_viewpoint.total_applications}")
-        print(f"   Applications found: {[app['name'] for app in app_viewpoint.applications]}")
-        for app in app_viewpoint.applications:
-            print(f"     - {app['name']}: {app['resource_count']} resources, health: {app['health']}")
-        print(f"   Orphaned resources: {len(app_viewpoint.orphaned_resources)}")
-        
-        # Test 3: Environment Viewpoint
-        print("\n🌍 Testing Environment Viewpoint...")
-        env_viewpoint = db_client.get_environment_viewpoint()
-        print(f"   Environments: {env_viewpoint.environments}")
-        for env in env_viewpoint.environments:
-            resource_count = env_viewpoint.resources_by_environment.get(env, 0)
-            print(f"     - {env}: {resource_count} resources")
-        print(f"   Untagged resources: {len(env_viewpoint.untagged_resources)}")
-        
-        # Test 4: Team Ownership Viewpoint
-        print("\n👥 Testing Team Ownership Viewpoint...")
-        team_viewpoint = db_client.get_team_ownership_viewpoint()
-        print(f"   Teams: {team_viewpoint.teams}")
-        for team in team_viewpoint.teams:
-            resource_count = team_viewpoint.team_resources.get(team, 0)
-            print(f"     - {team}: {resource_count} resources")
-        print(f"   Ownership coverage: {team_viewpoint.ownership_coverage:.1f}%")
-        print(f"   Unowned resources: {len(team_viewpoint.unowned_resources)}")
-        
-        # Test 5: Cost Optimization Viewpoint
-        print("\n💰 Testing Cost Optimization Viewpoint...")
-        cost_viewpoint = db_client.get_cost_optimization_viewpoint()
-        print(f"   Cost centers: {cost_viewpoint.cost_centers}")
-        for cost_center in cost_viewpoint.cost_centers:
-            resource_count = cost_viewpoint.cost_center_resources.get(cost_center, 0)
-            print(f"     - {cost_center}: {resource_count} resources")
-        print(f"   Billing coverage: {cost_viewpoint.billing_coverage:.1f}%")
-        print(f"   Untagged for billing: {len(cost_viewpoint.untagged_for_billing)}")
-        print(f"   Optimization opportunities: {len(cost_viewpoint.cost_optimization_opportunities)}")
-        
-        # Test 6: Check new views are in ANALYSIS_VIEWS
-        print("\n🎯 Testing Analysis Views Registration...")
-        new_views = ['labels', 'applications', 'environments', 'team_ownership', 'cost_optimization']
-        for view_name in new_views:
-            if view_name in ANALYSIS_VIEWS:
-                view = ANALYSIS_VIEWS[view_name]
-                print(f"   ✅ {view.get_title()} - {view.get_description()}")
-            else:
-                print(f"   ❌ {view_name} not found in ANALYSIS_VIEWS")
-        
-        print("\n🎉 All tests completed successfully!")
-        print("The new label-based viewpoints are working correctly.")
-        
-    except Exception as e:
-        print(f"❌ Error during testing: {e}")
-        import traceback
-        traceback.print_exc()
-    finally:
-        # Clean up
-        if os.path.exists(db_path):
-            os.remove(db_path)
-            print(f"🧹 Cleaned up test database: {db_path}")
+    assert set(cost_viewpoint.cost_centers) == {'engineering', 'infrastructure'}
+    assert cost_viewpoint.cost_center_resources['engineering'] == 3
+    assert cost_viewpoint.cost_center_resources['infrastructure'] == 1
+    assert cost_viewpoint.billing_coverage == pytest.approx(400 / 6)
+    assert len(cost_viewpoint.untagged_for_billing) == 1
 
 
-if __name__ == "__main__":
-    test_new_viewpoints()
+@pytest.mark.parametrize(
+    "view_name",
+    ['labels', 'applications', 'environments', 'team_ownership', 'cost_optimization'],
+)
+def test_analysis_views_registration(view_name):
+    """Test the label-based views are registered in ANALYSIS_VIEWS."""
+    assert view_name in ANALYSIS_VIEWS
+    view = ANALYSIS_VIEWS[view_name]
+    assert view.get_title()
+    assert view.get_description()